@@ -8,7 +8,7 @@ __actors__ = ["Axis"]
 import asyncio
 import logging
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 from bapsf_motion.actors.base import EventActor
 from bapsf_motion.actors.motor_ import Motor
@@ -72,6 +72,8 @@ class Axis(EventActor):
     ...     name="WALL-E",
     ...     auto_run=True,
     ... )
+    >>> # now stop the actor, which stops the event loop
+    >>> ax.terminate()
 
     """
     # TODO: better handle naming of the Axis and child Motor
@@ -304,6 +306,24 @@ class Axis(EventActor):
             (u.rev / u.s / u.s, self.units / u.s / u.s),
         ]
 
+    def _motion_rates(self) -> Optional[Tuple[float, float, float]]:
+        """
+        The ``(speed, accel, decel)`` of the axis in :attr:`units` per
+        second and per second squared.  `None` if any of them is
+        unknown.
+        """
+        units_per_rev = self.units_per_rev.value
+        rates = []
+        for key in ("speed", "accel", "decel"):
+            value = self.motor.motor[key]
+            if value is None or isinstance(value, self.motor.ack_flags):
+                return None
+            rates.append(
+                units_per_rev * float(value.value if hasattr(value, "unit") else value)
+            )
+
+        return rates[0], rates[1], rates[2]
+
     def send_command(self, command, *args):
         """
         Send ``command`` to the motor, and receive its response.  If the
@@ -319,11 +339,26 @@ class Axis(EventActor):
             Any arguments to the ``command`` that will be sent with the
             motor command.
         """
-        cmd_entry = self.motor._commands[command]
-        motor_unit = cmd_entry["units"]  # type: u.Unit
+        args = self._to_motor_args(command, args)
+        rtn = self.motor.send_command(command, *args)
+        return self._from_motor_return(rtn)
+
+    async def asend_command(self, command, *args):
+        """
+        An awaitable version of :meth:`send_command`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        args = self._to_motor_args(command, args)
+        rtn = await self.motor.asend_command(command, *args)
+        return self._from_motor_return(rtn)
+
+    def _to_motor_args(self, command: str, args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """
+        Convert the argument of ``command`` from axis units to the
+        motor units of ``command``.
+        """
+        motor_unit = self.motor._command_specs[command].units  # type: u.Unit
 
-        # TODO: put this into a separate convert() method that can handle both
-        #       the send and recv unit conversion
         if motor_unit is not None and len(args):
             axis_unit = None
             for motor_u, axis_u in self.conversion_pairs:
@@ -344,9 +379,10 @@ class Axis(EventActor):
                 if motor_unit is u.steps:
                     args[0] = int(args[0])
 
-        rtn = self.motor.send_command(command, *args)
+        return tuple(args)
 
-        # TODO: see detailing todo above
+    def _from_motor_return(self, rtn: Any) -> Any:
+        """Convert the motor response ``rtn`` to axis units."""
         if hasattr(rtn, "unit"):
             axis_unit = None
             for motor_u, axis_u in self.conversion_pairs:
@@ -365,6 +401,27 @@ class Axis(EventActor):
         """
         return self.send_command("move_to", *args)
 
+    async def amove_to(self, *args):
+        """
+        Quick access command for ``await asend_command("move_to", *args)``.
+        """
+        return await self.asend_command("move_to", *args)
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the axis stops moving.  See
+        :meth:`Motor.wait_for_stop() <bapsf_motion.actors.motor_.Motor.wait_for_stop>`
+        for details.
+        """
+        return self.motor.wait_for_stop(timeout)
+
+    async def await_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        An awaitable version of :meth:`wait_for_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await self.motor.await_for_stop(timeout)
+
     def stop(self, soft=False):
         """
         Quick access command for ``send_command("stop")``.
@@ -372,3 +429,10 @@ class Axis(EventActor):
         # not sending STOP command through send_command() since using
         # motor.stop() should result in faster execution
         return self.motor.stop(soft=soft)
+
+    async def astop(self, soft=False):
+        """
+        An awaitable version of :meth:`stop`, which must be awaited from
+        within the actor's `event loop`_.
+        """
+        return await self.motor.astop(soft=soft)
@@ -13,8 +13,9 @@ import time
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Dict, List, Optional, Union
 
+from bapsf_motion.actors.submission import submission_queue
 from bapsf_motion.utils import loop_safe_stop
 
 
@@ -118,6 +119,18 @@ class EventActor(BaseActor, ABC):
         If `True`, then the `event loop`_ will be placed in a separate
         thread and started.  This is all done via the :meth:`run`
         method. (DEFAULT: `False`)
+
+    Notes
+    -----
+    The synchronous methods of an actor (e.g.
+    :meth:`Motor.send_command() <bapsf_motion.actors.motor_.Motor.send_command>`)
+    block until the actor's `event loop`_ has finished the request,
+    so they can NOT be called from the thread the event loop is
+    running in, e.g. from a callback or a signal handler executed by
+    the loop.  Such calls raise a `RuntimeError`, and the awaitable
+    versions (e.g.
+    :meth:`Motor.asend_command() <bapsf_motion.actors.motor_.Motor.asend_command>`)
+    must be awaited instead.
     """
 
     def __init__(
@@ -140,6 +153,7 @@ class EventActor(BaseActor, ABC):
 
         self._thread = None
         self._loop = self.setup_event_loop(loop)
+        self._submissions = submission_queue(self._loop)
         self._tasks = None
 
         self._configure_before_run()
@@ -198,30 +212,27 @@ class EventActor(BaseActor, ABC):
             # no loop has been created or loop is not running
             return None
 
+        if self._submissions.in_loop_thread():
+            # called from inside the event loop
+            return threading.get_ident()
+
+        thread_id = self._submissions.thread_id
+        if thread_id is not None:
+            # cached when the loop last processed a submission
+            return thread_id
+
         if (
             hasattr(self.parent, "thread")
             and isinstance(self.parent.thread, threading.Thread)
         ):
             return self.parent.thread.ident
 
-        # we do not know if self._thread_id call came from insided the
-        # event loop or outside...attempt getting the thread id via an
-        # asyncio future...this will time out if self._thread_id was
-        # called from inside the event loop
+        # the self._thread_id call came from outside the event loop,
+        # so get the thread id via an asyncio future
         try:
-            future = asyncio.run_coroutine_threadsafe(
-                self._thread_id_async(),
-                self.loop
-            )
-            thread_id = future.result(1)
-            return thread_id
+            return self._submissions.submit(self._thread_id_async()).result(1)
         except (concurrent.futures.TimeoutError, TimeoutError):
-            pass
-
-        # the future (^) timed-out...this likely happened since the
-        # _thread_id() call came from inside another coroutine...lets
-        # just get the id directly
-        return threading.current_thread().ident
+            return None
 
     @staticmethod
     async def _get_loop_thread():
@@ -239,6 +250,60 @@ class EventActor(BaseActor, ABC):
         """
         return threading.current_thread().ident
 
+    def _run_coroutine(
+        self,
+        coro: Awaitable,
+        thread_id: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Run the coroutine_ ``coro`` to completion in the actor's
+        `event loop`_ and return its result.  If the event loop is not
+        running, then the loop is run until ``coro`` completes.
+        Otherwise, ``coro`` is submitted to the running loop through
+        the loop's `~bapsf_motion.actors.submission.SubmissionQueue`.
+
+        Parameters
+        ----------
+        coro: :term:`awaitable`
+            The coroutine_ to be executed.
+
+        thread_id: int, optional
+            ID of the thread the calling functionality is operating in.
+
+        timeout: float, optional
+            Time (in seconds) to wait for the result when the event
+            loop is running in another thread.  If `None`, then wait
+            indefinitely.  (DEFAULT: `None`)
+
+        Raises
+        ------
+        RuntimeError
+            If called from the thread the `event loop`_ is running in,
+            since blocking that thread would deadlock the loop.
+        """
+        if not self.loop.is_running():
+            # event loop not running, just run the loop until the
+            # coroutine is done
+            return self.loop.run_until_complete(coro)
+
+        elif (
+            self._submissions.in_loop_thread()
+            or (thread_id is not None and threading.get_ident() == thread_id)
+        ):
+            # we are in the same thread as the running event loop, so we
+            # can not block and wait on a result the loop has not
+            # computed yet...coroutines must await the async methods
+            coro.close()
+            raise RuntimeError(
+                "Can not synchronously wait on the actor from within the "
+                "running event loop, await the coroutine instead."
+            )
+
+        # the event loop is running and the call is being made from
+        # outside the event loop thread
+        return self._submissions.submit(coro).result(timeout)
+
     @abstractmethod
     def _configure_before_run(self):
         # A set of functionality for the subclass to run before the
@@ -300,11 +365,12 @@ class EventActor(BaseActor, ABC):
             return None
 
         if self.loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(
-                self._get_loop_thread(),
-                self.loop,
-            )
-            self._thread = future.result(5)
+            if self._submissions.in_loop_thread():
+                self._thread = threading.current_thread()
+            else:
+                future = self._submissions.submit(self._get_loop_thread())
+                self._thread = future.result(5)
+            self._submissions.thread_id = self._thread.ident
             return None
 
         if not auto_run:
@@ -312,6 +378,7 @@ class EventActor(BaseActor, ABC):
 
         self._thread = threading.Thread(target=self._loop.run_forever)
         self._thread.start()
+        self._submissions.thread_id = self._thread.ident
 
     def terminate(self, delay_loop_stop=False):
         r"""
@@ -0,0 +1,588 @@
+"""
+Module for benchmarking the actor layer of `bapsf_motion` against
+simulated motors (see `bapsf_motion.actors.simulator`), so no lab
+hardware is needed.
+
+The following benchmarks are available, and each is run for every
+requested number of motors:
+
+``send_command``
+    Latency percentiles of `~bapsf_motion.actors.motor_.Motor.send_command`
+    and the number of commands per second per motor, while all motors
+    are being commanded concurrently.
+
+``heartbeat``
+    CPU time the `event loop`_ thread spends on the idle motor
+    heartbeats.
+
+``drive_move_to``
+    Skew of `~bapsf_motion.actors.drive_.Drive.move_to`, i.e. the time
+    between the first and last axis receiving their move command.
+
+``move_ml``
+    Number of motion list points per hour
+    `~bapsf_motion.actors.motion_group_.MotionGroup.move_ml` achieves.
+
+The results are emitted as JSON, so they can be compared between
+versions.  The benchmarks can be run from the command line, e.g.
+
+.. code-block:: bash
+
+    python -m bapsf_motion.actors.benchmark --motors 1 10 50 -o results.json
+
+"""
+__all__ = [
+    "bench_drive_move_to",
+    "bench_heartbeat",
+    "bench_move_ml",
+    "bench_send_command",
+    "run_benchmarks",
+]
+
+import asyncio
+import concurrent.futures
+import ipaddress
+import json
+import logging
+import numpy as np
+import platform
+import threading
+import time
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from bapsf_motion.actors.drive_ import Drive
+from bapsf_motion.actors.motion_group_ import MotionGroup
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.simulator import MotorSimulator, SimulatedMotor
+
+#: First IPv4 address the simulated motors are served on.  Every motor
+#: gets its own loopback address, so the actors can use the default
+#: motor ports.
+_BASE_HOST = ipaddress.IPv4Address("127.2.0.1")
+
+#: Benchmarks available in :func:`run_benchmarks`
+_BENCHMARKS = {}  # type: Dict[str, Callable[..., Dict[str, Any]]]
+
+
+class _TimedMotor(SimulatedMotor):
+    """
+    A `SimulatedMotor` that records the time (`time.perf_counter`)
+    every move command is received.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.move_times = []  # type: List[float]
+
+    def handle(self, cmd: str) -> Optional[str]:
+        if cmd in ("FP", "FL", "CJ"):
+            self.move_times.append(time.perf_counter())
+        return super().handle(cmd)
+
+
+def _register(name: str):
+    def decorator(func):
+        _BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def _percentiles(values: List[float], scale: float = 1.0) -> Dict[str, float]:
+    """Summary statistics of ``values``, multiplied by ``scale``."""
+    if len(values) == 0:
+        return {"count": 0}
+
+    values = np.asarray(values) * scale
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {
+        "count": int(values.size),
+        "mean": float(np.mean(values)),
+        "min": float(np.min(values)),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p99": float(p99),
+        "max": float(np.max(values)),
+    }
+
+
+def _hosts(nmotors: int) -> List[str]:
+    return [str(_BASE_HOST + ii) for ii in range(nmotors)]
+
+
+@contextmanager
+def _simulated_motors(
+    nmotors: int, *, latency: float = 0.0, jitter: float = 0.0, **kwargs
+) -> Iterator[Tuple[MotorSimulator, List[str]]]:
+    """
+    Context manager that serves ``nmotors`` simulated motors in a
+    background thread and yields the simulator and the list of motor
+    IPv4 addresses.
+    """
+    sim = MotorSimulator(latency=latency, jitter=jitter, seed=0)
+    hosts = _hosts(nmotors)
+    for host in hosts:
+        sim.add_motor(
+            host=host, tcp_port=Motor._default_ports["tcp"], motor=_TimedMotor(**kwargs)
+        )
+    sim.start()
+    try:
+        yield sim, hosts
+    finally:
+        sim.stop()
+
+
+@contextmanager
+def _event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """
+    Context manager that runs a new `event loop`_ in a background
+    thread, which is shared by all the actors of a benchmark.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield loop
+    finally:
+        asyncio.run_coroutine_threadsafe(_cancel_tasks(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+async def _cancel_tasks():
+    """Cancel all other tasks in the running loop and wait for them."""
+    tasks = [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _thread_time() -> float:
+    return time.thread_time()
+
+
+def _loop_cpu_time(loop: asyncio.AbstractEventLoop) -> float:
+    """CPU time (in seconds) consumed by the thread running ``loop``."""
+    return asyncio.run_coroutine_threadsafe(_thread_time(), loop).result(5)
+
+
+def _spawn_motors(hosts: List[str], loop: asyncio.AbstractEventLoop) -> List[Motor]:
+    motors = []
+    for ii, host in enumerate(hosts):
+        motors.append(
+            Motor(ip=host, name=f"bm{ii}", loop=loop, auto_run=True)
+        )
+    return motors
+
+
+@contextmanager
+def _terminating(actors: List[Any]) -> Iterator[List[Any]]:
+    """
+    Context manager that yields ``actors`` and terminates every actor
+    in it on exit, without stopping their `event loop`_.
+    """
+    try:
+        yield actors
+    finally:
+        for actor in actors:
+            actor.terminate(delay_loop_stop=True)
+
+
+@_register("send_command")
+def bench_send_command(
+    nmotors: int,
+    *,
+    duration: float = 5.0,
+    command: str = "get_position",
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark the latency of
+    `~bapsf_motion.actors.motor_.Motor.send_command` while ``nmotors``
+    motors are concurrently sent ``command`` for ``duration`` seconds.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Latency percentiles (in ms) and the command rates (in
+        commands/s).
+    """
+    with _simulated_motors(nmotors, latency=latency, jitter=jitter) as (_, hosts):
+        with _event_loop() as loop, _terminating([]) as motors:
+            motors.extend(_spawn_motors(hosts, loop))
+
+            def worker(motor: Motor) -> Tuple[List[float], int]:
+                latencies = []
+                failures = 0
+                tf = time.perf_counter() + duration
+                while time.perf_counter() < tf:
+                    t0 = time.perf_counter()
+                    rtn = motor.send_command(command)
+                    latencies.append(time.perf_counter() - t0)
+                    if isinstance(rtn, motor.ack_flags):
+                        failures += 1
+                return latencies, failures
+
+            t0 = time.perf_counter()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=nmotors) as pool:
+                results = list(pool.map(worker, motors))
+            elapsed = time.perf_counter() - t0
+
+    latencies = [lat for result in results for lat in result[0]]
+    return {
+        "command": command,
+        "elapsed": elapsed,
+        "failures": sum(result[1] for result in results),
+        "latency_ms": _percentiles(latencies, scale=1e3),
+        "commands_per_s": len(latencies) / elapsed,
+        "commands_per_s_per_motor": len(latencies) / elapsed / nmotors,
+    }
+
+
+@_register("heartbeat")
+def bench_heartbeat(
+    nmotors: int,
+    *,
+    duration: float = 5.0,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark the CPU cost of the heartbeat of ``nmotors`` idle motors
+    over ``duration`` seconds.  Only the CPU time of the thread running
+    the actors' `event loop`_ is counted, the simulator runs in a
+    separate thread.
+
+    Returns
+    -------
+    Dict[str, Any]
+        CPU time (in seconds) and CPU usage (as a fraction of the
+        wall-clock time).
+    """
+    with _simulated_motors(nmotors, latency=latency, jitter=jitter) as (_, hosts):
+        with _event_loop() as loop, _terminating([]) as motors:
+            motors.extend(_spawn_motors(hosts, loop))
+
+            cpu0 = _loop_cpu_time(loop)
+            t0 = time.perf_counter()
+            time.sleep(duration)
+            cpu = _loop_cpu_time(loop) - cpu0
+            elapsed = time.perf_counter() - t0
+
+    return {
+        "elapsed": elapsed,
+        "cpu_s": cpu,
+        "cpu_fraction": cpu / elapsed,
+        "cpu_ms_per_motor_per_s": 1e3 * cpu / elapsed / nmotors,
+    }
+
+
+@_register("drive_move_to")
+def bench_drive_move_to(
+    nmotors: int,
+    *,
+    repeats: int = 20,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark the dispatch of `~bapsf_motion.actors.drive_.Drive.move_to`
+    for a drive of ``nmotors`` axes.  The skew is the time between the
+    first and last axis receiving the move command (``FP``) of the same
+    `~bapsf_motion.actors.drive_.Drive.move_to` call.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Percentiles (in ms) of the skew and the time the
+        `~bapsf_motion.actors.drive_.Drive.move_to` call took.
+    """
+    with _simulated_motors(
+        nmotors, latency=latency, jitter=jitter, time_scale=10.0
+    ) as (sim, hosts):
+        with _event_loop() as loop, _terminating([]) as actors:
+            drive = Drive(
+                axes=[
+                    {"ip": host, "units": "cm", "units_per_rev": 0.254}
+                    for host in hosts
+                ],
+                name="bm_drive",
+                loop=loop,
+                auto_run=True,
+            )
+            actors.append(drive)
+
+            skews = []
+            dispatch = []
+            for ii in range(repeats):
+                for motor in sim.motors:
+                    motor.move_times.clear()
+
+                pos = [0.5 * (ii % 2 == 0)] * nmotors
+                t0 = time.perf_counter()
+                drive.move_to(pos)
+                dispatch.append(time.perf_counter() - t0)
+
+                times = [
+                    motor.move_times[0]
+                    for motor in sim.motors
+                    if len(motor.move_times)
+                ]
+                if len(times) == nmotors:
+                    skews.append(max(times) - min(times))
+
+                if not drive.wait_for_stop(timeout=30):
+                    drive.stop()
+                    raise RuntimeError("Drive did not stop moving within 30 seconds.")
+
+    return {
+        "repeats": repeats,
+        "skew_ms": _percentiles(skews, scale=1e3),
+        "dispatch_ms": _percentiles(dispatch, scale=1e3),
+    }
+
+
+def _motion_group_config(name: str, hosts: List[str]) -> Dict[str, Any]:
+    labels = ["x", "y"]
+    return {
+        "name": name,
+        "drive": {
+            "name": f"{name}_drive",
+            "axes": {
+                ii: {"name": label, "ip": host, "units": "cm", "units_per_rev": 0.254}
+                for ii, (label, host) in enumerate(zip(labels, hosts))
+            },
+        },
+        "motion_builder": {
+            "space": {
+                ii: {"label": label, "range": [-1.0, 1.0], "num": 21}
+                for ii, label in enumerate(labels)
+            },
+            "layer": {
+                0: {
+                    "type": "grid",
+                    "limits": [[-0.5, 0.5], [-0.5, 0.5]],
+                    "steps": [5, 5],
+                },
+            },
+        },
+        "transform": {"type": "identity"},
+    }
+
+
+@_register("move_ml")
+def bench_move_ml(
+    nmotors: int,
+    *,
+    duration: float = 10.0,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Benchmark `~bapsf_motion.actors.motion_group_.MotionGroup.move_ml`.
+    The ``nmotors`` motors are paired into motion groups of 2D drives,
+    and every group steps through its motion list concurrently for
+    ``duration`` seconds.  A point is complete once the drive has
+    stopped moving.  Since every group needs two motors, one group is
+    used when ``nmotors`` is ``1`` and an odd motor out is left idle.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The number of motion list points per hour, for all groups and
+        per group.
+    """
+    ngroups = max(nmotors // 2, 1)
+    with _simulated_motors(2 * ngroups, latency=latency, jitter=jitter) as (_, hosts):
+        with _event_loop() as loop, _terminating([]) as mgs:
+            for ii in range(ngroups):
+                config = _motion_group_config(f"bm_mg{ii}", hosts[2 * ii:2 * ii + 2])
+                mgs.append(MotionGroup(config=config, loop=loop, auto_run=True))
+
+            def worker(mg: MotionGroup) -> int:
+                npoints = mg.mb.motion_list.shape[0]
+                points = 0
+                tf = time.perf_counter() + duration
+                while time.perf_counter() < tf:
+                    mg.move_ml(points % npoints)
+                    if not mg.wait_for_stop(timeout=30):
+                        mg.stop()
+                        raise RuntimeError(
+                            "Motion group did not stop moving within 30 seconds."
+                        )
+                    points += 1
+                return points
+
+            t0 = time.perf_counter()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(mgs)) as pool:
+                points = list(pool.map(worker, mgs))
+            elapsed = time.perf_counter() - t0
+
+    total = sum(points)
+    return {
+        "motion_groups": ngroups,
+        "motors_used": 2 * ngroups,
+        "elapsed": elapsed,
+        "points": total,
+        "points_per_hour": 3600 * total / elapsed,
+        "points_per_hour_per_group": 3600 * total / elapsed / len(mgs),
+    }
+
+
+def run_benchmarks(
+    motors: Tuple[int, ...] = (1, 10, 50),
+    benchmarks: Optional[List[str]] = None,
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    duration: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run the actor benchmarks against simulated motors.
+
+    Parameters
+    ----------
+    motors: Tuple[int, ...]
+        Numbers of motors to run each benchmark with.
+        (DEFAULT: ``(1, 10, 50)``)
+
+    benchmarks: List[str], optional
+        Names of the benchmarks to run.  If `None`, then all benchmarks
+        are run. (DEFAULT: `None`)
+
+    latency: `float`, optional
+        Network latency (in seconds) of the simulated motors.
+        (DEFAULT: ``0.0``)
+
+    jitter: `float`, optional
+        Max network jitter (in seconds) of the simulated motors.
+        (DEFAULT: ``0.0``)
+
+    duration: `float`, optional
+        Duration (in seconds) of each timed benchmark.  If `None`, then
+        each benchmark uses its own default. (DEFAULT: `None`)
+
+    Returns
+    -------
+    Dict[str, Any]
+        JSON serializable dictionary of the environment and results,
+        the results are keyed by benchmark name and then by the number
+        of motors.
+    """
+    from bapsf_motion import __version__
+
+    if benchmarks is None:
+        benchmarks = list(_BENCHMARKS)
+
+    unknown = set(benchmarks) - set(_BENCHMARKS)
+    if unknown:
+        raise ValueError(
+            f"Unknown benchmark(s) {sorted(unknown)}, expected a subset of "
+            f"{sorted(_BENCHMARKS)}."
+        )
+
+    results = {
+        "meta": {
+            "bapsf_motion": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "latency": latency,
+            "jitter": jitter,
+        },
+        "results": {},
+    }  # type: Dict[str, Any]
+
+    for name in benchmarks:
+        func = _BENCHMARKS[name]
+        kwargs = {"latency": latency, "jitter": jitter}
+        if duration is not None and name != "drive_move_to":
+            kwargs["duration"] = duration
+
+        results["results"][name] = {}
+        for nmotors in motors:
+            logging.getLogger("benchmark").info(
+                f"Running '{name}' with {nmotors} motor(s)."
+            )
+            try:
+                rtn = func(nmotors, **kwargs)
+            except Exception as err:  # noqa
+                logging.getLogger("benchmark").exception(
+                    f"Benchmark '{name}' failed with {nmotors} motor(s)."
+                )
+                rtn = {"error": f"{type(err).__name__}: {err}"}
+            results["results"][name][str(nmotors)] = rtn
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the bapsf_motion actors against simulated Applied "
+            "Motion motors and emit the results as JSON."
+        ),
+    )
+    parser.add_argument(
+        "-m",
+        "--motors",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50],
+        help="Numbers of motors to run each benchmark with.",
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        choices=sorted(_BENCHMARKS),
+        default=None,
+        help="Benchmarks to run (DEFAULT: all).",
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        default=None,
+        help="Duration (in seconds) of each timed benchmark.",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Network latency in seconds."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Max network jitter in seconds."
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="File to write the JSON results to."
+    )
+    parser.add_argument(
+        "--log-level", default="WARNING", help="Logging level (DEFAULT: WARNING)."
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+
+    _results = run_benchmarks(
+        motors=tuple(args.motors),
+        benchmarks=args.benchmarks,
+        latency=args.latency,
+        jitter=args.jitter,
+        duration=args.duration,
+    )
+
+    if args.output is None:
+        json.dump(_results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as f:
+            json.dump(_results, f, indent=2)
@@ -24,16 +24,12 @@ def run(drive: Drive, duration, pause, positions):
 
         drive.axes[0].move_to(pos)
 
-        to_moving = time.time()
-        while drive.is_moving:
-            time.sleep(0.1)
-
-            if time.time() - to_moving > 5:
-                drive.axes[0].stop()
-                raise RuntimeError(
-                    "Moving time to new position exceeded the max time "
-                    "allowed, {5:.2f} seconds."
-                )
+        if not drive.wait_for_stop(timeout=5):
+            drive.axes[0].stop()
+            raise RuntimeError(
+                "Moving time to new position exceeded the max time "
+                "allowed, {5:.2f} seconds."
+            )
 
         # print(
         #     f"--- Move complete: Elapsed time {time.time() - to:.2f} sec, "
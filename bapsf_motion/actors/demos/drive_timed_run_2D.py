@@ -9,18 +9,14 @@ def move_to(drive: Drive, position):
     for ii, pos in enumerate(position):
         drive.axes[ii].move_to(pos)
 
-    to_moving = time.time()
-    while drive.is_moving:
-        time.sleep(0.1)
-
-        if time.time() - to_moving > 5:
-            for ax in drive.axes:
-                ax.stop()
-
-            raise RuntimeError(
-                "Moving time to new position exceeded the max time "
-                "allowed, {5:.2f} seconds."
-            )
+    if not drive.wait_for_stop(timeout=5):
+        for ax in drive.axes:
+            ax.stop()
+
+        raise RuntimeError(
+            "Moving time to new position exceeded the max time "
+            "allowed, {5:.2f} seconds."
+        )
 
 
 def run(drive: Drive, duration, pause, positions):
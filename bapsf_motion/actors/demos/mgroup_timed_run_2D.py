@@ -8,17 +8,13 @@ from bapsf_motion.actors.motion_group_ import MotionGroup
 def move_to(mgroup: MotionGroup, index):
     mgroup.move_ml(index)
 
-    to_moving = time.time()
-    while mgroup.drive.is_moving:
-        time.sleep(0.1)
+    if not mgroup.wait_for_stop(timeout=20):
+        mgroup.stop()
 
-        if time.time() - to_moving > 20:
-            mgroup.stop()
-
-            raise RuntimeError(
-                "Moving time to new position exceeded the max time "
-                "allowed, {5:.2f} seconds."
-            )
+        raise RuntimeError(
+            "Moving time to new position exceeded the max time "
+            "allowed, {5:.2f} seconds."
+        )
 
 
 def run(mgroup: MotionGroup, duration, pause):
@@ -10,10 +10,25 @@ import asyncio
 import logging
 
 from collections import UserDict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from bapsf_motion.actors.base import EventActor
 from bapsf_motion.actors.axis_ import Axis
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.profile import sequence_durations, synchronized_move
+from bapsf_motion.actors.poller import StatusPoller
+from bapsf_motion.actors.startup import (
+    defer_motor_startup,
+    MotorStartupResult,
+    startup_motors,
+)
+from bapsf_motion.actors.qprogram import (
+    compile_q_program,
+    QProgram,
+    QProgramResult,
+    run_q_program_async,
+)
+from bapsf_motion.actors.stream import StreamResult, stream_moves_async
 
 
 class Drive(EventActor):
@@ -67,6 +82,8 @@ class Drive(EventActor):
     ...     name="WALL-E",
     ...     auto_run=True,
     ... )
+    >>> # now stop the actor, which stops the event loop
+    >>> dr.terminate()
 
     """
 
@@ -81,6 +98,14 @@ class Drive(EventActor):
         parent: Optional["EventActor"] = None,
     ):
         self._axes = None
+        self._status_poller = None  # type: Optional[StatusPoller]
+        self._startup_results = []  # type: List[MotorStartupResult]
+        self._dispatch_skew = None  # type: Optional[float]
+
+        # configured (speed, accel, decel) of motors running a
+        # coordinated move, restored once the move is finished
+        self._restore_rates = {}  # type: Dict[Motor, Tuple[float, float, float]]
+        self._restore_task = None  # type: Optional[asyncio.Task]
 
         super().__init__(
             name=name,
@@ -92,13 +117,21 @@ class Drive(EventActor):
 
         axes = self._validate_axes(axes)
 
+        # spawn all axes before connecting to their motors, so the
+        # motors can be connected to concurrently
         axis_objs = []
-        for axis in axes:
-            ax = self._spawn_axis(axis)
-            axis_objs.append(ax)
+        with defer_motor_startup(self) as deferred_by_ancestor:
+            for axis in axes:
+                ax = self._spawn_axis(axis)
+                axis_objs.append(ax)
 
         self._axes = tuple(axis_objs)
 
+        if not deferred_by_ancestor:
+            self._startup_results = startup_motors(
+                self, [ax.motor for ax in self._axes]
+            )
+
         if any(ax.terminated for ax in self._axes):
             self.terminate(delay_loop_stop=True)
         else:
@@ -278,7 +311,83 @@ class Drive(EventActor):
 
         return pos * self.axes[0].units
 
+    @property
+    def startup_results(self) -> List[MotorStartupResult]:
+        """
+        The outcome of concurrently starting up the axis motors when
+        the drive was spawned.  Empty if the motors were started up by
+        a parent actor (e.g. |MotionGroup|) or the drive was spawned
+        from within its running `event loop`_.
+        """
+        return self._startup_results
+
+    @property
+    def dispatch_skew(self) -> Optional[float]:
+        """
+        Time (in seconds) between the first and last axis motor
+        acknowledging the feed command that started the last move of
+        several axes (see :meth:`move_to`).  This is the start skew of
+        the axes for a move, as seen by the actor.  `None` if no move
+        of several axes was started yet, or an axis did not start
+        moving.
+        """
+        return self._dispatch_skew
+
+    @property
+    def status_poller(self) -> Optional[StatusPoller]:
+        """
+        The `~bapsf_motion.actors.poller.StatusPoller` polling the
+        status of all axes, `None` if every axis motor polls its own
+        status.
+        """
+        return self._status_poller
+
+    def start_status_poller(self, max_rate: Optional[float] = None) -> StatusPoller:
+        """
+        Poll the status of all axes from a single
+        `~bapsf_motion.actors.poller.StatusPoller`, instead of every
+        axis motor running its own heartbeat.  The motors are keyed by
+        their axis name in the poller snapshot.
+
+        Parameters
+        ----------
+        max_rate: `float`, optional
+            Max number of motor status polls per second across all
+            axes.  If `None`, then the rate is not limited.
+            (DEFAULT: `None`)
+
+        Returns
+        -------
+        StatusPoller
+            The running poller.
+        """
+        if self._status_poller is None:
+            self._status_poller = StatusPoller(
+                self.loop, max_rate=max_rate, logger=self.logger
+            )
+        else:
+            self._status_poller.max_rate = max_rate
+
+        for ax in self.axes:
+            self._status_poller.add_motor(ax.motor, key=ax.name)
+
+        self._status_poller.start()
+        return self._status_poller
+
+    def stop_status_poller(self):
+        """
+        Stop the :attr:`status_poller` and hand the status polling back
+        to the heartbeat of each axis motor.
+        """
+        if self._status_poller is None:
+            return
+
+        self._status_poller.stop()
+        self._status_poller = None
+
     def terminate(self, delay_loop_stop=False):
+        self.stop_status_poller()
+
         for ax in self._axes:
             ax.terminate(delay_loop_stop=True)
 
@@ -300,33 +409,65 @@ class Drive(EventActor):
             motor command.
         axis: int, optional
             Axis index the command is directed to.  If `None`, then the
-            command is sent to all axes. (DEFAULT: `NONE`)
+            command is sent to all axes concurrently. (DEFAULT: `NONE`)
         """
-        if axis is None:
-            send_to = self.axes
-        elif axis in range(len(self.axes)):
-            send_to = [self.axes[int(axis)]]
-        else:
-            raise ValueError(
-                f"Value for keyword 'axis' is unrecognized.  Got {axis} and"
-                f" expected None or in in range({len(self.axes)})."
-            )
+        send_to = self._command_axes(axis)
 
         if len(send_to) == 1:
             rtn = send_to[0].send_command(command, *args)
             return rtn
 
-        rtn = []
-        for ii, ax in enumerate(send_to):
-            ax_args = (args[ii],) if len(args) else args
-            _rtn = ax.send_command(command, *ax_args)
-            rtn.append(_rtn)
+        return self._run_coroutine(self.asend_command(command, *args, axis=axis))
 
-        return rtn
+    async def asend_command(self, command, *args, axis: Optional[int] = None):
+        """
+        An awaitable version of :meth:`send_command`, which must be
+        awaited from within the actor's `event loop`_.  The command is
+        sent to all axes concurrently.
+        """
+        send_to = self._command_axes(axis)
+
+        if len(send_to) == 1:
+            return await send_to[0].asend_command(command, *args)
+
+        return await self._dispatch_async(
+            [
+                ax.asend_command(command, *((args[ii],) if len(args) else args))
+                for ii, ax in enumerate(send_to)
+            ]
+        )
 
-    def move_to(self, pos, axis: Optional[int] = None):
+    async def _dispatch_async(self, coros: List[Awaitable]) -> List[Any]:
         """
-        Move the drive to a specified location.
+        Run the per-axis coroutines ``coros`` concurrently and return
+        their results in order.  Every coroutine is run to completion
+        even if another one raises, after which the first exception is
+        re-raised.
+        """
+        results = await asyncio.gather(*coros, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return list(results)
+
+    def _command_axes(self, axis: Optional[int]) -> List[Axis]:
+        """The axes a command directed to axis index ``axis`` is sent to."""
+        if axis is None:
+            return self.axes
+        elif axis in range(len(self.axes)):
+            return [self.axes[int(axis)]]
+
+        raise ValueError(
+            f"Value for keyword 'axis' is unrecognized.  Got {axis} and"
+            f" expected None or in in range({len(self.axes)})."
+        )
+
+    def move_to(self, pos, axis: Optional[int] = None, coordinated: bool = False):
+        """
+        Move the drive to a specified location.  All axes are moved
+        concurrently, see :attr:`dispatch_skew`.
 
         Parameters
         ----------
@@ -339,12 +480,173 @@ class Drive(EventActor):
             Axis index for the axis to be moved.  If `None`, then it
             is assumed all axes need to be moved and ``pos`` has the
             same length as :attr:`naxes`.  (DEFAULT: `None`)
+        coordinated: bool, optional
+            If `True`, then the speed, acceleration, and deceleration
+            of every axis are scaled so all axes arrive at the same
+            time and the probe moves along a straight line.  The axes
+            return to their configured rates once the move is
+            finished.  Axes are never driven faster than their
+            configured rates. (DEFAULT: `False`)
         """
         # TODO: should I sent these commands through
         #       Drive.send_command() instead?
         # TODO: Is there a way to handle axes with different units
         # TODO: Should pos be allows to be an astropy Quantity
+        return self._run_coroutine(
+            self.amove_to(pos, axis=axis, coordinated=coordinated)
+        )
+
+    async def amove_to(
+        self, pos, axis: Optional[int] = None, coordinated: bool = False
+    ):
+        """
+        An awaitable version of :meth:`move_to`, which must be awaited
+        from within the actor's `event loop`_.  All axes are moved
+        concurrently.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            await drive.amove_to([10, 5])
+            await drive.await_for_stop()
+        """
+        pos, move_ax = self._move_axes(pos, axis)
+        if coordinated and len(move_ax) > 1:
+            return await self._coordinated_move_async(pos, move_ax)
 
+        dispatched_at = self.loop.time()
+        rtn = await self._dispatch_async(
+            [ax.amove_to(p) for p, ax in zip(pos, move_ax)]
+        )
+        self._record_dispatch_skew([ax.motor for ax in move_ax], dispatched_at)
+        return rtn
+
+    def _record_dispatch_skew(self, motors: List[Motor], dispatched_at: float):
+        """
+        Record the spread of the times the feed commands of ``motors``,
+        dispatched at loop time ``dispatched_at``, were acknowledged as
+        :attr:`dispatch_skew`.
+        """
+        if len(motors) < 2:
+            return
+
+        started_at = [motor._move_started_at for motor in motors]
+        if any(t is None or t < dispatched_at for t in started_at):
+            # an axis did not start moving
+            self._dispatch_skew = None
+        else:
+            self._dispatch_skew = max(started_at) - min(started_at)
+
+    async def _coordinated_move_async(self, pos: List[Any], move_ax: List[Axis]):
+        """
+        Coroutine_ to move the axes ``move_ax`` to the positions
+        ``pos``, such that all axes arrive at the same time.  The
+        target and rates of every axis are staged first, so the feed
+        commands starting the move go out back-to-back.
+        """
+        motors = [ax.motor for ax in move_ax]
+        targets = [ax._to_motor_args("move_to", (p,))[0] for p, ax in zip(pos, move_ax)]
+
+        rates = []
+        for motor in motors:
+            rate = motor._motion_rates()
+            if rate is not None and motor in self._restore_rates:
+                # still running with the rates of a previous coordinated move
+                rate = (rate[0], *self._restore_rates[motor])
+            rates.append(rate)
+        if any(rate is None for rate in rates):
+            self.logger.warning(
+                "The position or motion parameters of an axis are unknown, "
+                "moving the axes independently instead of coordinated."
+            )
+            return await self._dispatch_async(
+                [ax.amove_to(p) for p, ax in zip(pos, move_ax)]
+            )
+
+        # the restore of a previous coordinated move is superseded
+        if self._restore_task is not None and not self._restore_task.done():
+            self._restore_task.cancel()
+
+        for motor, (_, speed, accel, decel) in zip(motors, rates):
+            self._restore_rates.setdefault(motor, (speed, accel, decel))
+
+        # distances in rev
+        distances = [
+            (target - motor.status["position"].value) / gearing
+            for target, motor, (gearing, *_) in zip(targets, motors, rates)
+        ]
+        move = synchronized_move(
+            distances,
+            [rate[1] for rate in rates],
+            [rate[2] for rate in rates],
+            [rate[3] for rate in rates],
+        )
+        self.logger.debug(
+            f"Coordinated move to {pos} takes {move.duration:.3f} s."
+        )
+
+        staged = await self._dispatch_async(
+            [
+                motor._stage_move_async(
+                    target,
+                    speed=max(speed, motor.motor["DEFAULTS"]["min_speed"]),
+                    accel=max(accel, motor.motor["DEFAULTS"]["min_accel"]),
+                    decel=max(decel, motor.motor["DEFAULTS"]["min_accel"]),
+                )
+                for motor, target, speed, accel, decel in zip(
+                    motors, targets, move.speeds, move.accels, move.decels
+                )
+            ]
+        )
+        if not all(staged):
+            self.logger.error(
+                "Unable to stage the coordinated move on all axes.  NO "
+                "MOVEMENT PERFORMED!!"
+            )
+            rtn = [None] * len(motors)
+        else:
+            dispatched_at = self.loop.time()
+            rtn = await self._dispatch_async(
+                [motor._feed_async(target) for motor, target in zip(motors, targets)]
+            )
+            self._record_dispatch_skew(motors, dispatched_at)
+
+        self._restore_task = self.loop.create_task(self._restore_rates_async())
+        self.tasks.append(self._restore_task)
+        self._restore_task.add_done_callback(self._remove_task)
+        return rtn
+
+    async def _restore_rates_async(self):
+        """
+        Coroutine_ to restore the configured speed, acceleration, and
+        deceleration of the axes once the coordinated move is finished.
+        """
+        motors = [motor for motor in self._restore_rates if not motor.terminated]
+        await asyncio.gather(*[motor._wait_for_stop_async() for motor in motors])
+
+        for motor in motors:
+            if motor.terminated or motor.is_moving:
+                continue
+
+            speed, accel, decel = self._restore_rates.pop(motor)
+            await motor._send_commands_async(
+                ("speed", speed), ("acceleration", accel), ("deceleration", decel)
+            )
+
+    def _remove_task(self, task: asyncio.Task):
+        """Remove the finished ``task`` from :attr:`tasks`."""
+        try:
+            self.tasks.remove(task)
+        except ValueError:
+            pass
+
+    def _move_axes(self, pos, axis: Optional[int]) -> Tuple[List[Any], List[Axis]]:
+        """
+        Validate the :meth:`move_to` arguments and return the positions
+        paired with the axes to be moved.
+        """
         if axis is None and len(pos) != len(self.axes):
             raise ValueError(
                 f"Keyword `pos` must be a tuple of equal length to the "
@@ -365,19 +667,254 @@ class Drive(EventActor):
             )
 
         move_ax = self.axes if axis is None else [self.axes[axis]]
-        rtn = []
-        for p, ax in zip(pos, move_ax):
-            _rtn = ax.move_to(p)
-            rtn.append(_rtn)
+        return list(pos), move_ax
 
-        return rtn
+    def stream_to(
+        self,
+        positions,
+        dwell: float = 0.0,
+        depth: int = 4,
+        callback: Optional[Callable[[int], Any]] = None,
+    ) -> StreamResult:
+        """
+        Move the drive through a sequence of positions by streaming
+        the moves into the command buffers of the axis motors, so the
+        axes move on to the next position without waiting on a round
+        trip to the host.  All axes start every position together, see
+        `~bapsf_motion.actors.stream`.
+
+        Parameters
+        ----------
+        positions: :term:`array_like`
+            The positions (in axis represented units) to move through,
+            each position has the length :attr:`naxes`.
+        dwell: float, optional
+            Time (in seconds) the drive rests at each position.
+            (DEFAULT: ``0.0``)
+        depth: int, optional
+            Number of upcoming positions kept loaded in the motor
+            buffers. (DEFAULT: ``4``)
+        callback: :term:`callable`, optional
+            Called from the `event loop`_ with the index of every
+            position (into ``positions``) once all axes reached the
+            position. (DEFAULT: `None`)
+
+        Returns
+        -------
+        StreamResult
+            The outcome of the streamed moves.
+        """
+        return self._run_coroutine(
+            self.astream_to(positions, dwell=dwell, depth=depth, callback=callback)
+        )
+
+    async def astream_to(
+        self,
+        positions,
+        dwell: float = 0.0,
+        depth: int = 4,
+        callback: Optional[Callable[[int], Any]] = None,
+    ) -> StreamResult:
+        """
+        An awaitable version of :meth:`stream_to`, which must be
+        awaited from within the actor's `event loop`_.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            result = await drive.astream_to([[0, 0], [5, 0], [5, 5]], dwell=0.5)
+        """
+        return await stream_moves_async(
+            [ax.motor for ax in self.axes],
+            self._stream_targets(positions),
+            dwell=dwell,
+            depth=depth,
+            callback=callback,
+        )
+
+    def compile_q_program(
+        self,
+        positions,
+        dwell: float = 0.0,
+        labels: Optional[List[Any]] = None,
+        rewrite_segments: bool = False,
+    ) -> Optional[QProgram]:
+        """
+        Compile a sequence of positions into Q program segments, which
+        the axis motors execute without the host issuing every move.
+        See `~bapsf_motion.actors.qprogram` for details.  The move
+        times are estimated from the current position, so the program
+        should be run from the current position.
+
+        Parameters
+        ----------
+        positions: :term:`array_like`
+            The positions (in axis represented units) to move through,
+            each position has the length :attr:`naxes`.
+        dwell: float, optional
+            Time (in seconds) the drive rests at each position.
+            (DEFAULT: ``0.0``)
+        labels: List[Any], optional
+            A label for every position, see
+            `~bapsf_motion.actors.qprogram.QProgram`. (DEFAULT: `None`)
+        rewrite_segments: bool, optional
+            If `True`, then programs needing more than 12 segments are
+            compiled, see
+            `~bapsf_motion.actors.qprogram.compile_q_program`.
+            (DEFAULT: `False`)
+
+        Returns
+        -------
+        QProgram or None
+            The compiled program, `None` if the position or motion
+            parameters of an axis are unknown.
+        """
+        return compile_q_program(
+            [ax.motor for ax in self.axes],
+            self._stream_targets(positions),
+            dwell=dwell,
+            labels=labels,
+            rewrite_segments=rewrite_segments,
+        )
+
+    def run_q_program(
+        self,
+        program: QProgram,
+        callback: Optional[Callable[[int], Any]] = None,
+        allow_upload: bool = False,
+    ) -> QProgramResult:
+        """
+        Upload and run the Q program ``program``, see
+        :meth:`compile_q_program`.
+
+        Parameters
+        ----------
+        program: QProgram
+            The program to run.
+        callback: :term:`callable`, optional
+            Called from the `event loop`_ with the index of every
+            position once all axes finished the Q segment containing
+            the position. (DEFAULT: `None`)
+        allow_upload: bool, optional
+            If `True`, then segments not yet stored on the motors are
+            uploaded, see
+            `~bapsf_motion.actors.qprogram.run_q_program_async`.
+            (DEFAULT: `False`)
+
+        Returns
+        -------
+        QProgramResult
+            The outcome of the run.
+        """
+        return self._run_coroutine(
+            self.arun_q_program(
+                program, callback=callback, allow_upload=allow_upload
+            )
+        )
+
+    async def arun_q_program(
+        self,
+        program: QProgram,
+        callback: Optional[Callable[[int], Any]] = None,
+        allow_upload: bool = False,
+    ) -> QProgramResult:
+        """
+        An awaitable version of :meth:`run_q_program`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await run_q_program_async(
+            program, allow_upload=allow_upload, callback=callback
+        )
+
+    def _stream_targets(self, positions) -> List[List[int]]:
+        """
+        Convert the sequence of drive ``positions`` into the motor
+        positions (in steps) of every axis.
+        """
+        targets = []
+        for pos in positions:
+            pos, move_ax = self._move_axes(pos, None)
+            targets.append(
+                [ax._to_motor_args("move_to", (p,))[0] for p, ax in zip(pos, move_ax)]
+            )
+        return targets
+
+    def estimate_move_times(
+        self,
+        positions,
+        start=None,
+        dwell: float = 0.0,
+        coordinated: bool = False,
+    ) -> Optional[List[float]]:
+        """
+        Estimate how long it takes to move the drive through a sequence
+        of positions, from the trapezoidal motion profile of every axis
+        (see `~bapsf_motion.actors.profile`) with the current speed,
+        acceleration, and deceleration of the axis motors.
+
+        Parameters
+        ----------
+        positions: :term:`array_like`
+            The positions (in axis represented units) to move through,
+            each position has the length :attr:`naxes`.
+        start: :term:`array_like`, optional
+            The position the sequence starts from.  If `None`, then the
+            current :attr:`position` is used. (DEFAULT: `None`)
+        dwell: float, optional
+            Time (in seconds) the drive rests at each position, which
+            is added to the move to the next position.
+            (DEFAULT: ``0.0``)
+        coordinated: bool, optional
+            If `True`, then the axes are moved coordinated, see
+            :meth:`move_to`. (DEFAULT: `False`)
+
+        Returns
+        -------
+        List[float] or None
+            The estimated time (in seconds) of the move to each of
+            ``positions``, `None` if the start position or the motion
+            parameters of an axis are unknown.
+        """
+        rates = [ax._motion_rates() for ax in self.axes]
+        if any(rate is None for rate in rates):
+            return None
+
+        if start is None:
+            if any(ax.motor.status["position"] is None for ax in self.axes):
+                return None
+            start = self.position.value
+
+        durations = sequence_durations(
+            [self._move_axes(pos, None)[0] for pos in positions],
+            list(start),
+            [rate[0] for rate in rates],
+            [rate[1] for rate in rates],
+            [rate[2] for rate in rates],
+            coordinated=coordinated,
+        )
+        return [
+            duration + (dwell if ii else 0.0) for ii, duration in enumerate(durations)
+        ]
 
     def stop(self, soft=False):
-        """Stop all axes from moving."""
+        """Stop all axes from moving.  All axes are stopped concurrently."""
         # TODO: should I really be construct a return here?
-        # TODO: is there a quicker/more efficient way of stopping the motors?
+        return self._run_coroutine(self.astop(soft=soft))
 
-        rtn = []
+    async def astop(self, soft=False):
+        """
+        An awaitable version of :meth:`stop`, which must be awaited from
+        within the actor's `event loop`_.
+        """
+        return await self._dispatch_async(
+            [ax.astop(soft=soft) for ax in self._stop_axes()]
+        )
+
+    def _stop_axes(self) -> List[Axis]:
+        """The axes that can be sent a STOP command."""
+        axes = []
         for ax in self.axes:
             if ax.motor.terminated:
                 self.logger.warning(
@@ -386,13 +923,40 @@ class Drive(EventActor):
                 )
                 continue
 
-            if not ax.connected:
-                continue
+            if ax.connected:
+                axes.append(ax)
 
-            _rtn = ax.stop(soft=soft)
-            rtn.append(_rtn)
+        return axes
 
-        return rtn
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all axes of the drive stop moving.  See
+        :meth:`Motor.wait_for_stop() <bapsf_motion.actors.motor_.Motor.wait_for_stop>`
+        for details.
+
+        Parameters
+        ----------
+        timeout: `float`, optional
+            Max time (in seconds) to wait for all axes to stop.  If
+            `None`, then wait indefinitely. (DEFAULT: `None`)
+
+        Returns
+        -------
+        bool
+            `True` if all axes stopped moving, and `False` if the wait
+            timed out.
+        """
+        return self._run_coroutine(self.await_for_stop(timeout))
+
+    async def await_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        An awaitable version of :meth:`wait_for_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        stopped = await asyncio.gather(
+            *[ax.await_for_stop(timeout) for ax in self.axes]
+        )
+        return all(stopped)
 
     def sel(self, aname):
         """Select an axis index from a given axis name ``aname``."""
@@ -0,0 +1,257 @@
+"""
+Module for the emergency stop of many
+`~bapsf_motion.actors.motor_.Motor` actors at once.
+
+A regular stop travels down the actor hierarchy (e.g.
+`~bapsf_motion.actors.motion_group_.MotionGroup.stop` →
+`~bapsf_motion.actors.drive_.Drive.stop` →
+`~bapsf_motion.actors.axis_.Axis.stop` →
+`~bapsf_motion.actors.motor_.Motor.stop`) and is handed to the
+`event loop`_ together with all other motor traffic.  An emergency
+stop instead wakes the event loop with a dedicated callback, writes
+the stop command straight to the transport of every connected motor
+before yielding to any other task, and only then waits on the
+acknowledgements.  Optionally, the stop command is also sent as a
+UDP datagram, which reaches the motor even if its TCP connection is
+down or wedged.
+"""
+__all__ = ["EStopResult", "emergency_stop", "emergency_stop_async"]
+
+import asyncio
+import logging
+import socket
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.transport import scl_encode
+
+
+class EStopResult(NamedTuple):
+    """The outcome of the emergency stop of a single motor."""
+
+    #: Name of the motor's logger, which identifies the motor within
+    #: the actor hierarchy.
+    name: str
+
+    #: IPv4 address of the motor.
+    ip: str
+
+    #: `True` if the motor acknowledged the stop command.
+    acknowledged: bool
+
+    #: Time (in seconds) from writing the stop command to receiving
+    #: the acknowledgement, `None` if not acknowledged.
+    latency: Optional[float]
+
+    #: The reply of the motor, `None` if no reply was received.
+    reply: Any
+
+    #: `True` if the stop command was also sent as a UDP datagram.
+    udp_sent: bool
+
+
+def _send_udp_stop(motor: Motor, soft: bool, udp_port: int) -> bool:
+    """
+    Send the stop command to ``motor`` as a UDP datagram, without
+    waiting on a reply.  Returns `True` if the datagram was sent.
+    """
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setblocking(False)
+            sock.sendto(
+                scl_encode(motor._process_command("stop", soft)),
+                (motor.ip, udp_port),
+            )
+    except OSError as err:
+        motor.logger.error(
+            f"Unable to send the emergency stop to {motor.ip}:{udp_port} "
+            f"over UDP.",
+            exc_info=err,
+        )
+        return False
+
+    return True
+
+
+class _FiredStop(NamedTuple):
+    """A stop command written to a motor, waiting on its reply."""
+    motor: Motor
+    future: Optional[asyncio.Future]
+    tstart: float
+    udp_sent: bool
+
+
+def _fire_stops(
+    motors: List[Motor], soft: bool, udp: bool, udp_port: int
+) -> List[_FiredStop]:
+    """
+    Write the stop command to all ``motors`` without yielding to the
+    `event loop`_.  Must be called from the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    fired = []
+    for motor in motors:
+        tstart = loop.time()
+        future = motor._submit_stop(soft)
+        sent = (
+            _send_udp_stop(motor, soft, udp_port)
+            if udp or future is None
+            else False
+        )
+        fired.append(_FiredStop(motor, future, tstart, sent))
+
+    return fired
+
+
+async def _collect_stops(
+    fired: List[_FiredStop], timeout: Optional[float]
+) -> List[EStopResult]:
+    """Wait on the replies to the ``fired`` stop commands."""
+    loop = asyncio.get_running_loop()
+
+    # record the time each reply arrives
+    reply_times = {}  # type: Dict[asyncio.Future, float]
+    waiting = [stop.future for stop in fired if stop.future is not None]
+    for future in waiting:
+        future.add_done_callback(
+            lambda _future: reply_times.setdefault(_future, loop.time())
+        )
+
+    if waiting:
+        await asyncio.wait(waiting, timeout=timeout)
+
+    results = []
+    for motor, future, tstart, udp_sent in fired:
+        reply = None
+        if (
+            future is not None
+            and future.done()
+            and not future.cancelled()
+            and future.exception() is None
+        ):
+            reply = future.result()
+
+        acknowledged = reply is not None and (
+            motor._process_command_return_string("stop", reply)
+            in (motor.ack_flags.ACK, motor.ack_flags.ACK_QUEUED)
+        )
+        results.append(
+            EStopResult(
+                name=motor.logger.name,
+                ip=motor.ip,
+                acknowledged=acknowledged,
+                latency=reply_times[future] - tstart if acknowledged else None,
+                reply=reply,
+                udp_sent=udp_sent,
+            )
+        )
+
+        # refresh the motor status as soon as possible
+        motor._wake_heartbeat()
+
+    return results
+
+
+async def emergency_stop_async(
+    motors: Iterable[Motor],
+    *,
+    soft: bool = False,
+    udp: bool = False,
+    udp_port: int = Motor._default_ports["udp"],
+    timeout: Optional[float] = None,
+) -> List[EStopResult]:
+    """
+    A coroutine_ version of `emergency_stop`.  The stop commands are
+    all written before the coroutine yields to the `event loop`_ for
+    the first time.
+    """
+    motors = [motor for motor in motors if not motor.terminated]
+    fired = _fire_stops(motors, soft, udp, udp_port)
+    return await _collect_stops(fired, timeout)
+
+
+def emergency_stop(
+    motors: Iterable[Motor],
+    *,
+    soft: bool = False,
+    udp: bool = False,
+    udp_port: int = Motor._default_ports["udp"],
+    timeout: Optional[float] = None,
+    logger: Optional[logging.Logger] = None,
+) -> List[EStopResult]:
+    """
+    Stop all ``motors`` concurrently, bypassing the regular command
+    path.  The stop command is written to every connected motor right
+    away, and then the acknowledgements are collected.
+
+    Parameters
+    ----------
+    motors: Iterable[|Motor|]
+        The motors to stop.  All motors must share an `event loop`_.
+
+    soft: bool, optional
+        If `True`, then the motors decelerate to a stop instead of
+        stopping abruptly. (DEFAULT: `False`)
+
+    udp: bool, optional
+        If `True`, then the stop command is also sent to every motor
+        as a UDP datagram.  Motors without an open connection are
+        always sent the UDP datagram. (DEFAULT: `False`)
+
+    udp_port: int, optional
+        UDP port the motors serve SCL on. (DEFAULT: ``7775``)
+
+    timeout: float, optional
+        Max time (in seconds) to wait on the acknowledgements.  If
+        `None`, then the wait is bounded by the transport timeout.
+        (DEFAULT: `None`)
+
+    logger: `~logging.Logger`, optional
+        Logger to record the outcome to.  If `None`, then the outcome
+        is not logged. (DEFAULT: `None`)
+
+    Returns
+    -------
+    List[EStopResult]
+        The outcome of the stop for each motor, in the order of
+        ``motors``.  If called from within the `event loop`_, then the
+        stop commands are still written but the acknowledgements are
+        not waited on, and no results are returned.
+    """
+    motors = [motor for motor in motors if not motor.terminated]
+    if not motors:
+        return []
+
+    loop = motors[0].loop
+    coro = emergency_stop_async(
+        motors, soft=soft, udp=udp, udp_port=udp_port, timeout=timeout
+    )
+    if not loop.is_running():
+        results = loop.run_until_complete(coro)
+    elif motors[0]._submissions.in_loop_thread():
+        # write the stop commands right away, but blocking the loop to
+        # wait on the acknowledgements would deadlock it
+        coro.close()
+        fired = _fire_stops(motors, soft, udp, udp_port)
+        loop.create_task(_collect_stops(fired, timeout))
+        return []
+    else:
+        # do not share the submission queue with the regular traffic
+        results = asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    if logger is not None:
+        for result in results:
+            if result.acknowledged:
+                logger.info(
+                    f"Emergency stop of motor {result.name} ({result.ip}) "
+                    f"acknowledged in {1e3 * result.latency:.1f} ms."
+                )
+            else:
+                logger.error(
+                    f"Emergency stop of motor {result.name} ({result.ip}) was "
+                    f"NOT acknowledged (reply {result.reply!r}, UDP "
+                    f"{'sent' if result.udp_sent else 'not sent'})."
+                )
+
+    return results
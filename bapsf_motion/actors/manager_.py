@@ -6,19 +6,32 @@ Module for functionality focused around the
 __all__ = ["RunManager", "RunManagerConfig"]
 __actors__ = ["RunManager"]
 
+import asyncio
 import logging
 
 from collections import UserDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
+from bapsf_motion.actors.estop import (
+    emergency_stop,
+    emergency_stop_async,
+    EStopResult,
+)
+from bapsf_motion.actors.poller import StatusPoller
+from bapsf_motion.actors.startup import (
+    defer_motor_startup,
+    MotorStartupResult,
+    startup_motors,
+)
 from bapsf_motion.actors.motion_group_ import (
     MotionGroup,
     MotionGroupConfig,
     handle_user_metadata
 )
+from bapsf_motion.actors.motor_ import Motor
 from bapsf_motion.utils import toml, _deepcopy_dict
 
 
@@ -292,6 +305,8 @@ class RunManager(EventActor):
     ):
         self._mgs = None
         self._config = None
+        self._status_poller = None  # type: Optional[StatusPoller]
+        self._startup_results = []  # type: List[MotorStartupResult]
 
         logger = logging.getLogger("RM")
         super().__init__(
@@ -317,8 +332,14 @@ class RunManager(EventActor):
 
         self._config = config
 
-        for key, mgc in self._config["motion_group"].items():
-            self._raw_add_motion_group(mgc, key)
+        # spawn all motion groups before connecting to their motors, so
+        # the motors of all motion groups are connected to concurrently
+        with defer_motor_startup(self) as deferred_by_ancestor:
+            for key, mgc in self._config["motion_group"].items():
+                self._raw_add_motion_group(mgc, key)
+
+        if not deferred_by_ancestor:
+            self._startup_results = startup_motors(self, self.motors)
         
         self.run(auto_run=auto_run)
     
@@ -350,7 +371,94 @@ class RunManager(EventActor):
         return self._config
     config.__doc__ = EventActor.config.__doc__
     
+    @property
+    def startup_results(self) -> List[MotorStartupResult]:
+        """
+        The outcome of concurrently starting up the motors of all
+        motion groups when the run manager was spawned.  Motion groups
+        added afterwards start up their own motors, see
+        :attr:`MotionGroup.startup_results <bapsf_motion.actors.motion_group_.MotionGroup.startup_results>`.
+        Empty if the run manager was spawned from within its running
+        `event loop`_.
+        """
+        return self._startup_results
+
+    @property
+    def status_poller(self) -> Optional[StatusPoller]:
+        """
+        The `~bapsf_motion.actors.poller.StatusPoller` polling the
+        status of all motors of all motion groups, `None` if not used.
+        """
+        return self._status_poller
+
+    def start_status_poller(self, max_rate: Optional[float] = None) -> StatusPoller:
+        """
+        Poll the status of every motor of every motion group from a
+        single `~bapsf_motion.actors.poller.StatusPoller`, which
+        publishes one consolidated status snapshot per poll cycle.
+        The motors are keyed by ``"<motion group name>.<axis name>"``
+        in the snapshot, where the motion group name is the ``"name"``
+        of its configuration.  Motion groups added later are polled too.
+
+        Parameters
+        ----------
+        max_rate: `float`, optional
+            Max number of motor status polls per second across all
+            motors.  If `None`, then the rate is not limited.
+            (DEFAULT: `None`)
+
+        Returns
+        -------
+        StatusPoller
+            The running poller.
+        """
+        if self._status_poller is None:
+            self._status_poller = StatusPoller(
+                self.loop, max_rate=max_rate, logger=self.logger
+            )
+        else:
+            self._status_poller.max_rate = max_rate
+
+        for mg in self.mgs.values():
+            self._poll_motion_group(mg)
+
+        self._status_poller.start()
+        return self._status_poller
+
+    def stop_status_poller(self):
+        """
+        Stop the :attr:`status_poller` and hand the status polling back
+        to the heartbeat of each motor.
+        """
+        if self._status_poller is None:
+            return
+
+        self._status_poller.stop()
+        self._status_poller = None
+
+    def _poll_motion_group(self, mg: MotionGroup):
+        """Add the motors of ``mg`` to the :attr:`status_poller`."""
+        if self._status_poller is None or mg.drive is None:
+            return
+
+        # the run-wide poller supersedes a drive level poller
+        mg.stop_status_poller()
+        for ax in mg.drive.axes:
+            self._status_poller.add_motor(
+                ax.motor, key=f"{mg.config['name']}.{ax.name}"
+            )
+
+    def _unpoll_motion_group(self, mg: MotionGroup):
+        """Remove the motors of ``mg`` from the :attr:`status_poller`."""
+        if self._status_poller is None or mg.drive is None:
+            return
+
+        for ax in mg.drive.axes:
+            self._status_poller.remove_motor(ax.motor)
+
     def terminate(self, delay_loop_stop=False):
+        self.stop_status_poller()
+
         for mg in self.mgs.values():
             mg.terminate(delay_loop_stop=True)
         super().terminate(delay_loop_stop=delay_loop_stop)
@@ -368,6 +476,87 @@ class RunManager(EventActor):
     def is_moving(self):
         return any([mg.is_moving for mg in self.mgs.values()])
 
+    def stop(self, soft=False):
+        """Immediately stop the probe drive motion of all motion groups."""
+        return self._run_coroutine(self.astop(soft=soft))
+
+    async def astop(self, soft=False):
+        """
+        An awaitable version of :meth:`stop`, which must be awaited from
+        within the actor's `event loop`_.  All motion groups are
+        stopped concurrently.
+        """
+        await asyncio.gather(
+            *[
+                mg.astop(soft=soft)
+                for mg in self.mgs.values()
+                if mg.drive is not None
+            ]
+        )
+
+    @property
+    def motors(self) -> List[Motor]:
+        """List of the motors of all motion groups."""
+        return [
+            ax.motor
+            for mg in self.mgs.values()
+            if mg.drive is not None
+            for ax in mg.drive.axes
+        ]
+
+    def emergency_stop(
+        self, soft: bool = False, udp: bool = False, timeout: Optional[float] = None
+    ) -> List[EStopResult]:
+        """
+        Stop every motor of every motion group concurrently, bypassing
+        the regular command path.  See
+        `~bapsf_motion.actors.estop.emergency_stop` for a description of
+        the arguments.
+
+        Returns
+        -------
+        List[EStopResult]
+            The outcome of the stop for each motor, including the
+            acknowledgement latency.
+        """
+        return emergency_stop(
+            self.motors, soft=soft, udp=udp, timeout=timeout, logger=self.logger
+        )
+
+    async def aemergency_stop(
+        self, soft: bool = False, udp: bool = False, timeout: Optional[float] = None
+    ) -> List[EStopResult]:
+        """
+        An awaitable version of :meth:`emergency_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await emergency_stop_async(
+            self.motors, soft=soft, udp=udp, timeout=timeout
+        )
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the probe drives of all motion groups stop moving.
+        See
+        :meth:`Motor.wait_for_stop() <bapsf_motion.actors.motor_.Motor.wait_for_stop>`
+        for details.
+        """
+        return self._run_coroutine(self.await_for_stop(timeout))
+
+    async def await_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        An awaitable version of :meth:`wait_for_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        stopped = await asyncio.gather(
+            *[
+                mg.await_for_stop(timeout)
+                for mg in self.mgs.values()
+                if mg.drive is not None
+            ]
+        )
+        return all(stopped)
+
     def validate_motion_group(
         self,
         mg_config: Union[Dict[str, Any], MotionGroup, MotionGroupConfig],
@@ -405,6 +594,7 @@ class RunManager(EventActor):
         mg = self._spawn_motion_group(config)
         self.mgs[identifier] = mg
         self.config.link_motion_group(mg, identifier)
+        self._poll_motion_group(mg)
 
     def add_motion_group(
         self,
@@ -424,6 +614,7 @@ class RunManager(EventActor):
         self.config.unlink_motion_group(identifier)
 
         if identifier in self.mgs:
+            self._unpoll_motion_group(self.mgs[identifier])
             self.mgs[identifier].terminate(delay_loop_stop=True)
             del self.mgs[identifier]
 
@@ -433,5 +624,7 @@ class RunManager(EventActor):
     def pop_motion_group(self, identifier: Union[str, int]):
         mg = self.mgs.pop(identifier, None)
         self.config.unlink_motion_group(identifier)
+        if mg is not None:
+            self._unpoll_motion_group(mg)
 
         return mg
@@ -11,11 +11,21 @@ import logging
 import numpy as np
 
 from collections import UserDict
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from bapsf_motion.actors.base import EventActor
 from bapsf_motion.actors.drive_ import Drive
+from bapsf_motion.actors.poller import StatusPoller
+from bapsf_motion.actors.profile import trapezoid_durations
+from bapsf_motion.actors.qprogram import QProgram, QProgramResult
+from bapsf_motion.actors.stream import StreamResult
+from bapsf_motion.actors.startup import (
+    defer_motor_startup,
+    MotorStartupResult,
+    startup_motors,
+)
 from bapsf_motion.motion_builder import MotionBuilder
+from bapsf_motion.motion_builder.ordering import euclidean_metric
 from bapsf_motion.transform import BaseTransform
 from bapsf_motion import transform
 from bapsf_motion.utils import toml
@@ -241,7 +251,12 @@ class MotionGroupConfig(UserDict):
 
     #: optional keys for the motion group configuration dictionary
     _optional_metadata = {
-        "motion_builder": {"exclusion", "layer", "layer_to_motionlist_scheme"},
+        "motion_builder": {
+            "exclusion",
+            "layer",
+            "layer_to_motionlist_scheme",
+            "motionlist_ordering",
+        },
         "drive.axes": {"motor_settings"},
     }
 
@@ -725,6 +740,7 @@ class MotionGroup(EventActor):
         self._mb = None
         self._transform = None
         self._config = None
+        self._startup_results = []  # type: List[MotorStartupResult]
 
         if logger is None:
             logger = logging.getLogger("MG")
@@ -757,6 +773,7 @@ class MotionGroup(EventActor):
         self._ml_index = None
 
         self._transform = self._spawn_transform(config.get("transform", None))
+        self._link_ordering_cost()
 
         self._config = config
         self._config.link_drive(self.drive)
@@ -803,13 +820,14 @@ class MotionGroup(EventActor):
             "axes": list(config["axes"].values()),
         }
         try:
-            dr = Drive(
-                logger=self.logger,
-                loop=self.loop,
-                auto_run=False,
-                parent=self,
-                **_config_inputs,
-            )
+            with defer_motor_startup(self) as deferred_by_ancestor:
+                dr = Drive(
+                    logger=self.logger,
+                    loop=self.loop,
+                    auto_run=False,
+                    parent=self,
+                    **_config_inputs,
+                )
             self._drive = dr
         except (TypeError, ValueError) as err:
             self.logger.warning(
@@ -817,6 +835,11 @@ class MotionGroup(EventActor):
                 exc_info=err,
             )
             self._drive = None
+        else:
+            if not deferred_by_ancestor:
+                self._startup_results = startup_motors(
+                    self, [ax.motor for ax in dr.axes]
+                )
 
         if self._drive.terminated or self.terminated:
             # 1. terminated self if the new drive is terminated
@@ -869,6 +892,44 @@ class MotionGroup(EventActor):
         )
         return self._transform
 
+    def _link_ordering_cost(self):
+        """
+        Have the ``'shortest'`` motion list ordering (see
+        :attr:`MotionBuilder.motionlist_ordering <bapsf_motion.motion_builder.core.MotionBuilder.motionlist_ordering>`)
+        minimize the move time of the probe drive, evaluated in drive
+        coordinates.
+        """
+        if self.mb is None:
+            return
+        elif self.drive is None or self.transform is None:
+            self.mb.set_ordering_cost()
+            return
+
+        self.mb.set_ordering_cost(
+            transform=lambda points: self.transform(points, to_coords="drive"),
+            metric=self._move_time_metric,
+        )
+
+    def _move_time_metric(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        The estimated time (in seconds) to move the probe drive between
+        the paired drive coordinates ``a`` and ``b``.  Falls back to the
+        Euclidean distance if the motion parameters of an axis are
+        unknown.
+        """
+        rates = [ax._motion_rates() for ax in self.drive.axes]
+        if any(rate is None for rate in rates):
+            return euclidean_metric(a, b)
+
+        distances = np.asarray(b) - np.asarray(a)
+        return np.max(
+            [
+                trapezoid_durations(distances[..., ii], *rate)
+                for ii, rate in enumerate(rates)
+            ],
+            axis=0,
+        )
+
     def terminate(self, delay_loop_stop=False):
         if self.drive is not None:
             self.drive.terminate(delay_loop_stop=True)
@@ -887,6 +948,16 @@ class MotionGroup(EventActor):
         """
         return self.drive.connected
 
+    @property
+    def startup_results(self) -> List[MotorStartupResult]:
+        """
+        The outcome of concurrently starting up the drive motors when
+        the drive was spawned.  Empty if the motors were started up by
+        a parent actor (e.g. |RunManager|) or the motion group was
+        spawned from within its running `event loop`_.
+        """
+        return self._startup_results
+
     @property
     def drive(self) -> Drive:
         """Instance of |Drive| associated with the motion group."""
@@ -943,7 +1014,63 @@ class MotionGroup(EventActor):
         """Immediately stop the probe drive motion."""
         self.drive.stop(soft=soft)
 
-    def move_to(self, pos, axis: Optional[int] = None):
+    async def astop(self, soft=False):
+        """
+        An awaitable version of :meth:`stop`, which must be awaited from
+        within the actor's `event loop`_.
+        """
+        await self.drive.astop(soft=soft)
+
+    @property
+    def status_poller(self) -> Optional[StatusPoller]:
+        """
+        The `~bapsf_motion.actors.poller.StatusPoller` polling the
+        status of the probe drive axes, `None` if not used.
+        """
+        return None if self.drive is None else self.drive.status_poller
+
+    def start_status_poller(
+        self, max_rate: Optional[float] = None
+    ) -> Optional[StatusPoller]:
+        """
+        Poll the status of the probe drive axes from a single
+        `~bapsf_motion.actors.poller.StatusPoller`.  See
+        :meth:`Drive.start_status_poller() <bapsf_motion.actors.drive_.Drive.start_status_poller>`
+        for details.
+        """
+        if self.drive is None:
+            self.logger.error(
+                "No drive is defined for the motion group, can not start the "
+                "status poller."
+            )
+            return None
+
+        return self.drive.start_status_poller(max_rate=max_rate)
+
+    def stop_status_poller(self):
+        """
+        Stop the :attr:`status_poller` and hand the status polling back
+        to the heartbeat of each axis motor.
+        """
+        if self.drive is not None:
+            self.drive.stop_status_poller()
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the probe drive stops moving.  See
+        :meth:`Drive.wait_for_stop() <bapsf_motion.actors.drive_.Drive.wait_for_stop>`
+        for details.
+        """
+        return self.drive.wait_for_stop(timeout)
+
+    async def await_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        An awaitable version of :meth:`wait_for_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await self.drive.await_for_stop(timeout)
+
+    def move_to(self, pos, axis: Optional[int] = None, coordinated: bool = False):
         """
         Move the probe drive to a specified location, ``pos``.
 
@@ -958,6 +1085,39 @@ class MotionGroup(EventActor):
             An integer specifying which axis is to be moved.  ``axis``
             is integer of 0 to :math:`N-1`, where :math:`N` is the
             dimensionality of the motion space.
+
+        coordinated: `bool`, optional
+            If `True`, then all probe drive axes arrive at the same
+            time, see
+            :meth:`Drive.move_to() <bapsf_motion.actors.drive_.Drive.move_to>`.
+            (DEFAULT: `False`)
+        """
+        dr_pos = self._drive_position(pos)
+        if dr_pos is None:
+            return
+
+        return self.drive.move_to(pos=dr_pos, axis=axis, coordinated=coordinated)
+
+    async def amove_to(
+        self, pos, axis: Optional[int] = None, coordinated: bool = False
+    ):
+        """
+        An awaitable version of :meth:`move_to`, which must be awaited
+        from within the actor's `event loop`_.
+        """
+        dr_pos = self._drive_position(pos)
+        if dr_pos is None:
+            return
+
+        return await self.drive.amove_to(
+            pos=dr_pos, axis=axis, coordinated=coordinated
+        )
+
+    def _drive_position(self, pos) -> Optional[np.ndarray]:
+        """
+        Transform the motion space position ``pos`` into the probe
+        drive position.  Returns `None` if ``pos`` is in an excluded
+        region of the motion space.
         """
         if isinstance(pos, u.Quantity):
             pos = pos.value
@@ -969,14 +1129,38 @@ class MotionGroup(EventActor):
                     f"'{self.name}' is in an excluded region of the "
                     f"motion space.  NOT MOVEMENT PREFORMED!!"
                 )
-                return
+                return None
 
-        dr_pos = self.transform(pos, to_coords="drive").squeeze()
-        return self.drive.move_to(pos=dr_pos, axis=axis)
+        return self.transform(pos, to_coords="drive").squeeze()
 
-    def move_ml(self, index: int):
+    def move_ml(self, index: int, coordinated: bool = False):
         """
         Move the probe drive to a specific index of the motion list.
+        See :meth:`move_to` for keyword ``coordinated``.
+        """
+        return self.move_to(pos=self._ml_position(index), coordinated=coordinated)
+
+    async def amove_ml(self, index: int, coordinated: bool = False):
+        """
+        An awaitable version of :meth:`move_ml`, which must be awaited
+        from within the actor's `event loop`_.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            await mg.amove_ml("next")
+            await mg.await_for_stop()
+        """
+        return await self.amove_to(
+            pos=self._ml_position(index), coordinated=coordinated
+        )
+
+    def _ml_position(self, index: int) -> List[float]:
+        """
+        Set :attr:`ml_index` to the motion list index ``index`` and
+        return the motion list position at that index.
         """
         if index == "next":
             index = 0 if self.ml_index is None else self.ml_index + 1
@@ -986,9 +1170,228 @@ class MotionGroup(EventActor):
             index = self.mb.motion_list.index[-1].item()
 
         self.ml_index = index
-        pos = self.mb.motion_list.sel(index=index).to_numpy().tolist()
+        return self.mb.motion_list.sel(index=index).to_numpy().tolist()
+
+    def stream_ml(
+        self,
+        indices: Optional[List[int]] = None,
+        dwell: float = 0.0,
+        depth: int = 4,
+    ) -> Optional[StreamResult]:
+        """
+        Move the probe drive through the motion list by streaming the
+        moves into the command buffers of the motors, see
+        :meth:`Drive.stream_to() <bapsf_motion.actors.drive_.Drive.stream_to>`.
+        :attr:`ml_index` is updated as the probe drive reaches each
+        motion list index.
+
+        Parameters
+        ----------
+        indices: List[int], optional
+            The motion list indices to move through, in order.  If
+            `None`, then the whole motion list is used.
+            (DEFAULT: `None`)
+        dwell: float, optional
+            Time (in seconds) the probe drive rests at each motion list
+            index. (DEFAULT: ``0.0``)
+        depth: int, optional
+            Number of upcoming motion list indices kept loaded in the
+            motor buffers. (DEFAULT: ``4``)
+
+        Returns
+        -------
+        StreamResult or None
+            The outcome of the streamed moves, `None` if any of the
+            positions is in an excluded region of the motion space.
+        """
+        return self._run_coroutine(
+            self.astream_ml(indices=indices, dwell=dwell, depth=depth)
+        )
+
+    async def astream_ml(
+        self,
+        indices: Optional[List[int]] = None,
+        dwell: float = 0.0,
+        depth: int = 4,
+    ) -> Optional[StreamResult]:
+        """
+        An awaitable version of :meth:`stream_ml`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        if indices is None:
+            indices = self.mb.motion_list.index.to_numpy().tolist()
+
+        positions = self._ml_drive_positions(indices)
+        if positions is None:
+            return None
+
+        def reached(ii: int):
+            self.ml_index = indices[ii]
+
+        return await self.drive.astream_to(
+            positions, dwell=dwell, depth=depth, callback=reached
+        )
+
+    def compile_ml_program(
+        self,
+        indices: Optional[List[int]] = None,
+        dwell: float = 0.0,
+        rewrite_segments: bool = False,
+    ) -> Optional[QProgram]:
+        """
+        Compile the motion list into Q program segments, which the
+        motors execute without the host issuing every move, see
+        :meth:`Drive.compile_q_program() <bapsf_motion.actors.drive_.Drive.compile_q_program>`.
+        Run the program with :meth:`run_ml_program`.
+
+        Parameters
+        ----------
+        indices: List[int], optional
+            The motion list indices to move through, in order.  If
+            `None`, then the whole motion list is used.
+            (DEFAULT: `None`)
+        dwell: float, optional
+            Time (in seconds) the probe drive rests at each motion list
+            index. (DEFAULT: ``0.0``)
+        rewrite_segments: bool, optional
+            If `True`, then programs needing more than 12 segments are
+            compiled, see
+            `~bapsf_motion.actors.qprogram.compile_q_program`.
+            (DEFAULT: `False`)
+
+        Returns
+        -------
+        QProgram or None
+            The compiled program, `None` if any of the positions is in
+            an excluded region of the motion space or the motion
+            parameters of an axis are unknown.
+        """
+        if indices is None:
+            indices = self.mb.motion_list.index.to_numpy().tolist()
+
+        positions = self._ml_drive_positions(indices)
+        if positions is None:
+            return None
+
+        return self.drive.compile_q_program(
+            positions, dwell=dwell, labels=indices, rewrite_segments=rewrite_segments
+        )
+
+    def run_ml_program(
+        self, program: QProgram, allow_upload: bool = False
+    ) -> QProgramResult:
+        """
+        Upload and run the Q program ``program`` compiled with
+        :meth:`compile_ml_program`.  :attr:`ml_index` is updated as the
+        probe drive finishes each Q segment.  Segments not yet stored
+        on the motors are only uploaded if ``allow_upload`` is `True`,
+        see
+        :meth:`Drive.run_q_program() <bapsf_motion.actors.drive_.Drive.run_q_program>`.
+        """
+        return self._run_coroutine(
+            self.arun_ml_program(program, allow_upload=allow_upload)
+        )
+
+    async def arun_ml_program(
+        self, program: QProgram, allow_upload: bool = False
+    ) -> QProgramResult:
+        """
+        An awaitable version of :meth:`run_ml_program`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        def reached(ii: int):
+            self.ml_index = program.labels[ii]
+
+        return await self.drive.arun_q_program(
+            program,
+            callback=None if program.labels is None else reached,
+            allow_upload=allow_upload,
+        )
+
+    def estimate_ml_eta(
+        self,
+        indices: Optional[List[int]] = None,
+        dwell: float = 0.0,
+        coordinated: bool = False,
+    ) -> Optional[np.ndarray]:
+        """
+        Estimate the time until the probe drive reaches each motion
+        list index, when moving through the motion list from the
+        current position.  See
+        :meth:`Drive.estimate_move_times() <bapsf_motion.actors.drive_.Drive.estimate_move_times>`.
+
+        Parameters
+        ----------
+        indices: List[int], optional
+            The motion list indices to move through, in order.  If
+            `None`, then the whole motion list is used.
+            (DEFAULT: `None`)
+        dwell: float, optional
+            Time (in seconds) the probe drive rests at each motion list
+            index. (DEFAULT: ``0.0``)
+        coordinated: bool, optional
+            If `True`, then the probe drive axes are moved coordinated,
+            see :meth:`move_to`. (DEFAULT: `False`)
+
+        Returns
+        -------
+        `~numpy.ndarray` or None
+            The estimated time (in seconds) from now until each of
+            ``indices`` is reached, `None` if the position or motion
+            parameters of an axis are unknown.
+        """
+        if indices is None:
+            indices = self.mb.motion_list.index.to_numpy().tolist()
+
+        positions = self._ml_drive_positions(indices)
+        if positions is None:
+            return None
+
+        durations = self.drive.estimate_move_times(
+            positions, dwell=dwell, coordinated=coordinated
+        )
+        if durations is None:
+            return None
 
-        return self.move_to(pos=pos)
+        return np.cumsum(durations)
+
+    def estimate_run_time(
+        self,
+        indices: Optional[List[int]] = None,
+        dwell: float = 0.0,
+        coordinated: bool = False,
+    ) -> Optional[float]:
+        """
+        Estimate the time (in seconds) it takes to move through the
+        motion list from the current position, including the dwell at
+        the last index.  See :meth:`estimate_ml_eta` for a description
+        of the arguments.  Returns `None` if the position or motion
+        parameters of an axis are unknown.
+        """
+        eta = self.estimate_ml_eta(indices=indices, dwell=dwell, coordinated=coordinated)
+        if eta is None:
+            return None
+        elif eta.size == 0:
+            return 0.0
+
+        return float(eta[-1]) + dwell
+
+    def _ml_drive_positions(self, indices: List[int]) -> Optional[List[List[float]]]:
+        """
+        The probe drive positions of the motion list indices
+        ``indices``.  Returns `None` if any of the positions is in an
+        excluded region of the motion space.
+        """
+        positions = []
+        for index in indices:
+            dr_pos = self._drive_position(
+                self.mb.motion_list.sel(index=index).to_numpy()
+            )
+            if dr_pos is None:
+                return None
+            positions.append(np.atleast_1d(dr_pos).tolist())
+
+        return positions
 
     def set_zero(self, axis: Optional[int] = None):
         """
@@ -1001,6 +1404,20 @@ class MotionGroup(EventActor):
             `int`, then the axis corresponding to that index will be
             set to zero.
 
+        """
+        self.drive.send_command("set_position", *self._drive_zero_point(axis))
+
+    async def aset_zero(self, axis: Optional[int] = None):
+        """
+        An awaitable version of :meth:`set_zero`, which must be awaited
+        from within the actor's `event loop`_.
+        """
+        await self.drive.asend_command("set_position", *self._drive_zero_point(axis))
+
+    def _drive_zero_point(self, axis: Optional[int] = None) -> np.ndarray:
+        """
+        The probe drive position of the motion space zero, see
+        :meth:`set_zero`.
         """
         # transform does not necessarily map the motion space zero to the
         # zero of the probe drive space
@@ -1023,8 +1440,7 @@ class MotionGroup(EventActor):
             pos[axis] = 0
 
         drive_zero_point = self.transform(pos, to_coords="drive")
-        drive_zero_point = drive_zero_point.squeeze()
-        self.drive.send_command("set_position", *drive_zero_point)
+        return drive_zero_point.squeeze()
 
     @property
     def is_moving(self):
@@ -1107,6 +1523,7 @@ class MotionGroup(EventActor):
 
         self.config.unlink_motion_builder()
         self._spawn_motion_builder(config)
+        self._link_ordering_cost()
         self.config.link_motion_builder(self.mb)
 
     def replace_transform(self, tr: Union["transform.BaseTransform", Dict[str, Any]]):
@@ -1134,4 +1551,5 @@ class MotionGroup(EventActor):
 
         self.config.unlink_transform()
         self._spawn_transform(config)
+        self._link_ordering_cost()
         self.config.link_transform(self.transform)
@@ -7,9 +7,9 @@ __actors__ = ["Motor"]
 
 import asyncio
 import concurrent.futures
-import errno
 import logging
 import numpy as np
+import random
 import re
 import socket
 import threading
@@ -17,9 +17,22 @@ import time
 
 from collections import UserDict
 from enum import Enum
-from typing import Any, AnyStr, Callable, Dict, NamedTuple, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from bapsf_motion.actors.base import EventActor
+from bapsf_motion.actors.pool import connection_pool, ConnectionPool, PooledConnection
+from bapsf_motion.actors.profile import trapezoid_profile
+from bapsf_motion.actors.transport import BaseTransport, TCPTransport, UDPTransport
 from bapsf_motion.utils import ipv4_pattern, SimpleSignal, dict_equal
 from bapsf_motion.utils import units as u
 
@@ -40,10 +53,18 @@ class AckFlags(Enum):
 class _HeartRate(NamedTuple):
     BASE = 1.5  # seconds
     ACTIVE = 0.2
+    FINE = 0.05  # around the predicted end of a move
     SEARCHING = 3.0
     PAUSE = 5.0
 
 
+class _ReconnectBackoff(NamedTuple):
+    INITIAL: float = 0.5  # seconds
+    MAX: float = 30.0  # seconds
+    FACTOR: float = 2.0
+    JITTER: float = 0.25  # fraction of the delay
+
+
 class CommandEntry(UserDict):
     r"""
     A `dict` containing all the necessary information to define a
@@ -185,6 +206,35 @@ class CommandEntry(UserDict):
         return self._command
 
 
+class _CommandSpec(NamedTuple):
+    """
+    An immutable, compiled version of a `CommandEntry`, which |Motor|
+    uses to look up the command definition when sending commands and
+    parsing replies.
+    """
+    name: str
+    send: str = ""
+    send_processor: Optional[Callable[[Any], str]] = None
+    recv: Optional["re.Pattern"] = None
+    recv_processor: Optional[Callable[[str], Any]] = do_nothing
+    two_way: bool = False
+    units: Optional[u.UnitBase] = None
+    method_command: bool = False
+    buffered: bool = True
+
+    @classmethod
+    def from_entry(cls, name: str, entry: CommandEntry) -> "_CommandSpec":
+        """Compile the `CommandEntry` ``entry`` for command ``name``."""
+        return cls(
+            name=name,
+            **{field: entry[field] for field in cls._fields[1:] if field in entry},
+        )
+
+
+#: pattern of a negative acknowledgement (Nack) reply, e.g. ``"?4"``
+_nack_pattern = re.compile(r"\d?\?(?P<code>\d{1,2})")
+
+
 class MotorSignals:
     r"""
     Class that defines all the `~bapsf_motion.utils.SimpleSignal`\ 's
@@ -281,6 +331,17 @@ class Motor(EventActor):
         thread and started.  This is all done via the :meth:`run`
         method. (DEFAULT: `False`)
 
+    transport: `str`, optional
+        The transport used to communicate with the motor, either
+        ``"tcp"`` (`~bapsf_motion.actors.transport.TCPTransport`) or
+        ``"udp"`` (`~bapsf_motion.actors.transport.UDPTransport`).
+        (DEFAULT: ``"tcp"``)
+
+    port: `int`, optional
+        Port the motor is serving SCL on.  If `None`, then Applied
+        Motion's default port for the ``transport`` is used, i.e.
+        ``7776`` for TCP and ``7775`` for UDP. (DEFAULT: `None`)
+
     Examples
     --------
 
@@ -415,6 +476,13 @@ class Motor(EventActor):
             recv_processor=float,
             two_way=True,
         ),
+        "immediate_format": CommandEntry(
+            "immediate_format",
+            send="IF",
+            send_processor=lambda value: f"{value}".upper(),
+            recv=re.compile(r"IF=(?P<return>[DH])"),
+            two_way=True,
+        ),
         "jog_acceleration": CommandEntry(
             "jog_acceleration",
             send="JA",
@@ -466,10 +534,21 @@ class Motor(EventActor):
             recv_processor=int,
             two_way=True,
         ),
+        "queue_load_execute": CommandEntry(
+            "queue_load_execute",
+            send="QX",
+            send_processor=lambda segment: f"{int(segment)}",
+        ),
+        "queue_save": CommandEntry(
+            "queue_save",
+            send="QS",
+            send_processor=lambda segment: f"{int(segment)}",
+            buffered=False,
+        ),
         "request_status": CommandEntry(
             "request_status",
             send="RS",
-            recv=re.compile(r"RS=(?P<return>[ADEFHJMPRSTW]+)"),
+            recv=re.compile(r"RS=(?P<return>[ADEFHJMPQRSTW]+)"),
             buffered=False,
         ),
         "reset_currents": CommandEntry(
@@ -536,6 +615,12 @@ class Motor(EventActor):
             two_way=True,
             units=u.steps,
         ),
+        "wait_time": CommandEntry(
+            "wait_time",
+            send="WT",
+            send_processor=lambda value: f"{float(value):.2f}",
+            units=u.s,
+        ),
         "zero": CommandEntry(
             "zero",
             send="",
@@ -544,6 +629,15 @@ class Motor(EventActor):
         ),
     }  # type: Dict[str, Optional[Dict[str, Any]]]
 
+    #: compiled version of :attr:`_commands` used to send commands and
+    #: parse replies
+    _command_specs = {
+        name: _CommandSpec.from_entry(name, entry) for name, entry in _commands.items()
+    }  # type: Dict[str, _CommandSpec]
+
+    #: acknowledgements, keyed by the last character of the reply
+    _ack_replies = {"%": AckFlags.ACK, "*": AckFlags.ACK_QUEUED}
+
     #: mapping of motor alarm codes to their descriptive message (specific to STM motors)
     _alarm_codes = {
         1: "position limit [Drive Fault]",
@@ -585,6 +679,41 @@ class Motor(EventActor):
 
     ack_flags = AckFlags
 
+    #: Applied Motion's default SCL port for each transport type
+    _default_ports = {"tcp": 7776, "udp": 7775}
+
+    #: commands that change the motor configuration when sent with an
+    #: argument, which invalidates the configuration of a pooled
+    #: connection
+    _configuration_commands = frozenset(
+        {
+            "acceleration",
+            "current",
+            "deceleration",
+            "define_limits",
+            "idle_current",
+            "immediate_format",
+            "jog_acceleration",
+            "jog_deceleration",
+            "jog_speed",
+            "protocol",
+            "speed",
+        }
+    )
+
+    #: getter commands whose values are kept in the parameter cache,
+    #: see :attr:`parameters`
+    _parameter_commands = _configuration_commands | {"encoder_resolution", "gearing"}
+
+    #: parameter commands that mirror a key in :attr:`motor`
+    _motor_parameter_keys = {
+        "acceleration": "accel",
+        "deceleration": "decel",
+        "encoder_resolution": "encoder_resolution",
+        "gearing": "gearing",
+        "speed": "speed",
+    }
+
     # TODO: update _heartbeat so the beat happens on the specified HR
     #       interval instead of execution time + HR interval
     # TODO: implement a "jog_by" "FL" "feed to length"
@@ -621,13 +750,26 @@ class Motor(EventActor):
         loop: asyncio.AbstractEventLoop = None,
         auto_run: bool = False,
         parent: Optional["EventActor"] = None,
+        transport: str = "tcp",
+        port: Optional[int] = None,
     ):
 
         self._heartbeat_task = []
 
         self._setup = self._setup_defaults.copy()
+        if transport not in self._default_ports:
+            raise ValueError(
+                f"Expected 'transport' to be one of "
+                f"{tuple(self._default_ports.keys())}, got '{transport}'."
+            )
+        self._setup["transport_type"] = transport
+        self._setup["port"] = self._default_ports[transport] if port is None else port
         self._motor = self._motor_defaults.copy()
         self._status = self._status_defaults.copy()
+        self._connection_health = self._connection_health_defaults.copy()
+        self._reconnect_at = None  # type: Optional[float]
+        self._configuration_dirty = True
+        self._parameters = {}  # type: Dict[str, Any]
         self._limit_mode = limit_mode
         if isinstance(current, float) and 0.0 < current <= 1.0:
             self._motor["DEFAULTS"]["current"] = current
@@ -638,6 +780,13 @@ class Motor(EventActor):
         self.ip = ip
 
         self._pause_heartbeat = False
+        self._connecting = False
+        self._stop_waiters = []  # type: List[asyncio.Future]
+        self._move_eta = None  # type: Optional[float]
+        self._move_started_at = None  # type: Optional[float]
+        self._heartbeat_wake = None  # type: Optional[asyncio.Event]
+        self._status_poller = None
+        self._shutdown_task = None  # type: Optional[asyncio.Task]
 
         try:
             super().__init__(
@@ -683,14 +832,59 @@ class Motor(EventActor):
         else:
             self.motor["define_limits"] = self._limit_mode
 
+        if self._startup_deferred:
+            # an ancestor actor connects all of its motors concurrently,
+            # see bapsf_motion.actors.startup
+            return None
+        elif self._submissions.in_loop_thread():
+            # the motor is spawned from within its running event loop,
+            # which can not be blocked on the startup, so start up in
+            # the background
+            self.tasks.append(self.loop.create_task(self._background_startup_async()))
+            return None
+
         try:
-            self.connect()
+            self._run_coroutine(self._startup_async(), timeout=None)
         except ConnectionError:
             return None
 
-        self._configure_motor()
-        self._get_motor_parameters()
-        self.send_command("retrieve_motor_status")
+    async def _startup_async(self):
+        """
+        Coroutine_ to connect to the motor, configure it, and retrieve
+        its parameters and initial status.
+
+        Raises
+        ------
+        ConnectionError
+            If the connection to the motor could not be established.
+        """
+        # connecting configures the motor and retrieves its parameters
+        await self._connect_async()
+        await self._retrieve_motor_status_async()
+
+    async def _background_startup_async(self):
+        """
+        Coroutine_ to run :meth:`_startup_async` as a task of the
+        `event loop`_, the motor is left disconnected if the connection
+        can not be established.
+        """
+        try:
+            await self._startup_async()
+        except ConnectionError:
+            return None
+
+    @property
+    def _startup_deferred(self) -> bool:
+        """
+        `True` if an ancestor actor is spawning its motors and will
+        connect to them concurrently once they are all spawned.
+        """
+        parent = self.parent
+        while parent is not None:
+            if getattr(parent, "_defer_motor_startup", False):
+                return True
+            parent = parent.parent
+        return False
 
     def _initialize_tasks(self):
         # The heartbeat task was initialized in _configure_before_run
@@ -729,11 +923,18 @@ class Motor(EventActor):
             "loop": None,
             "thread": None,
             "socket": None,
+            "transport": None,
+            "transport_type": "tcp",
             "tasks": None,
             "max_connection_attempts": 1,
             "heartrate": _HeartRate(),  # in seconds
+            "reconnect_backoff": _ReconnectBackoff(),  # in seconds
             "port": 7776,  # 7776 is Applied Motion's TCP port, 7775 is the UDP port
             "local_address": None,
+            "batched_status_poll": True,
+            "alarm_on_flag": False,
+            "adaptive_heartbeat": True,
+            "connection_pool": connection_pool,
         }
 
     @property
@@ -749,6 +950,7 @@ class Motor(EventActor):
             "thread": self.thread,
             "tasks": self.tasks,
             "socket": self.socket,
+            "transport": self.transport,
         }
         self._setup = _setup
         return self._setup
@@ -769,7 +971,9 @@ class Motor(EventActor):
                 "idle_current": 0.3,  # 30% of current
                 "current": 0.8,  # 80% of max_current (4.0 amps)
                 "max_idle_current": 0.9,  # 90% of current
-                "max_current": 5.0  # 5 amps
+                "max_current": 5.0,  # 5 amps
+                "min_speed": 0.0042,  # rev/s
+                "min_accel": 0.167,  # rev/s/s
             },
             "speed": None,
             "accel": None,
@@ -810,6 +1014,7 @@ class Motor(EventActor):
             "jogging": None,
             "motion_in_progress": None,
             "in_position": None,
+            "q_program": None,
             "stopping": None,
             "waiting": None,
             "limit": {
@@ -824,6 +1029,115 @@ class Motor(EventActor):
         # TODO: dictionary keys and explanations to the docstring
         return self._status
 
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """
+        Cache of the motor parameters (e.g. ``"gearing"``, ``"speed"``,
+        ``"current"``), keyed by command name.  The cache is filled
+        when the parameters are read from the motor, updated when a
+        parameter is successfully set, and cleared when the connection
+        is re-established or the motor raises an alarm.  Getter
+        commands for a cached parameter are answered from the cache,
+        unless ``refresh=True`` is given to :meth:`send_command`.
+        """
+        return self._parameters.copy()
+
+    def _invalidate_parameters(self):
+        """Clear the parameter cache, see :attr:`parameters`."""
+        self._parameters.clear()
+
+    def _cache_parameter(self, command: str, args: Tuple[Any, ...], rtn: Any):
+        """
+        Update the parameter cache (see :attr:`parameters`) with the
+        response ``rtn`` of ``command`` sent with arguments ``args``.
+        """
+        if command not in self._parameter_commands:
+            return
+
+        if len(args) == 0 and not isinstance(rtn, self.ack_flags):
+            value = rtn
+        elif len(args) and rtn in (self.ack_flags.ACK, self.ack_flags.ACK_QUEUED):
+            # the motor stores the value as it was formatted for the command
+            spec = self._command_specs[command]
+            try:
+                value = spec.recv_processor(spec.send_processor(args[0]))
+            except (TypeError, ValueError):
+                self._parameters.pop(command, None)
+                return
+
+            if spec.units is not None:
+                value = value * spec.units
+        else:
+            # the parameter value on the motor is unknown
+            self._parameters.pop(command, None)
+            return
+
+        self._parameters[command] = value
+        if command in self._motor_parameter_keys:
+            self._motor[self._motor_parameter_keys[command]] = value
+
+    def refresh_parameters(self):
+        """
+        Re-read the motor parameters from the motor, bypassing the
+        parameter cache (see :attr:`parameters`).
+        """
+        return self._run_coroutine(self._get_motor_parameters_async(refresh=True))
+
+    @property
+    def _connection_health_defaults(self) -> Dict[str, Any]:
+        """Default values for :attr:`connection_health`."""
+        return {
+            "connected_since": None,
+            "disconnected_since": None,
+            "connects": 0,
+            "reconnects": 0,
+            "failed_attempts": 0,
+            "last_error": None,
+            "last_error_time": None,
+        }
+
+    @property
+    def connection_health(self) -> Dict[str, Any]:
+        """
+        Health metrics of the connection to the motor.
+
+        Keys are:
+
+        * ``"uptime"``: seconds since the connection was (re-)established,
+          ``0.0`` if not connected
+        * ``"connected_since"`` / ``"disconnected_since"``: time
+          (`time.time`) the connection was last established / lost
+        * ``"connects"``: number of times the connection was established
+        * ``"reconnects"``: number of times the connection was
+          re-established after the first connection
+        * ``"failed_attempts"``: number of consecutive failed
+          connection attempts
+        * ``"last_error"`` / ``"last_error_time"``: message and time
+          (`time.time`) of the last communication error
+        * ``"next_attempt_in"``: seconds until the next background
+          reconnect attempt, `None` if none is scheduled
+        """
+        health = self._connection_health.copy()
+
+        since = health["connected_since"]
+        health["uptime"] = (
+            time.time() - since if self.connected and since is not None else 0.0
+        )
+
+        health["next_attempt_in"] = (
+            None
+            if self._reconnect_at is None or self.connected
+            else max(self._reconnect_at - time.monotonic(), 0.0)
+        )
+        return health
+
+    def _record_connection_error(self, err: Union[BaseException, str]):
+        """Record ``err`` as the last error in :attr:`connection_health`."""
+        if isinstance(err, BaseException):
+            err = f"{err.__class__.__name__}: {err}"
+
+        self._connection_health.update(last_error=err, last_error_time=time.time())
+
     def _lost_connection(self, rtn: Any = None):
         """
         Check if the motor connection was lost by examining the return
@@ -842,28 +1156,31 @@ class Motor(EventActor):
         This configuration should be performed during object
         instantiation and upon re-connecting.
         """
+        return self._run_coroutine(self._configure_motor_async(), timeout=None)
+
+    async def _configure_motor_async(self):
+        """A coroutine_ version of :meth:`_configure_motor`."""
         # ensure motor always sends Ack/Nack
         # - Needs to be set before any commands are sent, otherwise
         #   receiving will time out and throw an Exception on commands
         #   that do not return a reply
-        self._read_and_set_protocol()
-
-        # enable limit switches if present...end-of-travel limit occurs when an
-        # input is closed (energized)
-        # TODO: Replace with normal send_command when "define_limits" command
-        #       is added to _commands dict
-        self.send_command("define_limits", self.motor["define_limits"])
-
-        # set format of immediate commands to decimal
-        self._send_raw_command("IFD")
-
-        # set a slower speed
-        self.send_command("speed", 4.0)
-        self.send_command("jog_speed", 4.0)
-
-        # set currents
-        self.send_command("set_current", self.motor["DEFAULTS"]["current"])
-        self.send_command("set_idle_current", self.motor["DEFAULTS"]["idle_current"])
+        await self._read_and_set_protocol_async()
+
+        # the remaining configuration is pipelined into one round trip
+        curr, idle_curr = self._default_currents()
+        await self._send_commands_async(
+            # enable limit switches if present...end-of-travel limit occurs
+            # when an input is closed (energized)
+            ("define_limits", self.motor["define_limits"]),
+            # set format of immediate commands to decimal
+            ("immediate_format", "D"),
+            # set a slower speed
+            ("speed", 4.0),
+            ("jog_speed", 4.0),
+            # set currents
+            ("current", curr),
+            ("idle_current", idle_curr),
+        )
 
     def _read_and_set_protocol(self):
         """
@@ -886,7 +1203,11 @@ class Motor(EventActor):
         bit 7 = Little/Big Endian in Modbus Mode
         bit 8 =Full Duplex in RS-422
         """
-        rtn = self.send_command("protocol")
+        return self._run_coroutine(self._read_and_set_protocol_async())
+
+    async def _read_and_set_protocol_async(self):
+        """A coroutine_ version of :meth:`_read_and_set_protocol`."""
+        rtn = await self._send_command_async("protocol")
         if self._lost_connection(rtn) or rtn == self.ack_flags.MALFORMED:
             return
         _bits = f"{rtn:09b}"
@@ -899,13 +1220,16 @@ class Motor(EventActor):
             _bits = "".join(_bits)
             _bits = int(_bits, 2)
 
-            self.send_command("protocol", _bits)
-
             # if Ack/Nack was not set to begin with, then the first protocol
-            # setting will not have an Ack/Nack return.  Thus, lets retrieve
-            # the protocol again.
+            # setting will not have an Ack/Nack return.  Thus, do not wait
+            # on a reply and retrieve the protocol again.
             #
-            rtn = self.send_command("protocol")
+            try:
+                self.transport.send(self._process_command("protocol", _bits))
+            except (AttributeError, ConnectionError):
+                # Note: AttributeError for when self.transport is None
+                return
+            rtn = await self._send_command_async("protocol", refresh=True)
             if self._lost_connection(rtn) or rtn == self.ack_flags.MALFORMED:
                 return
             _bits = f"{rtn:09b}"
@@ -931,14 +1255,20 @@ class Motor(EventActor):
 
     def _get_motor_parameters(self):
         """Get current motor parameters."""
+        return self._run_coroutine(self._get_motor_parameters_async())
+
+    async def _get_motor_parameters_async(self, refresh: bool = False):
+        """A coroutine_ version of :meth:`_get_motor_parameters`."""
+        rtn = await self._send_commands_async(
+            "gearing",
+            "encoder_resolution",
+            "speed",
+            "acceleration",
+            "deceleration",
+            refresh=refresh,
+        )
         self._motor.update(
-            {
-                "gearing": self.send_command("gearing"),
-                "encoder_resolution": self.send_command("encoder_resolution"),
-                "speed": self.send_command("speed"),
-                "accel": self.send_command("acceleration"),
-                "decel": self.send_command("deceleration"),
-            }
+            dict(zip(("gearing", "encoder_resolution", "speed", "accel", "decel"), rtn))
         )
 
     @property
@@ -964,12 +1294,21 @@ class Motor(EventActor):
 
     @property
     def config(self) -> Dict[str, Any]:
-        return {
+        _config = {
             "name": self.name,
             "ip": self.ip,
             "limit_mode": self.motor["define_limits"],
             "current": self.motor["DEFAULTS"]["current"],
         }
+
+        # only include the transport settings if they are not the defaults
+        transport_type = self._setup["transport_type"]
+        if transport_type != "tcp":
+            _config["transport"] = transport_type
+        if self.port != self._default_ports[transport_type]:
+            _config["port"] = self.port
+
+        return _config
     config.__doc__ = EventActor.config.__doc__
 
     @property
@@ -979,6 +1318,12 @@ class Motor(EventActor):
         motor checks.  There are two different heartrates:
         (1) ``heartrate.base`` for when the motor is not moving, and
         (2) ``heartrate.active`` for when the motor is moving.
+
+        If ``setup["adaptive_heartbeat"]`` is `True` and the duration
+        of a move is known (see :meth:`move_to`), then the motor is
+        checked sparsely (at most every ``heartrate.BASE``) until
+        shortly before the move's predicted end, and then every
+        ``heartrate.FINE`` until the move finishes.
         """
         return self._setup["heartrate"]
 
@@ -997,18 +1342,30 @@ class Motor(EventActor):
         return self._setup["port"]
 
     @property
-    def socket(self) -> socket.socket:
+    def socket(self) -> Union[socket.socket, None]:
         """Instance of the socket used for motor communication."""
-        return self._setup["socket"]
+        if self.transport is None:
+            return None
+        return self.transport.socket
+
+    @property
+    def transport(self) -> Union[BaseTransport, None]:
+        """
+        Instance of the `~bapsf_motion.actors.transport.BaseTransport`
+        used for motor communication.
+        """
+        return self._setup["transport"]
 
-    @socket.setter
-    def socket(self, value):
-        if not isinstance(value, socket.socket) and value is not None:
-            raise TypeError(f"Expected type {socket.socket}, got type {type(value)}.")
+    @transport.setter
+    def transport(self, value):
+        if not isinstance(value, BaseTransport) and value is not None:
+            raise TypeError(
+                f"Expected type {BaseTransport}, got type {type(value)}."
+            )
 
-        self._setup["socket"] = value
+        self._setup["transport"] = value
         if value is not None:
-            self._setup["local_address"] = value.getsockname()
+            self._setup["local_address"] = value.local_address
 
     @property
     def is_moving(self) -> bool:
@@ -1092,6 +1449,31 @@ class Motor(EventActor):
         ):
             self.heartbeat_task = self.loop.create_task(self._heartbeat())
 
+    @property
+    def status_poller(self):
+        """
+        The `~bapsf_motion.actors.poller.StatusPoller` polling the motor
+        status in place of the motor's own heartbeat, `None` if the
+        heartbeat polls the status.
+        """
+        return self._status_poller
+
+    def _set_status_poller(self, poller):
+        """
+        Hand the status polling over to ``poller``, or back to the
+        motor's heartbeat if ``poller`` is `None`.  Should only be used
+        by `~bapsf_motion.actors.poller.StatusPoller`.
+        """
+        self._status_poller = poller
+
+        # wake the heartbeat so it yields to (or resumes from) the poller
+        if self._heartbeat_wake is None:
+            pass
+        elif self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._heartbeat_wake.set)
+        else:
+            self._heartbeat_wake.set()
+
     def _update_status(self, **values):
         """
         Update ``self._status` dictionary with the given arguments ``**values``.
@@ -1108,62 +1490,142 @@ class Motor(EventActor):
         ):
             # connection status changed
             if new_status["connected"]:
+                self._connection_health["connected_since"] = time.time()
                 self.signals.connection_established.emit()
             else:
+                self._connection_health["disconnected_since"] = time.time()
                 self.signals.connection_lost.emit()
 
         self._status = new_status
         self.signals.status_changed.emit()
 
+    def _run_coroutine(
+        self,
+        coro: Awaitable,
+        thread_id: Optional[int] = None,
+        timeout: Optional[float] = -1,
+    ):
+        """
+        Run the coroutine_ ``coro`` to completion in the actor's
+        `event loop`_ and return its result.  See
+        :meth:`EventActor._run_coroutine() <bapsf_motion.actors.base.EventActor._run_coroutine>`
+        for details.  If ``timeout`` is negative, then the result is
+        waited on for ``3 * heartrate.BASE`` seconds.  (DEFAULT: ``-1``)
+        """
+        if timeout is not None and timeout < 0:
+            timeout = 3 * self.heartrate.BASE
+
+        return super()._run_coroutine(coro, thread_id=thread_id, timeout=timeout)
+
     def connect(self):
         """
         Open the ethernet connection to the motor.  The number of
         reconnection attempts before an exception is raised is defined
         by ``self._setup["max_connection_attempts"]``.
         """
-        if not isinstance(self.socket, socket.socket):
-            # socket has not been created yet, self.socket is likely None
+        return self._run_coroutine(self._connect_async(), timeout=None)
+
+    async def _connect_async(self):
+        """A coroutine_ version of :meth:`connect`."""
+        if self._connecting:
+            # a connection attempt (including the motor configuration that
+            # follows it) is already in progress, do not start a nested one
+            raise ConnectionError("Connection attempt already in progress.")
+
+        self._connecting = True
+        try:
+            await self._connect()
+        finally:
+            self._connecting = False
+
+    async def _connect(self):
+        # the body of _connect_async(), which guards against re-entry
+        if not isinstance(self.transport, BaseTransport):
+            # transport has not been created yet, self.transport is likely None
             pass
 
-        elif self._lost_connection():
-            # connection to motor was lost, ensure the socket is closed before
-            # trying to re-establish connection
-            self.socket.shutdown(socket.SHUT_RDWR)
-            self.socket.close()
-            self.socket = None
+        elif self._lost_connection() or not self.transport.is_open:
+            # connection to motor was lost, ensure the transport is closed
+            # before trying to re-establish connection
+            self.transport.close()
+            self.transport = None
         else:
             # all is currently good, will not know if connection is lost
             # until the next command send attempt
             return None
 
+        self._invalidate_parameters()
+
+        pooled = self._acquire_pooled_connection()
+        if pooled is None:
+            await self._open_transport_async()
+        else:
+            self.logger.info(f"Reusing pooled connection to {self.ip}:{self.port}.")
+            pooled.transport.logger = self.logger
+            self.transport = pooled.transport
+            self._update_status(connected=True)
+
+        if pooled is not None and pooled.configuration == self._configuration_key:
+            # the motor was already configured over this connection, so
+            # the parameters are answered by the pooled parameter cache
+            self._parameters.update(pooled.parameters)
+            await self._read_and_set_protocol_async()
+        else:
+            await self._configure_motor_async()
+
+        await self._get_motor_parameters_async()
+
+        health = self._connection_health
+        if not self.connected:
+            # the motor accepted the connection, but dropped it again
+            # before it could be configured
+            health["failed_attempts"] += 1
+            return None
+
+        if health["connects"] > 0:
+            health["reconnects"] += 1
+        health["connects"] += 1
+        health["failed_attempts"] = 0
+        self._reconnect_at = None
+        self._configuration_dirty = False
+
+    async def _open_transport_async(self):
+        """
+        :ref:`Coroutine <coroutine>` to open a new transport to the
+        motor.  The number of attempts before an exception is raised is
+        defined by ``self._setup["max_connection_attempts"]``.
+        """
         _allowed_attempts = self._setup["max_connection_attempts"]
         for _count in range(_allowed_attempts):
             try:
                 msg = f"Connecting to {self.ip}:{self.port} ..."
                 self.logger.info(msg)
 
-                socket.setdefaulttimeout(1)
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(1)  # 1 second timeout
-                s.connect((self.ip, self.port))
+                if self._setup["transport_type"] == "udp":
+                    transport = UDPTransport(
+                        self.ip, self.port, logger=self.logger
+                    )
+                else:
+                    transport = TCPTransport(
+                        self.ip, self.port, timeout=1, logger=self.logger
+                    )
+                await transport.open()
 
                 msg = "...SUCCESS!!!"
                 self.logger.info(msg)
-                self.socket = s
+                self.transport = transport
                 self._update_status(connected=True)
 
                 # connection established, break for-loop
                 break
-            except (
-                ConnectionError,
-                OSError,
-            ) as err:
+            except ConnectionError as err:
                 # Note:
-                #   - All types of connection errors are subclasses of
-                #     ConnectionError
-                #   - TimeoutError, InterruptError, and socket.timeout
-                #     are all subclasses of OSError
+                #   - the transport converts timeouts and all OSErrors
+                #     into a ConnectionError
                 #
+                self._connection_health["failed_attempts"] += 1
+                self._record_connection_error(err)
+
                 msg = f"...attempt {_count+1} of {_allowed_attempts} failed"
                 if _count+1 < _allowed_attempts:
                     self.logger.warning(msg)
@@ -1180,15 +1642,95 @@ class Motor(EventActor):
                         "Connection to motor could not be established."
                     )
 
-        if self.loop is not None:
-            self._configure_motor()
-            self._get_motor_parameters()
+    def _acquire_pooled_connection(self) -> Optional[PooledConnection]:
+        """
+        Take an idle connection to the motor out of the
+        ``setup["connection_pool"]``, `None` if there is none.
+        """
+        pool = self._setup["connection_pool"]
+        if not isinstance(pool, ConnectionPool):
+            return None
+
+        transport_type = (
+            UDPTransport if self._setup["transport_type"] == "udp" else TCPTransport
+        )
+        return pool.acquire(self.ip, self.port, transport_type, self.loop)
+
+    def _release_transport(self, pool: bool = True):
+        """
+        Hand the transport over to the ``setup["connection_pool"]``, so
+        the next motor spawned for the same ``(ip, port)`` can take it
+        over.  If ``pool`` is `False`, pooling is disabled, or the
+        motor is not connected, then the transport is closed instead.
+        """
+        transport = self.transport
+        if transport is None:
+            return
+
+        self.transport = None
+        connection_pool_ = self._setup["connection_pool"]
+        if not pool or not self.connected or not isinstance(
+            connection_pool_, ConnectionPool
+        ):
+            transport.close()
+            return
+
+        configuration = None if self._configuration_dirty else self._configuration_key
+        connection_pool_.release(
+            transport, configuration=configuration, parameters=self._parameters
+        )
+
+    @property
+    def _configuration_key(self) -> Tuple[Any, ...]:
+        """
+        The values :meth:`_configure_motor` configures the motor with,
+        which identify the configuration of a pooled connection.
+        """
+        return (self.motor["define_limits"], *self._default_currents())
 
     def _send_command(self, command, *args):
         """
         A low level method for sending commands to the motor, and
         receiving the response.
         """
+        return self._run_coroutine(self._send_command_async(command, *args))
+
+    async def _send_command_async(
+        self, command: str, *args, refresh: bool = False, raw: bool = False
+    ):
+        """A coroutine_ version of :meth:`_send_command`."""
+        if self._command_specs[command].method_command:
+            # execute respectively named coroutine
+            meth = getattr(self, f"_{command}_async", None)
+            if meth is None:
+                self.logger.error(
+                    f"Method command '{command}' does not have a coroutine "
+                    f"version and can not be sent from within the event loop."
+                )
+                return self.ack_flags.NACK
+            return await meth(*args)
+
+        rtn = await self._send_commands_async(
+            (command, *args), refresh=refresh, raw=raw
+        )
+        return rtn[0]
+
+    async def _send_commands_async(
+        self,
+        *commands: Union[str, Tuple[Any, ...]],
+        refresh: bool = False,
+        raw: bool = False,
+    ) -> List[Any]:
+        """
+        A coroutine_ version of :meth:`send_commands`.  If ``raw`` is
+        `True`, then numeric replies are returned as plain numbers
+        instead of `~astropy.units.Quantity`, and the parameter cache is
+        bypassed.  Intended for internal hot paths (e.g. the heartbeat).
+        """
+        commands = [
+            (cmd,) if isinstance(cmd, str) else tuple(cmd) for cmd in commands
+        ]
+
         if self.loop.is_running() and (
             self.heartbeat_task is None
             or self.heartbeat_task.done()
@@ -1196,30 +1738,155 @@ class Motor(EventActor):
         ):
             self.start_heartbeat()
 
-        cmd_str = self._process_command(command, *args)
-        recv_str = cmd_str if "?" in cmd_str else self._send_raw_command(cmd_str)
+        results = [None] * len(commands)  # type: List[Any]
+        requests = []  # type: List[Tuple[int, str, Callable[[str], bool], bool]]
+        for ii, (command, *args) in enumerate(commands):
+            if self._command_specs[command].method_command:
+                self.logger.error(
+                    f"Method command '{command}' can not be sent as part of "
+                    f"a pipelined batch of commands."
+                )
+                results[ii] = self.ack_flags.NACK
+                continue
+            elif (
+                not (refresh or raw)
+                and len(args) == 0
+                and command in self._parameters
+            ):
+                # answered by the parameter cache
+                results[ii] = self._parameters[command]
+                continue
 
-        if self._lost_connection(recv_str):
-            self.logger.error(
-                f"Motor communication issue...Last command '{command}' returned "
-                f"message: '{recv_str}'.",
+            if len(args) and command in self._configuration_commands:
+                self._configuration_dirty = True
+
+            cmd_str = self._process_command(command, *args)
+            if "?" in cmd_str:
+                # command was rejected during processing
+                results[ii] = self._process_command_return_string(command, cmd_str)
+                continue
+
+            # queries can safely be re-sent if their reply is lost
+            retry_safe = len(args) == 0 and self._command_specs[command].recv is not None
+            requests.append(
+                (ii, cmd_str, self._reply_matcher(command, *args), retry_safe)
             )
-            return self.ack_flags.LOST_CONNECTION
 
-        _rtn = self._process_command_return(command, *args, recv_str=recv_str)
+        replies = await self._exchange_async([request[1:] for request in requests])
 
-        return _rtn
+        for (ii, *_), recv_str in zip(requests, replies):
+            command = commands[ii][0]
+            if self._lost_connection(recv_str):
+                self.logger.error(
+                    f"Motor communication issue...Last command '{command}' "
+                    f"returned message: '{recv_str}'.",
+                )
+                results[ii] = self.ack_flags.LOST_CONNECTION
+                continue
 
-    async def _send_command_async(self, command: str, *args):
-        """A coroutine_ version of :meth:`_send_command`."""
-        return self._send_command(command, *args)
+            results[ii] = self._process_command_return_string(
+                command, recv_str, raw=raw
+            )
+            if not raw:
+                self._cache_parameter(command, commands[ii][1:], results[ii])
+
+        return results
+
+    def send_commands(
+        self, *commands: Union[str, Tuple[Any, ...]], thread_id=None, refresh=False
+    ) -> List[Any]:
+        """
+        Send several commands to the motor in a single pipelined
+        exchange and receive their responses.  All commands are written
+        to the motor back-to-back and the responses are matched to the
+        commands in order, so the whole batch costs one network round
+        trip instead of one round trip per command.
+
+        Parameters
+        ----------
+        *commands: Union[str, Tuple[Any, ...]]
+            The commands to be sent to the motor, in order.  Each
+            command is either the command name or a `tuple` of the
+            command name followed by its arguments, e.g.
+            ``("target_distance", 2000)``.  Method commands can not
+            be batched.
+        thread_id: int
+            ID of the thread the calling functionality is operating in.
+        refresh: bool
+            If `True`, then getter commands for cached parameters are
+            sent to the motor instead of being answered from
+            :attr:`parameters`. (DEFAULT: `False`)
 
-    def send_command(self, command: str, *args, thread_id=None):
+        Returns
+        -------
+        List[Any]
+            The response for each command, in the same order the
+            commands were given.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            gearing, speed, ack = m1.send_commands(
+                "gearing", "speed", ("jog_speed", 4.0)
+            )
+        """
+        rejected = self._check_commands(commands, refresh)
+        if rejected is not None:
+            return rejected
+
+        return self._run_coroutine(
+            self._send_commands_async(*commands, refresh=refresh), thread_id=thread_id
+        )
+
+    async def asend_commands(
+        self, *commands: Union[str, Tuple[Any, ...]], refresh: bool = False
+    ) -> List[Any]:
+        """
+        An awaitable version of :meth:`send_commands`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        rejected = self._check_commands(commands, refresh)
+        if rejected is not None:
+            return rejected
+
+        return await self._send_commands_async(*commands, refresh=refresh)
+
+    def _check_commands(
+        self, commands: Tuple[Union[str, Tuple[Any, ...]], ...], refresh: bool
+    ) -> Optional[List[Any]]:
+        """
+        Check if the batch ``commands`` can be sent to the motor.
+        Returns `None` if so, and the Nack responses of the rejected
+        batch otherwise.
+        """
+        if self.terminated:
+            raise RuntimeError(
+                f"Can not send commands {commands} to motor, since the "
+                f"motor has been terminated."
+            )
+
+        for cmd in commands:
+            command = cmd if isinstance(cmd, str) else cmd[0]
+            if not refresh and isinstance(cmd, str) and command in self._parameters:
+                # answered by the parameter cache
+                continue
+            elif self.is_moving and self._command_specs[command].buffered:
+                self.logger.warning(
+                    f"Buffered commands ({command}) are disallowed while the "
+                    f"motor is moving, none of the commands were sent."
+                )
+                return [self.ack_flags.NACK] * len(commands)
+
+        return None
+
+    def send_command(self, command: str, *args, thread_id=None, refresh=False):
         """
         Send ``command`` to the motor, and receive its response.  If the
         `event loop`_ is running, then the command will be sent as
-        a threadsafe coroutine_ in the loop.  Otherwise, the command
-        will be sent directly to the motor.
+        a threadsafe coroutine_ in the loop.  Otherwise, the loop will
+        be run until the command is complete.
 
         Parameters
         ----------
@@ -1230,79 +1897,168 @@ class Motor(EventActor):
             motor command.
         thread_id: int
             ID of the thread the calling functionality is operating in.
+        refresh: bool
+            If `True`, then a getter command for a cached parameter is
+            sent to the motor instead of being answered from
+            :attr:`parameters`. (DEFAULT: `False`)
+
+        Raises
+        ------
+        RuntimeError
+            If called from the thread the `event loop`_ is running in,
+            use :meth:`asend_command` there instead.
         """
-        if self.terminated:
-            raise RuntimeError(
-                f"Can not send command {command} to motor, since the "
-                f"motor has been terminated."
-            )
+        if self._command_specs[command].method_command:
+            self._check_command(command, args, refresh)
 
-        if self._commands[command]["method_command"]:
             # execute respectively named method
             meth = getattr(self, command)
             return meth(*args)
 
-        if self.is_moving and self._commands[command]["buffered"]:
-            self.logger.warning(
-                f"Buffered commands ({command}) are disallowed while the "
-                f"motor is moving."
-            )
-            return self.ack_flags.NACK
-
-        if not self.loop.is_running():
-            # event loop not running, just send commands directly
-            return self._send_command(command, *args)
+        answered, rtn = self._check_command(command, args, refresh)
+        if answered:
+            return rtn
 
-        elif (
-            (thread_id is not None and threading.current_thread().ident == thread_id)
-            or (threading.current_thread().ident == self._thread_id)
-        ):
-            # we are in the same thread as the running event loop, only
-            # the event loop should be in this thread so commands should
-            # have been sent from coroutines.  Thus, just send the
-            # command directly.
-            return self._send_command(command, *args)
-
-        # the event loop is running and the command is being sent from
-        # outside the event loop thread
-        future = asyncio.run_coroutine_threadsafe(
-            self._send_command_async(command, *args),
-            self.loop
+        return self._run_coroutine(
+            self._send_command_async(command, *args, refresh=refresh),
+            thread_id=thread_id,
         )
-        return future.result(3 * self.heartrate.BASE)
 
-    def _process_command(self, command: str, *args) -> str:
+    async def asend_command(self, command: str, *args, refresh: bool = False):
         """
-        Process the command ``command`` and any input arguments
-        ``*args`` to and return the full command string.  The
-        argument processor is defined in the class attribute
-        ``self._commands[command]["send_processor"]`` and the base
-        command string is defined at
-        ``self._commands[command]["send"]``.
-
-        Parameters
-        ----------
-        command: str
-            Command to be processed and sent to the motor
-        args
-            Argument for the base command.
-
-        Returns
-        -------
-        str
-            The full command string to be sent to the motor.
+        An awaitable version of :meth:`send_command`, which must be
+        awaited from within the actor's `event loop`_.
 
         Examples
         --------
 
-        >>> self._process_command("speed", 5.5)
-        "VE 5.5000"
+        .. code-block:: python
 
+            speed = await m1.asend_command("speed")
         """
-        cmd_dict = self._commands[command]
-        cmd_str = cmd_dict["send"]
+        answered, rtn = self._check_command(command, args, refresh)
+        if answered:
+            return rtn
+
+        return await self._send_command_async(command, *args, refresh=refresh)
+
+    def _check_command(
+        self, command: str, args: Tuple[Any, ...], refresh: bool
+    ) -> Tuple[bool, Any]:
+        """
+        Check if ``command`` can be answered without sending it to the
+        motor, i.e. from the parameter cache or by rejecting it since
+        the motor is moving.
+
+        Returns
+        -------
+        Tuple[bool, Any]
+            ``(True, response)`` if the command was answered, and
+            ``(False, None)`` if it needs to be sent to the motor.
+        """
+        if self.terminated:
+            raise RuntimeError(
+                f"Can not send command {command} to motor, since the "
+                f"motor has been terminated."
+            )
+
+        spec = self._command_specs[command]
+        if spec.method_command:
+            return False, None
+
+        if not refresh and len(args) == 0 and command in self._parameters:
+            # answered by the parameter cache
+            return True, self._parameters[command]
+
+        if self.is_moving and spec.buffered:
+            self.logger.warning(
+                f"Buffered commands ({command}) are disallowed while the "
+                f"motor is moving."
+            )
+            return True, self.ack_flags.NACK
+
+        return False, None
+
+    def submit(
+        self, command: str, *args, refresh: bool = False
+    ) -> concurrent.futures.Future:
+        """
+        Submit ``command`` to be sent to the motor without waiting on
+        its response.  This can be called from any thread, and a burst
+        of submissions is handed over to the `event loop`_ with a
+        single wakeup (see
+        `~bapsf_motion.actors.submission.SubmissionQueue`).  If the
+        event loop is not running, then the command is sent once the
+        loop is started.
 
-        processor = self._commands[command]["send_processor"]
+        Parameters
+        ----------
+        command: str
+            The desired command to be sent to the motor.
+        *args:
+            Any arguments to the ``command`` that will be sent with the
+            motor command.
+        refresh: bool
+            If `True`, then a getter command for a cached parameter is
+            sent to the motor instead of being answered from
+            :attr:`parameters`. (DEFAULT: `False`)
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the motor's response, i.e. the return of
+            :meth:`send_command`.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            futures = [m1.submit("speed"), m1.submit("get_position")]
+            speed, position = [future.result(1) for future in futures]
+        """
+        answered, rtn = self._check_command(command, args, refresh)
+        if answered:
+            future = concurrent.futures.Future()
+            future.set_result(rtn)
+            return future
+
+        return self._submissions.submit(
+            self._send_command_async(command, *args, refresh=refresh)
+        )
+
+    def _process_command(self, command: str, *args) -> str:
+        """
+        Process the command ``command`` and any input arguments
+        ``*args`` to and return the full command string.  The
+        argument processor is defined in the class attribute
+        ``self._command_specs[command].send_processor`` and the base
+        command string is defined at
+        ``self._command_specs[command].send``.
+
+        Parameters
+        ----------
+        command: str
+            Command to be processed and sent to the motor
+        args
+            Argument for the base command.
+
+        Returns
+        -------
+        str
+            The full command string to be sent to the motor.
+
+        Examples
+        --------
+
+        >>> self._process_command("speed", 5.5)
+        "VE 5.5000"
+
+        """
+        spec = self._command_specs[command]
+        cmd_str = spec.send
+
+        processor = spec.send_processor
         if processor is None:
             # If "send_processor" is None, then it is assumed no values
             # need to be sent with the command.
@@ -1313,8 +2069,7 @@ class Motor(EventActor):
                 )
             return cmd_str
 
-        two_way = cmd_dict.get("two_way", False)
-        if not len(args) and two_way:
+        if not len(args) and spec.two_way:
             # command is being used as a getter instead of a setter
             return cmd_str
         elif not len(args):
@@ -1327,13 +2082,17 @@ class Motor(EventActor):
 
         return cmd_str + processor(args[0])
 
-    def _process_command_return_string(self, command: str, rtn_str: str) -> Any:
+    def _process_command_return_string(
+        self, command: str, rtn_str: str, raw: bool = False
+    ) -> Any:
         """
         Process the returned string from the sent motor command.  The
-        regular expression pattern for matching the returned string
-        is defined in the class attribute
-        ``self._commands[command]["recv"]`` and the argument processor
-        is defined at ``self._commands[command]["recv_processor"]``.
+        reply is dispatched on its form: an Ack (``%``), a queued Ack
+        (``*``), a Nack (``?``), or a data reply starting with the
+        command string.  The regular expression pattern for matching
+        a data reply is defined in the class attribute
+        ``self._command_specs[command].recv`` and the argument processor
+        is defined at ``self._command_specs[command].recv_processor``.
 
         Parameters
         ----------
@@ -1341,13 +2100,16 @@ class Motor(EventActor):
             The command that was sent to the motor.
         rtn_str: str
             The string that was returned by the motor.
+        raw: bool
+            If `True`, then the processed argument is not converted to
+            a `~astropy.units.Quantity`. (DEFAULT: `False`)
 
         Returns
         -------
         Any
             Returns the argument from the motor's response string.  The
             argument type is dependent on the receive processor
-            ``self._commands[command]["recv_processor"]``.
+            ``self._command_specs[command].recv_processor``.
 
         Examples
         --------
@@ -1356,78 +2118,51 @@ class Motor(EventActor):
         5.5
 
         """
+        spec = self._command_specs[command]
 
-        _send_str = self._commands[command]["send"]
+        if not isinstance(rtn_str, str) or not rtn_str:
+            return self._malformed_reply(spec, rtn_str)
 
-        if "%" in rtn_str:
-            # Motor acknowledge and executed command.
-            return self.ack_flags.ACK
-        elif "*" in rtn_str:
-            # Motor acknowledged command and buffered it into the queue
-            return self.ack_flags.ACK_QUEUED
+        ack = self._ack_replies.get(rtn_str[-1])
+        if ack is not None:
+            # Motor acknowledged the command and executed it (%) or
+            # buffered it into the queue (*)
+            return ack
         elif "?" in rtn_str:
             # Motor negatively acknowledge command, error in command
-            err_code = re.compile(
-                r"\d?\?(?P<code>\d{1,2})"
-            ).fullmatch(rtn_str).group("code")
-            err_code = int(err_code)
-            err_msg = f"{err_code} - {self._nack_codes[err_code]}"
+            match = _nack_pattern.fullmatch(rtn_str)
+            if match is None:
+                return self._malformed_reply(spec, rtn_str)
+
+            err_code = int(match.group("code"))
+            err_msg = f"{err_code} - {self._nack_codes.get(err_code, 'Unknown')}"
             self.logger.error(
                 f"Motor returned Nack from command {command} with error: {err_msg}."
             )
             return self.ack_flags.NACK
-        elif not isinstance(rtn_str, str) or _send_str not in rtn_str:
-            self.logger.error(
-                f"The return string for command '{command} ({_send_str})'"
-                f" is malformed, received '{rtn_str}'."
-            )
-            return self.ack_flags.MALFORMED
-
-        recv_pattern = self._commands[command]["recv"]
-        if recv_pattern is not None:
-            rtn_str = recv_pattern.fullmatch(rtn_str).group("return")
-
-        processor = self._commands[command]["recv_processor"]
-        rtn = processor(rtn_str)
-
-        units = self._commands[command]["units"]
-        if units is not None:
-            return rtn * units
-
-        return rtn
-
-    def _process_command_return(self, command: str, *args, recv_str: str) -> Any:
-        _rtn = self._process_command_return_string(command, recv_str)
-
-        if (
-            len(args) == 0
-            and (_rtn == self.ack_flags.ACK or _rtn == self.ack_flags.ACK_QUEUED)
-            and self._commands[command]["recv"] is not None
-        ):
-            # command had NO arguments and expected a response with data
-            # suspecting the command got buffered and acknowledge, and the
-            # real data is coming in a followup communication
-            _rtn = self.ack_flags.MALFORMED
+        elif not rtn_str.startswith(spec.send):
+            return self._malformed_reply(spec, rtn_str)
 
-        if _rtn != self.ack_flags.MALFORMED:
-            return _rtn
+        if spec.recv is not None:
+            match = spec.recv.fullmatch(rtn_str)
+            if match is None:
+                return self._malformed_reply(spec, rtn_str)
+            rtn_str = match.group("return")
 
-        while _rtn == self.ack_flags.MALFORMED:
-            # command and motor buffer have come out of sync
-            #
-            # Note:  this will not be an infinite loop, if the buffer
-            #        size is zero, and we missed the response, then
-            #        socket.recv will issue a TimeoutError and
-            #        self._recv() will exit with an ack_flags.LOST_CONNECTION
+        rtn = spec.recv_processor(rtn_str)
 
-            recv = self._recv()
-            if self._lost_connection(recv):
-                return self.ack_flags.LOST_CONNECTION
+        if raw or spec.units is None:
+            return rtn
 
-            recv_str = recv.decode("ASCII")
-            _rtn = self._process_command_return(command, *args, recv_str=recv_str)
+        return rtn * spec.units
 
-        return _rtn
+    def _malformed_reply(self, spec: _CommandSpec, rtn_str: Any) -> AckFlags:
+        """Log the malformed reply ``rtn_str`` to command ``spec``."""
+        self.logger.error(
+            f"The return string for command '{spec.name} ({spec.send})'"
+            f" is malformed, received '{rtn_str}'."
+        )
+        return self.ack_flags.MALFORMED
 
     def _send_raw_command(self, cmd: str):
         """
@@ -1448,155 +2183,242 @@ class Motor(EventActor):
             The "unmodified" return string from the motor.
 
         """
-        if self._lost_connection():
-            try:
-                self.connect()
-            except ConnectionError:
-                return self.ack_flags.LOST_CONNECTION
-
-        rtn = self._send(cmd)
-        if self._lost_connection(rtn):
-            return self.ack_flags.LOST_CONNECTION
+        return self._run_coroutine(self._send_raw_command_async(cmd))
 
-        rtn = self._recv()
-        if self._lost_connection(rtn):
-            return self.ack_flags.LOST_CONNECTION
+    async def _send_raw_command_async(self, cmd: str):
+        """A coroutine_ version of :meth:`_send_raw_command`."""
+        rtn = await self._exchange_async([(cmd, None, False)])
+        return rtn[0]
 
-        return rtn.decode("ASCII")
-
-    def _send(self, cmd: str):
+    def _reply_matcher(self, command: str, *args) -> Callable[[str], bool]:
         """
-        Low-level functionality to send a command string ``cmd`` to
-        the motor.  Proper headers and end-of-message (eom) blocks are
-        added to the command string.
-
-        Parameters
-        ----------
-        cmd: str
-            The command str to be sent to the motor.
+        Return a callable that identifies the motor's reply to the
+        command ``command`` sent with arguments ``*args``.  Messages
+        not identified as the reply (e.g. the Ack preceding the data
+        of a buffered command) are skipped by the
+        :attr:`transport`.
         """
-        # all messages sent or received over TCP/UDP for Applied Motion Motors
-        # use a byte header b'\x00\x07' and end-of-message b'\r'
-        # (carriage return)
-        _header = b"\x00\x07"
-        _eom = b"\r"  # end of message
+        send_str = self._command_specs[command].send
+        expects_data = len(args) == 0 and self._command_specs[command].recv is not None
 
-        cmd_str = _header + bytes(cmd.encode("ASCII")) + _eom
-        self.logger.debug(f"Sending command string '{cmd_str}'.")
-        try:
-            self.socket.sendall(cmd_str)
-        except (ConnectionError, OSError) as err:
-            self.logger.error(f"Unable to send command {cmd_str}.", exc_info=err)
-            if err.errno == errno.EPIPE:
-                self.logger.error(
-                    "It appears the server (motor) has closed the connection."
-                )
-            elif err.errno == errno.ESHUTDOWN:
-                self.logger.error(
-                    "It appears the socket has been closed."
-                )
-            elif err.errno == errno.EBADF:
-                self.logger.error(
-                    "The socket likely has not been created."
-                )
+        def matcher(msg: str) -> bool:
+            if "?" in msg:
+                # a Nack is always a reply
+                return True
+            elif expects_data:
+                return f"{send_str}=" in msg
 
-            self.logger.info(
-                "Attempting to re-establish connection and send the command "
-                "again."
-            )
+            return "%" in msg or "*" in msg
 
-            self._update_status(connected=False)
-            try:
-                self.connect()
-                self.socket.sendall(cmd_str)
-            except ConnectionError:
-                return self.ack_flags.LOST_CONNECTION
+        return matcher
 
-    def _recv(self) -> AnyStr:
+    async def _exchange_async(
+        self, requests: List[Tuple[str, Optional[Callable[[str], bool]], bool]]
+    ) -> List[Union[str, "AckFlags"]]:
         """
-        Receives messages/strings from the motor.  Proper headers and
-        end-of-message blocks are removed from the received string, and
-        then returned.
+        Low-level coroutine_ to pipeline several command strings to
+        the motor and collect their replies.
+
+        Parameters
+        ----------
+        requests: List[Tuple[str, Optional[Callable[[str], bool]], bool]]
+            A list of ``(command string, reply matcher, retry safe)``
+            entries.  See
+            :meth:`~bapsf_motion.actors.transport.BaseTransport.submit`.
 
         Returns
         -------
-        byte string
-            Trimmed byte string from the motor response.
-
+        List[Union[str, AckFlags]]
+            The reply string for each request, or
+            ``ack_flags.LOST_CONNECTION`` if no reply was received.
         """
-        # all messages sent or received over TCP/UDP for Applied Motion Motors
-        # use a byte header b'\x00\x07' and end-of-message b'\r'
-        # (carriage return)
-        _header = b"\x00\x07"
-        _eom = b"\r"  # end of message
+        if len(requests) == 0:
+            return []
 
-        msg = b""
-        try:
-            while True:
-                data = self.socket.recv(16)
+        if (
+            self._lost_connection()
+            or self.transport is None
+            or not self.transport.is_open
+        ):
+            try:
+                await self._connect_async()
+            except ConnectionError:
+                return [self.ack_flags.LOST_CONNECTION] * len(requests)
 
-                if not data:
-                    break
-                elif not msg and _header in data:
-                    msg = data.split(_header)[1]
-                else:
-                    msg += data
+        try:
+            futures = [self.transport.submit(*request) for request in requests]
+            await self.transport.drain()
+        except (AttributeError, ConnectionError, OSError) as err:
+            # Note: AttributeError for when self.transport is None
+            self.logger.error(
+                f"Unable to send commands {[request[0] for request in requests]}.",
+                exc_info=err,
+            )
+            self._record_connection_error(err)
+            self._update_status(connected=False)
+            if self.transport is not None:
+                self.transport.close()
+            return [self.ack_flags.LOST_CONNECTION] * len(requests)
 
-                if _eom in msg:
-                    msg = msg.split(_eom)[0]
-                    break
+        replies = await asyncio.gather(*futures, return_exceptions=True)
 
-            self.logger.debug(f"Received string '{msg}'.")
-        except TimeoutError as err:
+        errors = [rtn for rtn in replies if isinstance(rtn, BaseException)]
+        if len(errors):
             self.logger.error(
-                f"Unable to receive motor response, likely lost connection.",
-                exc_info=err,
+                "Unable to receive motor response, likely lost connection.",
+                exc_info=errors[0],
             )
-            msg = self.ack_flags.LOST_CONNECTION
+            self._record_connection_error(errors[0])
+
+        if len(errors) and (
+            len(errors) == len(replies) or not self.transport.is_open
+        ):
+            # Note: a transport that can lose individual messages (i.e. UDP)
+            #       only fails the requests that went unanswered, so the
+            #       connection is only considered lost if nothing came back
             self._update_status(connected=False)
 
-        return msg
+        return [
+            self.ack_flags.LOST_CONNECTION if isinstance(rtn, BaseException) else rtn
+            for rtn in replies
+        ]
 
-    def retrieve_motor_status(self, direct_send=False):
+    def retrieve_motor_status(
+        self, direct_send=False, batched=None, alarm_on_flag=None
+    ):
         """
         Retrieve motor status and update ``self._status``.
 
         Parameters
         ----------
         direct_send: bool
-            If `True`, then the motor commands will bypass any active
-            `event loop`_ and be directly sent to the motor.  If
-            `False`, then all motor commands will be routed through the
-            :meth:`send_command` method. (DEFAULT: `False`)
+            Retained for backwards compatibility.  All motor commands
+            are now executed as a single coroutine_ in the
+            `event loop`_, see :meth:`_run_coroutine`.
+            (DEFAULT: `False`)
 
-        """
+        batched: bool, optional
+            If `True`, then the status (``request_status``), position
+            (``get_position``), and alarm (``alarm_reset`` and
+            ``alarm``) commands are pipelined to the motor in a single
+            round trip.  If `False`, then the commands are sent one
+            after the other.  If `None`, then the value of
+            ``setup["batched_status_poll"]`` is used.  (DEFAULT: `None`)
+
+        alarm_on_flag: bool, optional
+            If `True`, then the motor alarm is only reset and retrieved
+            when the status string reports an active alarm (``"A"``),
+            otherwise the alarm status is cleared without querying the
+            motor.  If `None`, then the value of
+            ``setup["alarm_on_flag"]`` is used.  (DEFAULT: `None`)
+
+        """
+        return self._run_coroutine(
+            self._retrieve_motor_status_async(
+                batched=batched, alarm_on_flag=alarm_on_flag,
+            )
+        )
+
+    async def _retrieve_motor_status_async(self, batched=None, alarm_on_flag=None):
+        """A coroutine_ version of :meth:`retrieve_motor_status`."""
         # TODO: How to document all the statuses that get updated with this method?
-        #
-        # this is done so self._heartbeat can directly send commands since
-        # the heartbeat is already running in the event loop
-        send_command = self._send_command if direct_send else self.send_command
-
-        _rtn = send_command("request_status")
-        if isinstance(_rtn, self.ack_flags):
-            if _rtn == self.ack_flags.LOST_CONNECTION:
+        if batched is None:
+            batched = self._setup["batched_status_poll"]
+        if alarm_on_flag is None:
+            alarm_on_flag = self._setup["alarm_on_flag"]
+
+        alarm_rtn = None
+        if not batched:
+            _rtn = await self._send_command_async("request_status")
+            if self._lost_connection(_rtn):
                 return
 
-            _rtn = ""
-            _status = {}
+            pos = await self._send_command_async("get_position", raw=True)
+        elif alarm_on_flag:
+            _rtn, pos = await self._send_commands_async(
+                "request_status", "get_position", raw=True,
+            )
         else:
-            _status = {
+            _rtn, pos, _, alarm_rtn = await self._send_commands_async(
+                "request_status", "get_position", "alarm_reset", "alarm", raw=True,
+            )
+
+        if self._lost_connection(_rtn) or self._lost_connection(pos):
+            return
+
+        _status = self._decode_status(_rtn)
+        if not isinstance(pos, self.ack_flags):
+            # position was read raw, only build a new Quantity if the
+            # position changed
+            old_pos = self._status["position"]
+            if old_pos is None or old_pos.value != pos:
+                _status["position"] = pos * u.steps
+
+        if alarm_rtn is not None:
+            alarm_status = self._decode_alarm(alarm_rtn)
+        elif (
+            alarm_on_flag
+            and not isinstance(_rtn, self.ack_flags)
+            and "A" not in _rtn
+        ):
+            # no active alarm, so there is no need to query the motor
+            alarm_status = {
                 "alarm": False,
-                "enabled": False,
-                "fault": False,
-                "moving": False,
-                "homing": False,
-                "jogging": False,
-                "motion_in_progress": False,
-                "in_position": False,
-                "stopping": False,
-                "waiting": False,
-            }  # null status
-        for letter in _rtn:
+                "alarm_message": "",
+                "limits": {"CCW": False, "CW": False},
+            }
+        else:
+            alarm_status = await self._retrieve_motor_alarm_async(
+                defer_status_update=True,
+            )
+
+        if not isinstance(alarm_status, self.ack_flags):
+            _status.update(alarm_status)
+        elif alarm_status == self.ack_flags.LOST_CONNECTION:
+            return
+
+        if _status.get("alarm") and not self._status["alarm"]:
+            # the motor parameters can not be trusted after an alarm
+            self._invalidate_parameters()
+
+        finished = False
+        if "moving" not in _status:
+            pass
+        elif _status["moving"] and not self._status["moving"]:
+            self.signals.movement_started.emit()
+        elif not _status["moving"] and self._status["moving"]:
+            finished = True
+            self.signals.movement_finished.emit()
+
+        self._update_status(**_status)
+
+        if finished:
+            self._move_eta = None
+            self._resolve_stop_waiters(True)
+
+    def _decode_status(self, rtn: Union[str, "AckFlags"]) -> Dict[str, bool]:
+        """
+        Decode the status string ``rtn`` returned by the
+        ``request_status`` command into a `dict` of status flags.  An
+        empty `dict` is returned if ``rtn`` is an `AckFlags`.
+        """
+        if isinstance(rtn, self.ack_flags):
+            return {}
+
+        _status = {
+            "alarm": False,
+            "enabled": False,
+            "fault": False,
+            "moving": False,
+            "homing": False,
+            "jogging": False,
+            "motion_in_progress": False,
+            "in_position": False,
+            "q_program": False,
+            "stopping": False,
+            "waiting": False,
+        }  # null status
+        for letter in rtn:
             if letter == "A":
                 _status["alarm"] = True
             elif letter in ("D", "R"):
@@ -1613,34 +2435,14 @@ class Motor(EventActor):
                 _status["motion_in_progress"] = True
             elif letter == "P":
                 _status["in_position"] = True
+            elif letter == "Q":
+                _status["q_program"] = True
             elif letter == "S":
                 _status["stopping"] = True
             elif letter in ("T", "W"):
                 _status["waiting"] = True
 
-        pos = send_command("get_position")
-        if not isinstance(pos, self.ack_flags):
-            _status["position"] = pos
-        elif pos == self.ack_flags.LOST_CONNECTION:
-            return
-
-        alarm_status = self.retrieve_motor_alarm(
-            defer_status_update=True,
-            direct_send=direct_send,
-        )
-        if not isinstance(alarm_status, self.ack_flags):
-            _status.update(alarm_status)
-        elif alarm_status == self.ack_flags.LOST_CONNECTION:
-            return
-
-        if "moving" not in _status:
-            pass
-        elif _status["moving"] and not self._status["moving"]:
-            self.signals.movement_started.emit()
-        elif not _status["moving"] and self._status["moving"]:
-            self.signals.movement_finished.emit()
-
-        self._update_status(**_status)
+        return _status
 
     def retrieve_motor_alarm(
             self, defer_status_update=False, direct_send=False
@@ -1655,22 +2457,42 @@ class Motor(EventActor):
             (DEFAULT: `False`)
 
         direct_send: bool
-            If `True`, then the motor commands will bypass any active
-            `event loop`_ and be directly sent to the motor.  If
-            `False`, then all motor commands will be routed through the
-            :meth:`send_command` method. (DEFAULT: `False`)
+            Retained for backwards compatibility.  All motor commands
+            are now executed as a single coroutine_ in the
+            `event loop`_, see :meth:`_run_coroutine`.
+            (DEFAULT: `False`)
 
         Returns
         -------
         Dict[str, Any]
             Alarm status.
         """
-        # this is done so self._heartbeat can directly send commands since
-        # the heartbeat is already running in the event loop
-        send_command = self._send_command if direct_send else self.send_command
+        return self._run_coroutine(
+            self._retrieve_motor_alarm_async(
+                defer_status_update=defer_status_update,
+            )
+        )
 
-        send_command("alarm_reset")
-        rtn = send_command("alarm")
+    async def _retrieve_motor_alarm_async(
+        self, defer_status_update=False
+    ) -> Union[Dict[str, Any], "AckFlags"]:
+        """A coroutine_ version of :meth:`retrieve_motor_alarm`."""
+        _, rtn = await self._send_commands_async("alarm_reset", "alarm")
+        alarm_status = self._decode_alarm(rtn)
+
+        if not defer_status_update and not isinstance(alarm_status, self.ack_flags):
+            self._update_status(**alarm_status)
+
+        return alarm_status
+
+    def _decode_alarm(
+        self, rtn: Union[str, "AckFlags"]
+    ) -> Union[Dict[str, Any], "AckFlags"]:
+        """
+        Decode the alarm code string ``rtn`` returned by the ``alarm``
+        command into the alarm status.  If ``rtn`` is an `AckFlags`,
+        then it is returned unchanged.
+        """
         if isinstance(rtn, self.ack_flags):
             return rtn
 
@@ -1701,9 +2523,6 @@ class Motor(EventActor):
             },
         }
 
-        if not defer_status_update:
-            self._update_status(**alarm_status)
-
         return alarm_status
 
     def enable(self):
@@ -1733,10 +2552,15 @@ class Motor(EventActor):
             if self.terminated:
                 # Motor is terminated or being terminated, so end the coroutine
                 # immediately so the associated Task can be cancelled/stopped.
-                continue
+                return
             elif self._pause_heartbeat:
                 await asyncio.sleep(self.heartrate.PAUSE)
                 continue
+            elif self._status_poller is not None:
+                # the status is polled by a StatusPoller, sleep until
+                # the motor is released from the poller
+                await self._heartbeat_sleep(None)
+                continue
             elif not self.connected:
                 heartrate = self.heartrate.SEARCHING
             elif self.is_moving:
@@ -1750,55 +2574,273 @@ class Motor(EventActor):
                 )
                 beats = 0
 
-            if self.connected:
-                self.retrieve_motor_status(direct_send=True)
-            else:
-                self.logger.info("Motor connection lost...trying to reconnect.")
-                # Keep sending kill until the motor comes back online.  This will
-                # ensure the motor is stopped and the buffer (queue) is empty, so
-                # we can continue "safely" with new commands.
-                self._send_command("kill")
-
+            delay = await self._beat_async()
             beats += 1
             old_HR = heartrate
-            await asyncio.sleep(heartrate)
+
+            await self._heartbeat_sleep(delay)
+
+    async def _beat_async(self) -> float:
+        """
+        :ref:`Coroutine <coroutine>` for a single beat of the heartbeat,
+        i.e. retrieve the motor status or try to re-establish the
+        connection.  Returns the time (in seconds) until the next beat
+        is due.
+        """
+        if self._connecting:
+            # let the in-progress connection attempt finish
+            pass
+        elif self.connected:
+            await self._retrieve_motor_status_async()
+        else:
+            delay = await self._reconnect_async()
+            if not self.connected:
+                return delay
+
+        if not self.connected:
+            return self.heartrate.SEARCHING
+        elif self.is_moving:
+            # the status may have just changed to moving
+            return self._moving_heartrate()
+
+        return self.heartrate.BASE
+
+    async def _reconnect_async(self) -> float:
+        """
+        :ref:`Coroutine <coroutine>` for trying to re-establish the lost
+        connection to the motor.  Consecutive failed attempts are
+        spaced out with an exponential backoff (with jitter), as
+        defined by ``setup["reconnect_backoff"]``, so an unreachable
+        motor does not keep the shared `event loop`_ busy.  Returns the
+        time (in seconds) until the next attempt is due.
+        """
+        if self._reconnect_at is not None:
+            remaining = self._reconnect_at - time.monotonic()
+            if remaining > 0:
+                # still backing off from the last failed attempt
+                return remaining
+
+        self.logger.info("Motor connection lost...trying to reconnect.")
+        try:
+            await self._connect_async()
+        except ConnectionError:
+            pass
+
+        if not self.connected:
+            delay = self._reconnect_delay()
+            self._reconnect_at = time.monotonic() + delay
+            self.logger.info(f"...next reconnect attempt in {delay:.2f} sec.")
+            return delay
+
+        # Send kill once the motor is back online.  This will ensure the
+        # motor is stopped and the buffer (queue) is empty, so we can
+        # continue "safely" with new commands.
+        await self._send_command_async("kill")
+        return self.heartrate.BASE
+
+    def _reconnect_delay(self) -> float:
+        """
+        The time (in seconds) to wait before the next reconnect attempt,
+        based on the number of consecutive failed attempts.
+        """
+        backoff = self._setup["reconnect_backoff"]
+        failures = max(self._connection_health["failed_attempts"], 1)
+        delay = min(backoff.INITIAL * backoff.FACTOR ** (failures - 1), backoff.MAX)
+        return delay * (1.0 + random.uniform(-backoff.JITTER, backoff.JITTER))
+
+    def _moving_heartrate(self) -> float:
+        """
+        Return the time (in seconds) until the next heartbeat of a
+        moving motor.  If the move's predicted end time is known, then
+        the beat is scheduled just before the predicted end (at most
+        ``heartrate.BASE`` away) and beats are dense (every
+        ``heartrate.FINE``) around the predicted end.  Otherwise,
+        ``heartrate.ACTIVE`` is used.
+        """
+        if self._move_eta is None or not self._setup["adaptive_heartbeat"]:
+            return self.heartrate.ACTIVE
+
+        remaining = self._move_eta - self.loop.time()
+        if remaining > self.heartrate.ACTIVE:
+            return min(remaining - self.heartrate.ACTIVE, self.heartrate.BASE)
+        elif remaining > -self.heartrate.BASE:
+            return self.heartrate.FINE
+
+        # the move is running well past the prediction (e.g. the
+        # parameters changed), stop polling densely
+        return self.heartrate.ACTIVE
+
+    async def _heartbeat_sleep(self, delay: Optional[float]):
+        """
+        Sleep for ``delay`` seconds or until :meth:`_wake_heartbeat` is
+        called, whichever happens first.  If ``delay`` is `None`, then
+        sleep until woken.
+        """
+        if self._heartbeat_wake is None:
+            self._heartbeat_wake = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(self._heartbeat_wake.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._heartbeat_wake.clear()
+
+    def _wake_heartbeat(self):
+        """
+        Wake a sleeping heartbeat so it re-evaluates its rate (e.g. a
+        move was just started).  If the motor status is polled by a
+        `~bapsf_motion.actors.poller.StatusPoller`, then the poller is
+        woken instead.  Must be called from the `event loop`_.
+        """
+        if self._status_poller is not None:
+            self._status_poller.wake(self)
+        elif self._heartbeat_wake is not None:
+            self._heartbeat_wake.set()
+
+    def wait_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the motor stops moving, i.e. until the heartbeat
+        detects the movement has finished and
+        :attr:`signals.movement_finished` is emitted.  Returns
+        immediately if the motor is not moving.
+
+        Parameters
+        ----------
+        timeout: `float`, optional
+            Max time (in seconds) to wait for the motor to stop.  If
+            `None`, then wait indefinitely. (DEFAULT: `None`)
+
+        Returns
+        -------
+        bool
+            `True` if the motor stopped moving, and `False` if the
+            wait timed out or the motor was terminated.
+        """
+        return self._run_coroutine(self._wait_for_stop_async(timeout), timeout=None)
+
+    async def await_for_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        An awaitable version of :meth:`wait_for_stop`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await self._wait_for_stop_async(timeout)
+
+    async def _wait_for_stop_async(self, timeout: Optional[float] = None) -> bool:
+        """A coroutine_ version of :meth:`wait_for_stop`."""
+        if not self.is_moving:
+            return True
+
+        future = self.loop.create_future()
+        self._stop_waiters.append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            try:
+                self._stop_waiters.remove(future)
+            except ValueError:
+                pass
+
+    def _resolve_stop_waiters(self, stopped: bool):
+        """
+        Resolve all futures waiting on the motor to stop with the
+        result ``stopped``.  Must be called from the `event loop`_.
+        """
+        waiters = self._stop_waiters
+        self._stop_waiters = []
+        for future in waiters:
+            if not future.done():
+                future.set_result(stopped)
 
     def terminate(self, delay_loop_stop=False):
         self.logger.info("Terminating motor")
+        self._move_eta = None
+
+        # release anyone waiting on the motor to stop
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._resolve_stop_waiters, False)
+        else:
+            self._resolve_stop_waiters(False)
 
         # disconnect all signals before terminating
         self.signals.status_changed.disconnect_all()
         self.signals.movement_started.disconnect_all()
         self.signals.movement_finished.disconnect_all()
 
-        if not self.terminated and self.connected:
+        in_loop_shutdown = False
+        stop = None  # type: Optional[asyncio.Future]
+        if self.terminated or not self.connected:
+            pass
+        elif self._submissions.in_loop_thread():
+            # the motor is terminated from within its running event loop,
+            # so the loop can not be blocked on the stop and disable
+            in_loop_shutdown = True
+            stop = self._submit_stop()
+        else:
             self.stop()
             self.disable()
 
         super().terminate(delay_loop_stop=delay_loop_stop)
         self._heartbeat_task = None
 
+        if in_loop_shutdown and delay_loop_stop:
+            # the transport is released once the motor is disabled
+            self._shutdown_task = self.loop.create_task(self._shutdown_async(stop))
+            return
+
+        # the connection can only be reused while the event loop lives on,
+        # if the loop is stopped from within, then closing the transport
+        # still flushes the stop command
+        self._release_transport(pool=delay_loop_stop)
+
+    async def _shutdown_async(self, stop: Optional[asyncio.Future]):
+        """
+        :ref:`Coroutine <coroutine>` to wait on the acknowledgement of
+        the ``stop`` command, disable the motor, and release the
+        :attr:`transport` to the connection pool (see
+        :meth:`_release_transport`).  Used by :meth:`terminate` from
+        within the running `event loop`_.
+        """
         try:
-            self.socket.close()
-        except AttributeError:
-            pass
+            if stop is not None:
+                await stop
+
+            # write straight to the transport, since the motor is
+            # already terminated
+            if self.transport is not None and self.transport.is_open:
+                await self.transport.submit(
+                    self._process_command("disable"),
+                    self._reply_matcher("disable"),
+                )
+        except (ConnectionError, OSError, asyncio.TimeoutError) as err:
+            self._record_connection_error(err)
+        finally:
+            self._release_transport()
 
     def _moveable(self) -> bool:
         """
         Return `True` if a movement command can be sent to the motor.
         """
+        return self._run_coroutine(self._moveable_async())
+
+    async def _moveable_async(self) -> bool:
+        """A coroutine_ version of :meth:`_moveable`."""
         if self.is_moving:
             return False
 
         if self.status["alarm"]:
-            self.send_command("alarm_reset")
-            alarm_status = self.retrieve_motor_alarm()
+            await self._send_command_async("alarm_reset")
+            alarm_status = await self._retrieve_motor_alarm_async()
+            if isinstance(alarm_status, self.ack_flags):
+                # lost connection or malformed response
+                return False
+
             alarm_messages = alarm_status["alarm_message"].split("::")
 
             self.logger.info(f"Alarm status: {alarm_status}")
             if (
-                self._lost_connection(alarm_status)
-                or len(alarm_messages) > 1
+                len(alarm_messages) > 1
                 or (
                     len(alarm_messages) == 1
                     and not alarm_status["limits"]["CCW"]
@@ -1852,8 +2894,45 @@ class Motor(EventActor):
 
     def stop(self, soft=False):
         """Stop motor movement."""
+        self._move_eta = None
         self.send_command("stop", soft)
 
+    def _submit_stop(self, soft: bool = False) -> Optional[asyncio.Future]:
+        """
+        Write the stop command straight to the :attr:`transport`,
+        bypassing the command checks, the parameter cache, and any
+        reconnect attempt.  Used by the emergency stop, see
+        `~bapsf_motion.actors.estop`, and by :meth:`terminate` from
+        within the `event loop`_.  Must be called from the
+        `event loop`_.
+
+        Returns
+        -------
+        `asyncio.Future` or `None`
+            The future of the motor's reply, or `None` if the transport
+            is not open.
+        """
+        self._move_eta = None
+        if self.transport is None or not self.transport.is_open:
+            return None
+
+        try:
+            return self.transport.submit(
+                self._process_command("stop", soft),
+                self._reply_matcher("stop", soft),
+            )
+        except (ConnectionError, OSError) as err:
+            self._record_connection_error(err)
+            return None
+
+    async def astop(self, soft=False):
+        """
+        An awaitable version of :meth:`stop`, which must be awaited from
+        within the actor's `event loop`_.
+        """
+        self._move_eta = None
+        await self.asend_command("stop", soft)
+
     def move_to(self, pos: int):
         """
         Move the motor to a specified location.
@@ -1863,16 +2942,121 @@ class Motor(EventActor):
         pos: int
             Position (in steps) for the motor to move to.
         """
-        if not self._moveable():
+        return self._run_coroutine(self._move_to_async(pos))
+
+    async def amove_to(self, pos: int):
+        """
+        An awaitable version of :meth:`move_to`, which must be awaited
+        from within the actor's `event loop`_.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            await m1.amove_to(20000)
+            await m1.await_for_stop()
+        """
+        if self.terminated:
+            raise RuntimeError(
+                "Can not move motor, since the motor has been terminated."
+            )
+
+        return await self._move_to_async(pos)
+
+    async def _move_to_async(self, pos: int):
+        """A coroutine_ version of :meth:`move_to`."""
+        if not await self._check_move_async(pos):
+            return
+
+        # Note:  The Applied Motion Command Reference pdf states for
+        #        ethernet enabled motors the position should not be
+        #        given directly with the "feed" command.  The position
+        #        must first be set with "target_distance" and then fed to
+        #        position with "feed".
+        move_time = self._estimate_move_time(pos)
+        rtn = await self._send_commands_async(
+            "enable", ("target_distance", pos), "feed"
+        )
+        await self._move_started_async(rtn[-1], move_time)
+
+    async def _stage_move_async(
+        self,
+        pos: int,
+        speed: Optional[float] = None,
+        accel: Optional[float] = None,
+        decel: Optional[float] = None,
+    ) -> bool:
+        """
+        Coroutine_ to prepare a move to ``pos`` (in steps) without
+        starting it, so the move can later be started with
+        :meth:`_feed_async` with a single command.  The ``speed`` (in
+        rev/s), ``accel``, and ``decel`` (in rev/s/s) of the move are
+        set if given.  Returns `True` if the move was staged.
+        """
+        if not await self._check_move_async(pos):
+            return False
+
+        commands = [
+            (command, value)
+            for command, value in (
+                ("speed", speed), ("acceleration", accel), ("deceleration", decel)
+            )
+            if value is not None
+        ]
+        rtn = await self._send_commands_async(
+            *commands, "enable", ("target_distance", pos)
+        )
+        return all(_rtn == self.ack_flags.ACK for _rtn in rtn)
+
+    async def _feed_async(self, pos: int):
+        """
+        Coroutine_ to start the move to ``pos`` (in steps) staged with
+        :meth:`_stage_move_async`.
+        """
+        move_time = self._estimate_move_time(pos)
+        rtn = await self._send_command_async("feed")
+        await self._move_started_async(rtn, move_time)
+
+    async def _move_started_async(self, rtn: Any, move_time: Optional[float]):
+        """
+        Coroutine_ to record the start of a move, given the response
+        ``rtn`` to the feed command and the estimated ``move_time``.
+        The loop time the feed command was acknowledged is recorded as
+        ``_move_started_at``, `None` if the move did not start.
+        """
+        now = self.loop.time()
+        self._move_started_at = (
+            now if rtn in (self.ack_flags.ACK, self.ack_flags.ACK_QUEUED) else None
+        )
+
+        if move_time is not None and rtn == self.ack_flags.ACK:
+            self._move_eta = now + move_time
+        else:
+            # the move did not start or was queued behind other commands
+            self._move_eta = None
+
+        await self._retrieve_motor_status_async()
+        self._wake_heartbeat()
+
+    async def _check_move_async(self, pos: int) -> bool:
+        """
+        Coroutine_ to check the motor can be moved to ``pos`` (in
+        steps).  Returns `False` if an alarm prevents the move.
+        """
+        if not await self._moveable_async():
             alarm_msg = self.status["alarm_message"]
             self.logger.error(
                 f"Motor alarm active, could not move. Alarm Status: {alarm_msg}"
             )
-            return
+            return False
 
         if self.status["alarm"]:
             # on a limit switch, check if move direction is off limit
-            delta = pos - self.position.value
+            position = await self._send_command_async("get_position")
+            if isinstance(position, self.ack_flags):
+                position = self.status["position"]
+            delta = pos - position.value
 
             if delta > 0 and self.status["limits"]["CW"]:
                 self.logger.warning(
@@ -1883,15 +3067,54 @@ class Motor(EventActor):
                     "Motor can NOT move backward, currently on backward limit."
                 )
 
-        # Note:  The Applied Motion Command Reference pdf states for
-        #        ethernet enabled motors the position should not be
-        #        given directly with the "feed" command.  The position
-        #        must first be set with "target_distance" and then fed to
-        #        position with "feed".
-        self.enable()
-        self.send_command("target_distance", pos)
-        self.send_command("feed")
-        self.send_command("retrieve_motor_status")
+        return True
+
+    def _estimate_move_time(self, pos: int) -> Optional[float]:
+        """
+        Estimate the time (in seconds) it takes the motor to move from
+        its last known position to ``pos`` (in steps) with the current
+        speed, acceleration, and deceleration settings.  Returns `None`
+        if any of the needed parameters are unknown.
+        """
+        values = []
+        for value in (
+            self.status["position"],
+            self._motor["gearing"],
+            self._motor["speed"],
+            self._motor["accel"],
+            self._motor["decel"],
+        ):
+            if value is None or isinstance(value, self.ack_flags):
+                return None
+            values.append(value.value if hasattr(value, "unit") else value)
+
+        position, gearing, speed, accel, decel = values
+        if gearing <= 0:
+            return None
+
+        distance = (pos - position) / gearing  # in rev
+        return trapezoid_profile(distance, speed, accel, decel).duration
+
+    def _motion_rates(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        The ``(gearing, speed, accel, decel)`` of the motor in steps/rev,
+        rev/s, and rev/s/s.  `None` if any of them or the motor position
+        is unknown.
+        """
+        if self.status["position"] is None:
+            return None
+
+        values = []
+        for key in ("gearing", "speed", "accel", "decel"):
+            value = self._motor[key]
+            if value is None or isinstance(value, self.ack_flags):
+                return None
+            values.append(float(value.value if hasattr(value, "unit") else value))
+
+        if values[0] <= 0:
+            return None
+
+        return values[0], values[1], values[2], values[3]
 
     def move_off_limit(self):
         """
@@ -1932,10 +3155,9 @@ class Motor(EventActor):
             move_to_pos = pos + off_direction * 0.5 * self.steps_per_rev.value
             self.move_to(move_to_pos)
 
-            # wait until motor stops moving
-            self.sleep(2 * self.heartrate.ACTIVE)
-            while self.is_moving:
-                self.sleep(self.heartrate.ACTIVE)
+            # wait until motor stops moving, half a revolution takes well
+            # under the timeout
+            self.wait_for_stop(timeout=10 * self.heartrate.BASE)
 
             alarm_msg = self.retrieve_motor_alarm(defer_status_update=True)
             if self._lost_connection(alarm_msg):
@@ -2013,6 +3235,10 @@ class Motor(EventActor):
             allowable running current
             (``_motor["DEFAULTS"]["max_current"]``).
         """
+        return self._run_coroutine(self._set_current_async(percent))
+
+    async def _set_current_async(self, percent):
+        """A coroutine_ version of :meth:`set_current`."""
         if not isinstance(percent, (int, float)):
             self.logger.error(
                 f"Setting motor current, expected a value of 0 - 1 "
@@ -2028,7 +3254,7 @@ class Motor(EventActor):
 
         new_cur = percent * self._motor["DEFAULTS"]["max_current"]
 
-        ic = self.send_command("idle_current")
+        ic = await self._send_command_async("idle_current")
         if self._lost_connection(ic):
             self.logger.error("Unable to set current due to a lost connection.")
             return
@@ -2042,8 +3268,8 @@ class Motor(EventActor):
             [self._motor["DEFAULTS"]["max_idle_current"] * new_cur, ic],
         )
 
-        self.send_command("current", new_cur)
-        self.send_command("idle_current", new_ic)
+        await self._send_command_async("current", new_cur)
+        await self._send_command_async("idle_current", new_ic)
 
     def set_idle_current(self, percent):
         r"""
@@ -2059,6 +3285,10 @@ class Motor(EventActor):
             ``0.5`` will set the idle current to 50% of the running
             current.
         """
+        return self._run_coroutine(self._set_idle_current_async(percent))
+
+    async def _set_idle_current_async(self, percent):
+        """A coroutine_ version of :meth:`set_idle_current`."""
         max_idle = self._motor["DEFAULTS"]["max_idle_current"]
         if not isinstance(percent, (int, float)):
             self.logger.error(
@@ -2073,7 +3303,7 @@ class Motor(EventActor):
             )
             percent = max_idle
 
-        curr = self.send_command("current")
+        curr = await self._send_command_async("current")
         if self._lost_connection(curr):
             self.logger.error("Unable to set idle current due to a lost connection.")
             return
@@ -2084,18 +3314,29 @@ class Motor(EventActor):
             )
             return
         new_ic = percent * curr
-        self.send_command("idle_current", new_ic)
+        await self._send_command_async("idle_current", new_ic)
 
     def reset_currents(self):
         """
         Reset running and idle currents to their default values.
         """
+        return self._run_coroutine(self._reset_currents_async())
+
+    async def _reset_currents_async(self):
+        """A coroutine_ version of :meth:`reset_currents`."""
+        curr, new_ic = self._default_currents()
+        await self._send_commands_async(("current", curr), ("idle_current", new_ic))
+
+    def _default_currents(self) -> Tuple[float, float]:
+        """
+        Return the default running and idle currents (in amps) defined
+        by ``_motor["DEFAULTS"]``.
+        """
         max_curr = self._motor["DEFAULTS"]["max_current"]
         curr = self._motor["DEFAULTS"]["current"] * max_curr
         new_ic = self._motor["DEFAULTS"]["idle_current"] * curr
 
-        self.send_command("current", curr)
-        self.send_command("idle_current", new_ic)
+        return curr, new_ic
 
     def set_position(self, pos):
         """
@@ -2106,6 +3347,17 @@ class Motor(EventActor):
             An integer in the range of +/- 2,147,483,647 to set the
             motor's absolute position.
         """
+        return self._run_coroutine(self._set_position_async(pos))
+
+    async def aset_position(self, pos):
+        """
+        An awaitable version of :meth:`set_position`, which must be
+        awaited from within the actor's `event loop`_.
+        """
+        return await self._set_position_async(pos)
+
+    async def _set_position_async(self, pos):
+        """A coroutine_ version of :meth:`set_position`."""
         if not isinstance(pos, int):
             self.logger.error(
                 f"Setting motor position, expect int between"
@@ -2114,7 +3366,7 @@ class Motor(EventActor):
             return
 
         # set high torque
-        ic = self.send_command("idle_current")
+        ic = await self._send_command_async("idle_current")
         if self._lost_connection(ic):
             self.logger.error("Unable to set position due to a lost connection.")
             return
@@ -2125,7 +3377,7 @@ class Motor(EventActor):
             )
             return
 
-        curr = self.send_command("current")
+        curr = await self._send_command_async("current")
         if self._lost_connection(curr):
             self.logger.error("Unable to set position due to a lost connection.")
             return
@@ -2138,21 +3390,37 @@ class Motor(EventActor):
 
         # enable motor before zeroing so holding current is in effect
         enable_state = self.status["enabled"]
-        self.send_command("enable")
-
-        self.set_current(1)
-        self.set_idle_current(self._motor["DEFAULTS"]["max_idle_current"])
+        await self._send_command_async("enable")
 
-        self.send_command("encoder_position", pos)
-        self.send_command("set_position_SP", pos)
+        await self._set_current_async(1)
+        await self._set_idle_current_async(
+            self._motor["DEFAULTS"]["max_idle_current"]
+        )
 
-        self.send_command("current", curr)
-        self.send_command("idle_current", ic)
+        await self._send_commands_async(
+            ("encoder_position", pos),
+            ("set_position_SP", pos),
+            ("current", curr),
+            ("idle_current", ic),
+        )
 
         # return to previous enabled state
         if not enable_state:
-            self.disable()
+            await self._send_command_async("disable")
+
+        await self._retrieve_motor_status_async()
 
     def zero(self):
         """Define current motor position as zero."""
         self.set_position(0)
+
+    async def azero(self):
+        """
+        An awaitable version of :meth:`zero`, which must be awaited from
+        within the actor's `event loop`_.
+        """
+        await self._set_position_async(0)
+
+    async def _zero_async(self):
+        """A coroutine_ version of :meth:`zero`."""
+        await self._set_position_async(0)
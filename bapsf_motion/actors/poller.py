@@ -0,0 +1,433 @@
+"""
+Module for the `StatusPoller`, which polls the status of a collection
+of `~bapsf_motion.actors.motor_.Motor` actors from a single task
+instead of every motor running its own heartbeat.
+"""
+__all__ = ["PollerSignals", "StatusPoller", "StatusSnapshot"]
+
+import asyncio
+import logging
+import time
+
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.utils import SimpleSignal
+
+
+class StatusSnapshot(NamedTuple):
+    """
+    A consolidated picture of the status of all motors polled by a
+    `StatusPoller`, taken at the end of a poll cycle (tick).
+    """
+
+    #: Number of the poll cycle the snapshot was taken in.
+    tick: int
+
+    #: Time (`time.time`) the snapshot was taken.
+    timestamp: float
+
+    #: Copy of the :attr:`~bapsf_motion.actors.motor_.Motor.status` of
+    #: every motor, keyed by the motor's poller key.
+    statuses: Dict[str, Dict[str, Any]]
+
+    #: Keys of the motors that were polled during this cycle.
+    polled: Tuple[str, ...]
+
+    @property
+    def moving(self) -> bool:
+        """`True` if any motor was moving when the snapshot was taken."""
+        return any(bool(status["moving"]) for status in self.statuses.values())
+
+
+class PollerSignals:
+    r"""
+    Class that defines all the `~bapsf_motion.utils.SimpleSignal`\ 's
+    used by `StatusPoller`.
+    """
+    def __init__(self):
+        self._snapshot_updated = SimpleSignal()
+
+    @property
+    def snapshot_updated(self) -> SimpleSignal:
+        """
+        `~bapsf_motion.utils.SimpleSignal` emitted after every poll
+        cycle, once :attr:`StatusPoller.snapshot` is updated.
+        """
+        return self._snapshot_updated
+
+
+class StatusPoller:
+    r"""
+    Poll the status of many `~bapsf_motion.actors.motor_.Motor`\ s from
+    a single `asyncio.Task`.
+
+    Every motor added to the poller hands its status polling over from
+    its own heartbeat to the poller.  The poller keeps a due time for
+    each motor (based on the motor's
+    :attr:`~bapsf_motion.actors.motor_.Motor.heartrate`), polls all
+    due motors concurrently in a cycle (tick), and then publishes one
+    consolidated `StatusSnapshot` via :attr:`snapshot` and
+    :attr:`signals`.
+
+    Parameters
+    ----------
+    loop: `asyncio.AbstractEventLoop`
+        The `event loop`_ the motors run in.  All motors of the poller
+        must share this loop.
+
+    max_rate: `float`, optional
+        Max number of motor status polls per second across all motors.
+        If more motors are due than the budget allows, the most overdue
+        motors are polled first and the rest are deferred to a later
+        cycle.  If `None`, then the rate is not limited.
+        (DEFAULT: `None`)
+
+    logger: `~logging.Logger`, optional
+        An instance of `~logging.Logger` the poller will record events
+        to.  If `None`, then a logger will automatically be generated.
+        (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        max_rate: Optional[float] = None,
+        logger: logging.Logger = None,
+    ):
+        self.logger = (
+            logging.getLogger("poller")
+            if logger is None
+            else logging.getLogger(f"{logger.name}.poller")
+        )
+        self._loop = loop
+        self._signals = PollerSignals()
+
+        self._motors = {}  # type: Dict[str, Motor]
+        self._due = {}  # type: Dict[str, float]
+        self._snapshot = None  # type: Optional[StatusSnapshot]
+        self._task = None  # type: Optional[asyncio.Task]
+        self._wake_event = None  # type: Optional[asyncio.Event]
+
+        self._max_rate = None  # type: Optional[float]
+        self._tokens = 0.0
+        self._token_time = None  # type: Optional[float]
+        self.max_rate = max_rate
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The `asyncio` :term:`event loop` the poller runs in."""
+        return self._loop
+
+    @property
+    def signals(self) -> PollerSignals:
+        """The signals of the poller."""
+        return self._signals
+
+    @property
+    def motors(self) -> Dict[str, Motor]:
+        """Dictionary of the polled motors, keyed by their poller key."""
+        return self._motors.copy()
+
+    @property
+    def snapshot(self) -> Optional[StatusSnapshot]:
+        """
+        The `StatusSnapshot` of the last poll cycle, `None` if no cycle
+        has finished yet.
+        """
+        return self._snapshot
+
+    @property
+    def max_rate(self) -> Optional[float]:
+        """
+        Max number of motor status polls per second, `None` if
+        unlimited.
+        """
+        return self._max_rate
+
+    @max_rate.setter
+    def max_rate(self, value: Optional[float]):
+        if value is not None and (
+            not isinstance(value, (int, float)) or value <= 0
+        ):
+            self.logger.error(
+                f"ValueError: Expected None or a positive number for the max "
+                f"poll rate, got {value}.  Max rate is unchanged."
+            )
+            return
+
+        self._max_rate = None if value is None else float(value)
+        self._tokens = 0.0 if value is None else self._burst
+        self._token_time = None
+
+    @property
+    def _burst(self) -> float:
+        # the rate budget allows for 1 second worth of polls in a burst,
+        # but at least one poll
+        return max(self._max_rate, 1.0)
+
+    @property
+    def is_running(self) -> bool:
+        """`True` if the polling task is running."""
+        return self._task is not None and not self._task.done()
+
+    def add_motor(self, motor: Motor, key: Optional[str] = None) -> bool:
+        """
+        Add ``motor`` to the poller, and hand the polling of its status
+        over from its heartbeat to the poller.  If the motor is already
+        polled by another `StatusPoller`, then it is removed from that
+        poller.  If called from outside the `event loop`_, then the
+        motor is added once the loop gets to it.
+
+        Parameters
+        ----------
+        motor: `~bapsf_motion.actors.motor_.Motor`
+            The motor to be polled.
+
+        key: `str`, optional
+            Unique key the motor is referenced by in the poller and in
+            the `StatusSnapshot`.  If `None`, then the motor's IP is
+            used.  (DEFAULT: `None`)
+
+        Returns
+        -------
+        bool
+            `True` if the motor was added, `False` otherwise.
+        """
+        if not isinstance(motor, Motor):
+            self.logger.error(
+                f"TypeError: Expected a Motor to poll, got type {type(motor)}."
+            )
+            return False
+        elif motor.loop is not self.loop:
+            self.logger.error(
+                f"ValueError: Motor '{motor.name}' runs in a different event "
+                f"loop than the poller, can not poll its status."
+            )
+            return False
+
+        key = motor.ip if key is None else str(key)
+        if key in self._motors and self._motors[key] is not motor:
+            self.logger.error(
+                f"ValueError: A different motor is already polled with "
+                f"key '{key}'."
+            )
+            return False
+
+        if motor.status_poller is not None and motor.status_poller is not self:
+            motor.status_poller.remove_motor(motor)
+
+        self._call_in_loop(self._add_motor, key, motor)
+        return True
+
+    def _add_motor(self, key: str, motor: Motor):
+        self._motors[key] = motor
+        self._due[key] = 0.0  # poll on the next cycle
+        motor._set_status_poller(self)
+        self.wake(None)
+
+    def remove_motor(self, motor) -> Optional[Motor]:
+        """
+        Remove a motor from the poller, given the motor or its poller
+        key, and hand the polling of its status back to its heartbeat.
+        Returns the removed motor, `None` if the motor was not polled.
+        If called from outside the `event loop`_, then the motor is
+        removed once the loop gets to it.
+        """
+        key = self._motor_key(motor)
+        removed = self._motors.get(key, None)
+
+        self._call_in_loop(self._remove_motor, motor)
+        return removed
+
+    def _remove_motor(self, motor):
+        # resolve the key again, the motor may have been added after
+        # remove_motor() was called
+        key = self._motor_key(motor)
+        motor = self._motors.pop(key, None)
+        self._due.pop(key, None)
+        if motor is not None and motor.status_poller is self:
+            motor._set_status_poller(None)
+
+    def _motor_key(self, motor) -> Optional[str]:
+        """The poller key of ``motor``, given the motor or its key."""
+        if not isinstance(motor, Motor):
+            return motor
+
+        for key, val in list(self._motors.items()):
+            if val is motor:
+                return key
+
+        return None
+
+    def start(self):
+        """Start the polling task, if it is not already running."""
+        # a stop may still be waiting on the loop, so the task is checked
+        # from within the loop
+        self._call_in_loop(self._create_task)
+
+    def _create_task(self):
+        if not self.is_running:
+            self._task = self.loop.create_task(self._run())
+
+    def stop(self):
+        """
+        Stop the polling task and hand the polling of every motor's
+        status back to its heartbeat.
+        """
+        self._call_in_loop(self._stop)
+
+    def _stop(self):
+        for key in list(self._motors):
+            self._remove_motor(key)
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wake(self, motor: Optional[Motor] = None):
+        """
+        Wake the polling task, so ``motor`` (or all motors if `None`)
+        are polled in the next cycle.  Must be called from the
+        `event loop`_.
+        """
+        for key, val in self._motors.items():
+            if motor is None or val is motor:
+                self._due[key] = 0.0
+
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def _call_in_loop(self, callback, *args):
+        """
+        Call ``callback(*args)`` from within the `event loop`_.  The
+        polling task iterates over the polled motors, so they must
+        only be modified from within the loop.
+        """
+        if self._in_loop_thread() or not self.loop.is_running():
+            callback(*args)
+        else:
+            self.loop.call_soon_threadsafe(callback, *args)
+
+    def _in_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            # no loop is running in the current thread
+            return False
+
+    def _take_tokens(self, requested: int) -> int:
+        """
+        Take up to ``requested`` polls from the rate budget, and return
+        the number of polls granted.
+        """
+        if self._max_rate is None:
+            return requested
+
+        now = self.loop.time()
+        if self._token_time is not None:
+            self._tokens = min(
+                self._tokens + (now - self._token_time) * self._max_rate,
+                self._burst,
+            )
+        self._token_time = now
+
+        granted = min(int(self._tokens), requested)
+        self._tokens -= granted
+        return granted
+
+    def _next_delay(self) -> Optional[float]:
+        """
+        Time (in seconds) until the next poll cycle is due, `None` if
+        there are no motors to poll.
+        """
+        if len(self._due) == 0:
+            return None
+
+        delay = max(min(self._due.values()) - self.loop.time(), 0.0)
+        if self._max_rate is not None and self._tokens < 1.0:
+            # wait for the budget to allow for at least one poll
+            delay = max(delay, (1.0 - self._tokens) / self._max_rate)
+
+        return delay
+
+    async def _sleep(self, delay: Optional[float]):
+        if self._wake_event is None:
+            self._wake_event = asyncio.Event()
+
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
+    async def _poll_motor(self, key: str, motor: Motor) -> float:
+        try:
+            return await motor._beat_async()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa
+            self.logger.error(
+                f"Polling the status of motor '{key}' failed.", exc_info=err
+            )
+            return motor.heartrate.SEARCHING
+
+    async def _run(self):
+        """
+        :ref:`Coroutine <coroutine>` polling all due motors every cycle
+        and publishing the consolidated `StatusSnapshot`.
+        """
+        tick = 0
+        while True:
+            now = self.loop.time()
+            due = sorted(
+                (
+                    (due_time, key)
+                    for key, due_time in self._due.items()
+                    if due_time <= now
+                    and not self._motors[key].terminated
+                    and not self._motors[key]._pause_heartbeat
+                ),
+            )
+
+            granted = self._take_tokens(len(due))
+            if granted < len(due):
+                self.logger.debug(
+                    f"Poll rate budget exceeded, deferring {len(due) - granted} "
+                    f"motor(s) to the next cycle."
+                )
+
+            polled = []  # type: List[Tuple[str, Motor]]
+            for _, key in due[:granted]:
+                polled.append((key, self._motors[key]))
+
+            if len(polled):
+                delays = await asyncio.gather(
+                    *[self._poll_motor(key, motor) for key, motor in polled]
+                )
+
+                now = self.loop.time()
+                for (key, _), delay in zip(polled, delays):
+                    if key in self._due:
+                        self._due[key] = now + delay
+
+                tick += 1
+                self._snapshot = StatusSnapshot(
+                    tick=tick,
+                    timestamp=time.time(),
+                    statuses={
+                        key: motor.status.copy()
+                        for key, motor in self._motors.items()
+                    },
+                    polled=tuple(key for key, _ in polled),
+                )
+                self.signals.snapshot_updated.emit()
+
+            # terminated and paused motors are re-checked at the base rate
+            now = self.loop.time()
+            for key, motor in list(self._motors.items()):
+                if key in self._due and (motor.terminated or motor._pause_heartbeat):
+                    self._due[key] = now + motor.heartrate.BASE
+
+            await self._sleep(self._next_delay())
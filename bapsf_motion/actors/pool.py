@@ -0,0 +1,216 @@
+"""
+Module for the `ConnectionPool`, which keeps the connections to
+motors open across `~bapsf_motion.actors.motor_.Motor` instances.
+
+Actors tear down and re-spawn their motors whenever a configuration
+changes (e.g. restarting an axis, replacing the drive of a motion
+group, or editing a drive in the configuration GUI).  When a
+terminated motor releases its open transport to the pool, the next
+motor spawned for the same ``(ip, port)`` takes the transport over
+together with the motor parameters the previous motor had retrieved,
+and skips reconnecting and re-configuring the motor.
+"""
+__all__ = ["ConnectionPool", "PooledConnection", "connection_pool"]
+
+import asyncio
+import logging
+import threading
+import time
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from bapsf_motion.actors.transport import BaseTransport
+
+
+class PooledConnection:
+    """
+    An idle motor connection held by a `ConnectionPool`.
+
+    Parameters
+    ----------
+    transport: `~bapsf_motion.actors.transport.BaseTransport`
+        The open transport to the motor.
+
+    configuration: `~typing.Hashable`, optional
+        Identifies the configuration the motor was given over this
+        connection.  `None` if the configuration is unknown, e.g. a
+        configuration command was sent after the motor was configured.
+        (DEFAULT: `None`)
+
+    parameters: `dict`, optional
+        The motor parameter cache (see
+        :attr:`Motor.parameters <bapsf_motion.actors.motor_.Motor.parameters>`)
+        of this connection.  Only used if ``configuration`` is not
+        `None`. (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        *,
+        configuration: Optional[Hashable] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ):
+        self.transport = transport
+        self.configuration = configuration
+        self.parameters = {} if parameters is None else parameters.copy()
+        self.released_at = time.monotonic()
+
+    @property
+    def key(self) -> Tuple[str, int, str]:
+        """The ``(ip, port, transport type)`` key of the connection."""
+        return ConnectionPool.key_for(self.transport)
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of idle motor connections, keyed by the motor
+    ``(ip, port)`` and transport type.
+
+    A connection is only handed out to a motor running in the same
+    `event loop`_ the transport was opened in, since `asyncio`
+    transports are bound to their loop.
+
+    Parameters
+    ----------
+    max_idle: `float`, optional
+        Time (in seconds) a released connection is kept open before it
+        is closed.  If `None`, then connections are kept until taken or
+        :meth:`clear` is called. (DEFAULT: ``300.0``)
+
+    logger: `~logging.Logger`, optional
+        An instance of `~logging.Logger` the pool will record events
+        to.  If `None`, then a logger will automatically be generated.
+        (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self, *, max_idle: Optional[float] = 300.0, logger: logging.Logger = None
+    ):
+        self.logger = logging.getLogger("ConnectionPool") if logger is None else logger
+        self.max_idle = max_idle
+
+        self._connections = {}  # type: Dict[Tuple[str, int, str], PooledConnection]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._connections)
+
+    @staticmethod
+    def key_for(transport: BaseTransport) -> Tuple[str, int, str]:
+        """The pool key of ``transport``."""
+        return transport.ip, transport.port, type(transport).__name__
+
+    def release(
+        self,
+        transport: BaseTransport,
+        *,
+        configuration: Optional[Hashable] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Hand the idle ``transport`` over to the pool.  If the transport
+        is closed or still has requests waiting on a reply, then it is
+        closed instead.  See `PooledConnection` for a description of
+        the keyword arguments.
+
+        Returns
+        -------
+        bool
+            `True` if the transport was pooled.
+        """
+        if not transport.is_open or transport.pending:
+            transport.close()
+            return False
+
+        conn = PooledConnection(
+            transport, configuration=configuration, parameters=parameters
+        )
+        with self._lock:
+            self._expire()
+            old = self._connections.pop(conn.key, None)
+            self._connections[conn.key] = conn
+
+        if old is not None and old.transport is not transport:
+            old.transport.close()
+
+        self.logger.debug(f"Pooled connection to {transport.ip}:{transport.port}.")
+        return True
+
+    def acquire(
+        self,
+        ip: str,
+        port: int,
+        transport_type: type,
+        loop: asyncio.AbstractEventLoop,
+    ) -> Optional[PooledConnection]:
+        """
+        Take the idle connection to ``ip:port`` out of the pool.
+
+        Parameters
+        ----------
+        ip: `str`
+            IPv4 address of the motor.
+
+        port: `int`
+            Port the motor is serving SCL on.
+
+        transport_type: `type`
+            The `~bapsf_motion.actors.transport.BaseTransport` subclass
+            of the requested connection.
+
+        loop: `asyncio.AbstractEventLoop`
+            The `event loop`_ the connection will be used in.
+
+        Returns
+        -------
+        PooledConnection or None
+            The pooled connection, or `None` if no open connection
+            for ``loop`` is available.
+        """
+        with self._lock:
+            self._expire()
+            conn = self._connections.pop((ip, port, transport_type.__name__), None)
+
+        if conn is None:
+            return None
+        elif not conn.transport.is_open or conn.transport.loop is not loop:
+            conn.transport.close()
+            return None
+
+        return conn
+
+    def discard(self, ip: str, port: int):
+        """Close and remove all pooled connections to ``ip:port``."""
+        with self._lock:
+            keys = [key for key in self._connections if key[:2] == (ip, port)]
+            conns = [self._connections.pop(key) for key in keys]
+
+        for conn in conns:
+            conn.transport.close()
+
+    def clear(self):
+        """Close and remove all pooled connections."""
+        with self._lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+
+        for conn in conns:
+            conn.transport.close()
+
+    def _expire(self):
+        # close connections idle for longer than max_idle, the caller
+        # must hold self._lock
+        if self.max_idle is None:
+            return
+
+        now = time.monotonic()
+        for key, conn in list(self._connections.items()):
+            if now - conn.released_at > self.max_idle or not conn.transport.is_open:
+                del self._connections[key]
+                conn.transport.close()
+
+
+#: The process-wide `ConnectionPool` used by
+#: `~bapsf_motion.actors.motor_.Motor` by default.
+connection_pool = ConnectionPool()
@@ -0,0 +1,327 @@
+"""
+Module for computing the motion profiles of Applied Motion stepper
+motors, e.g. to predict how long a move takes.
+"""
+__all__ = [
+    "move_duration",
+    "sequence_durations",
+    "SynchronizedMove",
+    "synchronized_move",
+    "trapezoid_durations",
+    "TrapezoidProfile",
+    "trapezoid_profile",
+]
+
+import math
+import numpy as np
+
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class TrapezoidProfile(NamedTuple):
+    """
+    Timing of a trapezoidal (or triangular) point-to-point move that
+    starts and ends at rest.  All values are in the time and distance
+    units the profile was computed with.
+    """
+
+    #: Time spent accelerating.
+    t_accel: float
+
+    #: Time spent cruising at :attr:`v_peak`.
+    t_cruise: float
+
+    #: Time spent decelerating.
+    t_decel: float
+
+    #: Peak speed of the move.
+    v_peak: float
+
+    @property
+    def duration(self) -> float:
+        """Total duration of the move."""
+        return self.t_accel + self.t_cruise + self.t_decel
+
+
+def trapezoid_profile(
+    distance: float, speed: float, accel: float, decel: float
+) -> TrapezoidProfile:
+    """
+    Compute the trapezoidal motion profile for a point-to-point move
+    of length ``distance``, with a max speed of ``speed``, an
+    acceleration of ``accel``, and a deceleration of ``decel``.  This
+    matches how the motor executes a feed to position (``FP``) command.
+    If the move is too short to reach ``speed``, then the profile is
+    triangular.
+
+    The arguments can be in any consistent set of units, e.g. rev,
+    rev/s, and rev/s\\ :sup:`2`.
+
+    Parameters
+    ----------
+    distance: `float`
+        Length of the move.  The sign is ignored.
+
+    speed: `float`
+        Max speed of the move.
+
+    accel: `float`
+        Acceleration at the start of the move.
+
+    decel: `float`
+        Deceleration at the end of the move.
+
+    Returns
+    -------
+    TrapezoidProfile
+        The timing of the move.  If ``distance`` is zero or any of the
+        rates are not positive, then all times are zero.
+
+    Examples
+    --------
+    >>> profile = trapezoid_profile(10, speed=4, accel=25, decel=25)
+    >>> profile.v_peak, round(profile.duration, 2)
+    (4, 2.66)
+    >>> profile = trapezoid_profile(0.5, speed=4, accel=25, decel=25)
+    >>> round(profile.v_peak, 3), profile.t_cruise
+    (3.536, 0.0)
+    """
+    distance = abs(distance)
+    if distance == 0 or speed <= 0 or accel <= 0 or decel <= 0:
+        return TrapezoidProfile(0.0, 0.0, 0.0, 0.0)
+
+    ramp_distance = 0.5 * speed**2 * (1 / accel + 1 / decel)
+    if distance >= ramp_distance:
+        v_peak = speed
+        t_cruise = (distance - ramp_distance) / speed
+    else:
+        v_peak = math.sqrt(2 * distance * accel * decel / (accel + decel))
+        t_cruise = 0.0
+
+    return TrapezoidProfile(v_peak / accel, t_cruise, v_peak / decel, v_peak)
+
+
+def trapezoid_durations(
+    distances, speed: float, accel: float, decel: float
+) -> np.ndarray:
+    """
+    A vectorized version of :code:`trapezoid_profile(...).duration`,
+    which computes the duration of a point-to-point move for every
+    element of the :term:`array_like` ``distances``.
+
+    Examples
+    --------
+    >>> np.round(trapezoid_durations([10, 0.5, 0], 4, 25, 25), 3)
+    array([2.66 , 0.283, 0.   ])
+    """
+    distances = np.abs(np.asarray(distances, dtype=float))
+    if speed <= 0 or accel <= 0 or decel <= 0:
+        return np.zeros_like(distances)
+
+    ramp_distance = 0.5 * speed**2 * (1 / accel + 1 / decel)
+    v_peak = np.minimum(
+        np.sqrt(2 * distances * accel * decel / (accel + decel)), speed
+    )
+    t_cruise = np.maximum(distances - ramp_distance, 0.0) / speed
+    return v_peak / accel + t_cruise + v_peak / decel
+
+
+class SynchronizedMove(NamedTuple):
+    """
+    Per-axis rates of a multi-axis move where all axes start and arrive
+    together, see `synchronized_move`.
+    """
+
+    #: Max speed of each axis.
+    speeds: Tuple[float, ...]
+
+    #: Acceleration of each axis.
+    accels: Tuple[float, ...]
+
+    #: Deceleration of each axis.
+    decels: Tuple[float, ...]
+
+    #: Profile of the move along the path, in units of the path
+    #: fraction (i.e. the path length is 1).
+    profile: TrapezoidProfile
+
+    @property
+    def duration(self) -> float:
+        """Total duration of the move."""
+        return self.profile.duration
+
+
+def synchronized_move(
+    distances: Sequence[float],
+    speeds: Sequence[float],
+    accels: Sequence[float],
+    decels: Sequence[float],
+) -> SynchronizedMove:
+    """
+    Scale the speed, acceleration, and deceleration of every axis of a
+    multi-axis move, so all axes follow the same trapezoidal profile
+    (scaled by their ``distances``) and arrive together.  The probe
+    then moves along a straight line.
+
+    The move along the path is limited by the axis with the least
+    speed (and acceleration and deceleration) per unit distance, and
+    no axis is driven faster than its given limits.
+
+    Parameters
+    ----------
+    distances: Sequence[float]
+        Length of the move of each axis.  The sign is ignored.
+
+    speeds: Sequence[float]
+        Max speed of each axis.
+
+    accels: Sequence[float]
+        Max acceleration of each axis.
+
+    decels: Sequence[float]
+        Max deceleration of each axis.
+
+    Returns
+    -------
+    SynchronizedMove
+        The scaled rates of each axis.  Axes that do not move keep
+        their given rates.
+
+    Examples
+    --------
+    >>> move = synchronized_move([10, 5], [4, 4], [25, 25], [25, 25])
+    >>> move.speeds, move.accels
+    ((4.0, 2.0), (25.0, 12.5))
+    >>> round(move.duration, 2)
+    2.66
+    """
+    distances = [abs(distance) for distance in distances]
+    moving = [
+        ii
+        for ii, distance in enumerate(distances)
+        if distance > 0 and speeds[ii] > 0 and accels[ii] > 0 and decels[ii] > 0
+    ]
+    if not moving:
+        return SynchronizedMove(
+            tuple(speeds),
+            tuple(accels),
+            tuple(decels),
+            TrapezoidProfile(0.0, 0.0, 0.0, 0.0),
+        )
+
+    def path_limit(limits: Sequence[float]) -> float:
+        return min(limits[ii] / distances[ii] for ii in moving)
+
+    path_speed = path_limit(speeds)
+    path_accel = path_limit(accels)
+    path_decel = path_limit(decels)
+
+    def scale(limits: Sequence[float], path_rate: float) -> Tuple[float, ...]:
+        scaled = list(limits)  # type: List[float]
+        for ii in moving:
+            scaled[ii] = path_rate * distances[ii]
+        return tuple(scaled)
+
+    return SynchronizedMove(
+        scale(speeds, path_speed),
+        scale(accels, path_accel),
+        scale(decels, path_decel),
+        trapezoid_profile(1.0, path_speed, path_accel, path_decel),
+    )
+
+
+def move_duration(
+    distances: Sequence[float],
+    speeds: Sequence[float],
+    accels: Sequence[float],
+    decels: Sequence[float],
+    coordinated: bool = False,
+) -> float:
+    """
+    Compute the duration of a multi-axis move where all axes start
+    together.  Each axis follows a trapezoidal profile (see
+    `trapezoid_profile`), and the move is finished once the slowest
+    axis arrives.
+
+    Parameters
+    ----------
+    distances: Sequence[float]
+        Length of the move of each axis.  The sign is ignored.
+
+    speeds: Sequence[float]
+        Max speed of each axis.
+
+    accels: Sequence[float]
+        Acceleration of each axis.
+
+    decels: Sequence[float]
+        Deceleration of each axis.
+
+    coordinated: bool, optional
+        If `True`, then the axes are scaled to arrive together, see
+        `synchronized_move`. (DEFAULT: `False`)
+
+    Returns
+    -------
+    float
+        Duration of the move.
+
+    Examples
+    --------
+    >>> round(move_duration([10, 5], [4, 4], [25, 25], [25, 25]), 2)
+    2.66
+    """
+    if coordinated:
+        return synchronized_move(distances, speeds, accels, decels).duration
+
+    return max(
+        (
+            trapezoid_profile(distance, speed, accel, decel).duration
+            for distance, speed, accel, decel in zip(distances, speeds, accels, decels)
+        ),
+        default=0.0,
+    )
+
+
+def sequence_durations(
+    points: Sequence[Sequence[float]],
+    start: Sequence[float],
+    speeds: Sequence[float],
+    accels: Sequence[float],
+    decels: Sequence[float],
+    coordinated: bool = False,
+) -> List[float]:
+    """
+    Compute the duration of every move of a multi-axis move sequence,
+    i.e. moving from ``start`` to the first of ``points``, and then
+    from point to point.  See `move_duration` for a description of
+    the arguments.
+
+    Returns
+    -------
+    List[float]
+        The duration of the move to each of ``points``.
+
+    Examples
+    --------
+    >>> durations = sequence_durations(
+    ...     [[10, 0], [10, 5]], [0, 0], [4, 4], [25, 25], [25, 25]
+    ... )
+    >>> [round(duration, 2) for duration in durations]
+    [2.66, 1.41]
+    """
+    durations = []
+    previous = start
+    for point in points:
+        durations.append(
+            move_duration(
+                [p - prev for p, prev in zip(point, previous)],
+                speeds,
+                accels,
+                decels,
+                coordinated=coordinated,
+            )
+        )
+        previous = point
+
+    return durations
@@ -0,0 +1,440 @@
+"""
+Module for compiling a sequence of moves into Q programs that are
+executed by `~bapsf_motion.actors.motor_.Motor` actors without the
+host issuing every move.
+
+Applied Motion motors store up to 12 Q program segments in their
+non-volatile memory, each with up to 63 lines.  `compile_q_program`
+splits a sequence of points into Q segments.  Every point becomes a
+target distance (``DI``) and feed to position (``FP``) line, followed
+by a dwell (``WT``) line that is padded so all motors spend the same
+(estimated) time on the point, see `~bapsf_motion.actors.stream`.  All
+motors get a segment for the same range of points.
+
+`run_q_program_async` uploads the segments and executes them one
+after another.  A segment is uploaded by holding the motor with a
+dwell, loading the segment lines into the command buffer behind the
+dwell, saving the buffer to the segment (``QS``), and then flushing
+the buffer with a stop (``SK``), all in a single pipelined exchange.
+Each segment is triggered on every motor with a queue load & execute
+(``QX``), after which the host only watches the Q program flag of the
+motor status (see
+:attr:`Motor.status <bapsf_motion.actors.motor_.Motor.status>`) until
+the segment finished.  Programs that fit into the 12 segments are
+uploaded once and can be re-run without uploading again.
+
+.. warning::
+
+   The upload relies on the motor executing ``QS`` right away, while
+   the segment lines wait in the buffer behind the dwell.  This is how
+   `~bapsf_motion.actors.simulator.MotorSimulator` behaves, but it is
+   not yet confirmed on the motor hardware.  Thus, uploading has to be
+   enabled explicitly with the ``allow_upload`` keyword of
+   `run_q_program_async`.
+
+   Programs with more than 12 segments reuse the segment numbers, so
+   their segments are saved to the non-volatile memory of the motors
+   again on every run, and the host still steps in between segments.
+   `compile_q_program` rejects such programs, unless the rewrites are
+   accepted with the ``rewrite_segments`` keyword.
+"""
+__all__ = [
+    "compile_q_program",
+    "QProgram",
+    "QProgramResult",
+    "QSegment",
+    "run_q_program_async",
+]
+
+import asyncio
+import time
+
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Set, Union
+
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.stream import _build_segments
+
+#: Number of Q program segments stored in the motor's non-volatile memory
+_Q_SEGMENTS = 12
+
+#: Max number of lines in a Q program segment
+_Q_SEGMENT_LINES = 63
+
+#: Time (in seconds) the motor is held while a segment is uploaded
+_UPLOAD_HOLD = 2.0
+
+
+class QSegment(NamedTuple):
+    """A Q program segment, with the lines of every motor."""
+
+    #: Number of the non-volatile memory segment (1 to 12) the lines are
+    #: stored in.
+    number: int
+
+    #: The points of the sequence covered by the segment.
+    points: range
+
+    #: The lines of each motor, given as `Motor` commands (see
+    #: :meth:`Motor.send_commands() <bapsf_motion.actors.motor_.Motor.send_commands>`).
+    lines: List[List[Union[str, tuple]]]
+
+    #: Estimated time (in seconds) to execute the segment.
+    duration: float
+
+
+class QProgramResult(NamedTuple):
+    """The outcome of running a `QProgram`."""
+
+    #: Number of points all motors reached.
+    points: int
+
+    #: `True` if all points of the program were reached.
+    completed: bool
+
+    #: Time (in seconds) from triggering the first segment to the
+    #: last segment finishing.
+    elapsed: float
+
+    #: Number of segments uploaded to the motors during the run.
+    uploads: int
+
+
+class QProgram:
+    """
+    A sequence of moves compiled into Q program segments, see
+    `compile_q_program`.
+
+    Parameters
+    ----------
+    motors: List[|Motor|]
+        The motors the program is compiled for.
+
+    segments: List[QSegment]
+        The segments of the program, in execution order.
+
+    labels: List[Any], optional
+        A label for every point of the program, e.g. the motion list
+        index of the point. (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        motors: List[Motor],
+        segments: List[QSegment],
+        labels: Optional[List[Any]] = None,
+    ):
+        self.motors = motors
+        self.segments = segments
+        self.labels = labels
+
+        # indices of the segments currently stored on the motors
+        self._uploaded = set()  # type: Set[int]
+
+    @property
+    def npoints(self) -> int:
+        """Number of points in the program."""
+        return sum(len(segment.points) for segment in self.segments)
+
+    @property
+    def duration(self) -> float:
+        """Estimated time (in seconds) to execute the program."""
+        return sum(segment.duration for segment in self.segments)
+
+    def scl(self, segment: int, motor: int) -> List[str]:
+        """
+        The SCL command strings of segment index ``segment`` for motor
+        index ``motor``.
+        """
+        _motor = self.motors[motor]
+        return [
+            _motor._process_command(*((line,) if isinstance(line, str) else line))
+            for line in self.segments[segment].lines[motor]
+        ]
+
+    async def _upload_async(self, index: int) -> bool:
+        """
+        Coroutine_ to upload segment index ``index`` to all motors.
+        Returns `True` if all motors accepted the segment.
+        """
+        segment = self.segments[index]
+        rtn = await asyncio.gather(
+            *[
+                motor._send_commands_async(
+                    ("wait_time", _UPLOAD_HOLD),
+                    *lines,
+                    ("queue_save", segment.number),
+                    ("stop", False),
+                )
+                for motor, lines in zip(self.motors, segment.lines)
+            ]
+        )
+
+        ok = True
+        for motor, _rtn in zip(self.motors, rtn):
+            ack = (motor.ack_flags.ACK, motor.ack_flags.ACK_QUEUED)
+            if not all(_r in ack for _r in _rtn):
+                motor.logger.error(
+                    f"Unable to upload Q segment {segment.number}, got "
+                    f"responses {_rtn}."
+                )
+                ok = False
+
+        # another segment stored under the same number is overwritten
+        self._uploaded = {
+            ii for ii in self._uploaded if self.segments[ii].number != segment.number
+        }
+        if ok:
+            self._uploaded.add(index)
+
+        return ok
+
+
+def compile_q_program(
+    motors: List[Motor],
+    targets: Sequence[Sequence[int]],
+    *,
+    dwell: float = 0.0,
+    labels: Optional[List[Any]] = None,
+    rewrite_segments: bool = False,
+) -> Optional[QProgram]:
+    """
+    Compile the sequence of points ``targets`` into Q program segments
+    for ``motors``.  The move times are estimated from the current
+    position and motion parameters of the motors, so the program
+    should be run from the current position.
+
+    Parameters
+    ----------
+    motors: List[|Motor|]
+        The motors to compile the program for.
+
+    targets: Sequence[Sequence[int]]
+        The points to move through, each point gives the position (in
+        steps) of every motor in ``motors``.
+
+    dwell: float, optional
+        Time (in seconds) the motors rest at each point before moving
+        on to the next point. (DEFAULT: ``0.0``)
+
+    labels: List[Any], optional
+        A label for every point in ``targets``, see `QProgram`.
+        (DEFAULT: `None`)
+
+    rewrite_segments: bool, optional
+        If `True`, then programs needing more than the 12 segments of
+        the motor are compiled, accepting that their segments are
+        saved to the non-volatile memory of the motors on every run.
+        (DEFAULT: `False`)
+
+    Returns
+    -------
+    QProgram or None
+        The compiled program, `None` if the position or motion
+        parameters of a motor are unknown.
+
+    Raises
+    ------
+    ValueError
+        If the program needs more than 12 segments and
+        ``rewrite_segments`` is `False`.
+    """
+    motors = list(motors)
+    if any(len(point) != len(motors) for point in targets):
+        raise ValueError(
+            f"Every point in 'targets' must have a position for each of the "
+            f"{len(motors)} motors."
+        )
+
+    built = _build_segments(motors, targets, dwell)
+    if built is None:
+        return None
+    point_lines, point_durations = built
+
+    segments = []
+    start = 0
+    while start < len(targets):
+        stop = start
+        nlines = [0] * len(motors)
+        while stop < len(targets) and all(
+            n + len(lines[stop]) <= _Q_SEGMENT_LINES
+            for n, lines in zip(nlines, point_lines)
+        ):
+            nlines = [n + len(lines[stop]) for n, lines in zip(nlines, point_lines)]
+            stop += 1
+
+        segments.append(
+            QSegment(
+                number=len(segments) % _Q_SEGMENTS + 1,
+                points=range(start, stop),
+                lines=[
+                    [line for point in lines[start:stop] for line in point]
+                    for lines in point_lines
+                ],
+                duration=sum(point_durations[start:stop]),
+            )
+        )
+        start = stop
+
+    if len(segments) > _Q_SEGMENTS and not rewrite_segments:
+        raise ValueError(
+            f"The program needs {len(segments)} Q segments, but the motors "
+            f"only store {_Q_SEGMENTS}.  Its segments would be saved to the "
+            f"non-volatile memory of the motors on every run, use "
+            f"rewrite_segments=True to accept this or split the program."
+        )
+
+    return QProgram(motors, segments, labels=labels)
+
+
+async def _wait_for_segment_async(motors: List[Motor], duration: float, poll: float):
+    """
+    Coroutine_ to wait until the Q program segment started on
+    ``motors`` finished.  The motor status is first checked
+    ``duration`` seconds after the segment started, and then every
+    ``poll`` seconds.
+    """
+    await asyncio.sleep(max(duration - poll, 0.0))
+    while True:
+        await asyncio.gather(
+            *[motor._retrieve_motor_status_async() for motor in motors]
+        )
+        if not any(
+            motor.status["q_program"] or motor.is_moving for motor in motors
+        ):
+            return
+
+        await asyncio.sleep(poll)
+
+
+async def run_q_program_async(
+    program: QProgram,
+    *,
+    allow_upload: bool = False,
+    poll: Optional[float] = None,
+    callback: Optional[Callable[[int], Any]] = None,
+) -> QProgramResult:
+    """
+    Coroutine_ to upload and run the Q program ``program``.  Must be
+    awaited from within the `event loop`_ of the motors.
+
+    Parameters
+    ----------
+    program: QProgram
+        The program to run, see `compile_q_program`.  The motors must
+        be stopped.
+
+    allow_upload: bool, optional
+        If `True`, then the segments not yet stored on the motors are
+        uploaded, see the warning in `~bapsf_motion.actors.qprogram`.
+        (DEFAULT: `False`)
+
+    poll: float, optional
+        Interval (in seconds) the motor status is polled at once a
+        segment is due to finish.  If `None`, then ``heartrate.FINE``
+        of the first motor is used. (DEFAULT: `None`)
+
+    callback: :term:`callable`, optional
+        Called with the index of every point (into the compiled
+        ``targets``) once all motors finished the segment containing
+        the point. (DEFAULT: `None`)
+
+    Returns
+    -------
+    QProgramResult
+        The outcome of the run.  If a motor rejects a segment or the
+        connection to a motor is lost, then all motors are stopped and
+        the run is ended.
+
+    Raises
+    ------
+    RuntimeError
+        If the motors are terminated, disconnected, or moving, or if
+        segments need to be uploaded and ``allow_upload`` is `False`.
+    """
+    motors = program.motors
+    if any(motor.terminated or not motor.connected for motor in motors):
+        raise RuntimeError(
+            "Can not run a Q program on terminated or disconnected motors."
+        )
+    elif any(motor.is_moving for motor in motors):
+        raise RuntimeError("Can not run a Q program on motors that are moving.")
+    elif not allow_upload and len(program._uploaded) < len(program.segments):
+        raise RuntimeError(
+            "The Q program segments need to be uploaded to the motors, which "
+            "has not been confirmed on the motor hardware yet.  Use "
+            "allow_upload=True to upload the segments."
+        )
+
+    if poll is None:
+        poll = motors[0].heartrate.FINE
+
+    await asyncio.gather(*[motor._send_command_async("enable") for motor in motors])
+    for motor in motors:
+        motor._move_eta = None
+
+    tstart = time.monotonic()
+    points = 0
+    uploads = 0
+    ok = True
+    try:
+        for index, segment in enumerate(program.segments):
+            if index not in program._uploaded:
+                ok = await program._upload_async(index)
+                uploads += 1
+                if not ok:
+                    break
+
+            rtn = await asyncio.gather(
+                *[
+                    motor._send_command_async("queue_load_execute", segment.number)
+                    for motor in motors
+                ]
+            )
+            ok = all(
+                _rtn in (motor.ack_flags.ACK, motor.ack_flags.ACK_QUEUED)
+                for motor, _rtn in zip(motors, rtn)
+            )
+            if not ok:
+                motors[0].logger.error(
+                    f"Unable to execute Q segment {segment.number}, got "
+                    f"responses {rtn}."
+                )
+                break
+
+            for motor in motors:
+                motor._wake_heartbeat()
+
+            await _wait_for_segment_async(motors, segment.duration, poll)
+            if not all(motor.connected for motor in motors):
+                ok = False
+                break
+
+            if callback is not None:
+                for point in segment.points:
+                    callback(point)
+            points += len(segment.points)
+    except BaseException:
+        await _stop_motors(motors)
+        raise
+
+    if not ok:
+        await _stop_motors(motors)
+
+    return QProgramResult(
+        points=points,
+        completed=points == program.npoints,
+        elapsed=time.monotonic() - tstart,
+        uploads=uploads,
+    )
+
+
+async def _stop_motors(motors: List[Motor]):
+    """Coroutine_ to stop ``motors``, which also ends their Q programs."""
+    await asyncio.gather(
+        *[
+            motor._send_command_async("stop", False)
+            for motor in motors
+            if not motor.terminated
+        ],
+        return_exceptions=True,
+    )
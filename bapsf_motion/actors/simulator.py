@@ -0,0 +1,1086 @@
+"""
+Module for simulating Applied Motion STM stepper motors, so the actors
+in `bapsf_motion.actors` can be exercised and benchmarked without lab
+hardware.
+
+A `SimulatedMotor` implements the subset of the SCL (Serial Command
+Language) used by `~bapsf_motion.actors.motor_.Motor`, including a
+trapezoidal motion profile, limit switches, alarms, the command buffer
+(queue), and Q program segments.  A `MotorSimulator` serves any number
+of simulated motors over TCP and UDP, just like the physical motors,
+with configurable network latency, jitter, and packet loss.
+
+The simulator can also be launched from the command line, e.g.
+
+.. code-block:: bash
+
+    python -m bapsf_motion.actors.simulator --count 10 --base-port 17000
+
+"""
+__all__ = ["MotorSimulator", "SimulatedMotor"]
+
+import asyncio
+import logging
+import math
+import random
+import re
+import threading
+import time
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from bapsf_motion.actors.profile import trapezoid_profile
+from bapsf_motion.actors.transport import SCLFrameDecoder, scl_decode, scl_encode
+
+#: Alarm codes that are considered drive faults, these disable the motor
+_FAULT_CODES = {1, 8, 10, 20, 80, 100}
+
+#: SCL commands that are executed immediately, even if the command
+#: buffer (queue) is busy
+_IMMEDIATE_COMMANDS = {"AL", "AR", "BS", "IP", "QS", "RS", "SJ", "SK"}
+
+#: Size of the motor's command buffer (queue)
+_BUFFER_SIZE = 63
+
+#: Number of Q program segments in the motor's non-volatile memory
+_Q_SEGMENTS = 12
+
+
+class _MotionProfile:
+    """
+    A motion profile made up of consecutive constant acceleration
+    phases.  Positions are in steps and times are in seconds.
+
+    Parameters
+    ----------
+    start_time: float
+        Simulated time the profile starts.
+
+    start_pos: float
+        Position at the start of the profile.
+
+    phases: List[Tuple[float, float, float]]
+        Consecutive ``(duration, initial velocity, acceleration)``
+        phases.  The last phase may have an infinite duration (e.g. a
+        continuous jog).
+
+    final_pos: float, optional
+        Exact position at the end of the profile, to avoid round-off
+        error in the integrated position.
+    """
+
+    def __init__(
+        self,
+        start_time: float,
+        start_pos: float,
+        phases: List[Tuple[float, float, float]],
+        final_pos: Optional[float] = None,
+    ):
+        self.start_time = start_time
+        self.start_pos = start_pos
+        self.phases = phases
+        self.final_pos = final_pos
+
+    @property
+    def end_time(self) -> float:
+        """Simulated time the profile ends."""
+        return self.start_time + sum(phase[0] for phase in self.phases)
+
+    @property
+    def direction(self) -> int:
+        """Direction of motion, ``1`` (CW) or ``-1`` (CCW)."""
+        for _, v0, accel in self.phases:
+            if v0 != 0 or accel != 0:
+                return 1 if (v0 + accel) > 0 else -1
+        return 0
+
+    def state(self, t: float) -> Tuple[float, float]:
+        """Return the ``(position, velocity)`` at simulated time ``t``."""
+        tau = max(t - self.start_time, 0.0)
+        pos = self.start_pos
+        for duration, v0, accel in self.phases:
+            if tau < duration:
+                return (
+                    pos + v0 * tau + 0.5 * accel * tau**2,
+                    v0 + accel * tau,
+                )
+            pos += v0 * duration + 0.5 * accel * duration**2
+            tau -= duration
+
+        if self.final_pos is not None:
+            pos = self.final_pos
+        return pos, 0.0
+
+    @classmethod
+    def trapezoid(
+        cls,
+        start_time: float,
+        start_pos: float,
+        target: float,
+        speed: float,
+        accel: float,
+        decel: float,
+    ) -> "_MotionProfile":
+        """
+        Profile for a point-to-point move, starting and ending at rest,
+        with a max speed of ``speed`` (steps/s) and an acceleration and
+        deceleration of ``accel`` and ``decel`` (steps/s^2).  If the
+        move is too short to reach ``speed``, then the profile is
+        triangular.
+        """
+        profile = trapezoid_profile(target - start_pos, speed, accel, decel)
+        if profile.duration == 0:
+            return cls(start_time, start_pos, [], final_pos=target)
+
+        sign = 1 if target >= start_pos else -1
+        v_peak = sign * profile.v_peak
+        phases = [
+            (profile.t_accel, 0.0, sign * accel),
+            (profile.t_cruise, v_peak, 0.0),
+            (profile.t_decel, v_peak, -sign * decel),
+        ]
+        return cls(start_time, start_pos, phases, final_pos=target)
+
+    @classmethod
+    def jog(
+        cls,
+        start_time: float,
+        start_pos: float,
+        velocity: float,
+        accel: float,
+    ) -> "_MotionProfile":
+        """
+        Profile for a continuous jog that accelerates from rest to the
+        signed ``velocity`` (steps/s) and never stops.
+        """
+        sign = 1 if velocity >= 0 else -1
+        t_accel = abs(velocity) / accel if accel > 0 else 0.0
+        phases = [
+            (t_accel, 0.0, sign * accel),
+            (math.inf, velocity, 0.0),
+        ]
+        return cls(start_time, start_pos, phases)
+
+    @classmethod
+    def decelerate(
+        cls,
+        start_time: float,
+        start_pos: float,
+        velocity: float,
+        decel: float,
+    ) -> "_MotionProfile":
+        """
+        Profile for decelerating from the signed ``velocity`` (steps/s)
+        to rest with a deceleration of ``decel`` (steps/s^2).
+        """
+        if velocity == 0 or decel <= 0:
+            return cls(start_time, start_pos, [])
+
+        sign = 1 if velocity > 0 else -1
+        return cls(
+            start_time, start_pos, [(abs(velocity) / decel, velocity, -sign * decel)]
+        )
+
+
+class SimulatedMotor:
+    """
+    A simulated Applied Motion STM stepper motor that responds to SCL
+    commands like the physical motor.  Movements follow a trapezoidal
+    profile in simulated time, which can be sped up with
+    ``time_scale``.
+
+    The motor is always configured for ethernet communication, i.e.
+    commands and responses are exchanged as strings without the
+    ethernet header and end-of-message bytes.  Use `MotorSimulator` to
+    serve the motor over TCP and UDP.
+
+    Parameters
+    ----------
+    name: `str`, optional
+        Name of the motor, used in logging. (DEFAULT: ``"sim"``)
+
+    gearing: `int`, optional
+        Number of steps per revolution (``EG``).
+        (DEFAULT: ``20000``)
+
+    encoder_resolution: `int`, optional
+        Number of encoder counts per revolution (``ER``).
+        (DEFAULT: ``4000``)
+
+    protocol: `int`, optional
+        Initial protocol setting (``PR``).  Bit 2 (``4``) must be set for
+        the motor to always return an Ack/Nack. (DEFAULT: ``5``)
+
+    limits: Tuple[Optional[float], Optional[float]], optional
+        ``(CCW, CW)`` positions (in steps) of the limit switches.  A
+        value of `None` means there is no switch in that direction.
+        (DEFAULT: ``(None, None)``)
+
+    time_scale: `float`, optional
+        Rate simulated time passes relative to wall-clock time, e.g.
+        ``10`` makes every move finish 10 times faster.
+        (DEFAULT: ``1.0``)
+
+    Examples
+    --------
+
+    >>> motor = SimulatedMotor(limits=(None, 1000))
+    >>> motor.handle("IP")
+    'IP=00000000'
+    >>> motor.handle("IFD")
+    '%'
+    >>> motor.handle("VE")
+    'VE=1.0000'
+    >>> motor.handle("XX")
+    '?7'
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str = "sim",
+        gearing: int = 20000,
+        encoder_resolution: int = 4000,
+        protocol: int = 5,
+        limits: Tuple[Optional[float], Optional[float]] = (None, None),
+        time_scale: float = 1.0,
+    ):
+        self.name = name
+        self.logger = logging.getLogger(f"SimMotor.{name}")
+        self.time_scale = time_scale
+        self._t0 = time.monotonic()
+
+        self._registers = {
+            "AC": 25.0,
+            "CC": 5.0,
+            "CI": 2.5,
+            "DE": 25.0,
+            "DI": 0,
+            "DL": 1,
+            "EG": gearing,
+            "ER": encoder_resolution,
+            "IF": "H",
+            "JA": 25.0,
+            "JL": 25.0,
+            "JS": 1.0,
+            "PR": protocol,
+            "VE": 1.0,
+        }  # type: Dict[str, Any]
+
+        self._position = 0.0  # in steps
+        self._enabled = True
+        self._alarms = set()  # type: Set[int]
+        self._limits = limits
+
+        self._profile = None  # type: Optional[_MotionProfile]
+        self._motion = None  # type: Optional[str]
+        self._wait_until = None  # type: Optional[float]
+        self._busy_until = 0.0
+        self._queue = deque()  # type: Deque[Tuple[str, str]]
+        self._q_segments = {}  # type: Dict[int, List[Tuple[str, str]]]
+        self._q_running = False
+
+        self._handlers = {
+            "AL": self._cmd_alarm,
+            "AR": self._cmd_alarm_reset,
+            "BS": self._cmd_buffer_size,
+            "CJ": self._cmd_commence_jogging,
+            "EP": self._cmd_encoder_position,
+            "FL": self._cmd_feed_to_length,
+            "FP": self._cmd_feed_to_position,
+            "IP": self._cmd_immediate_position,
+            "MD": self._cmd_motor_disable,
+            "ME": self._cmd_motor_enable,
+            "QS": self._cmd_queue_save,
+            "QX": self._cmd_queue_load_execute,
+            "RS": self._cmd_request_status,
+            "SJ": self._cmd_stop_jogging,
+            "SK": self._cmd_stop_and_kill,
+            "SP": self._cmd_set_position,
+            "WT": self._cmd_wait_time,
+        }  # type: Dict[str, Callable[[str, float], Optional[str]]]
+
+    # -- public interface --------------------------------------------------
+
+    def now(self) -> float:
+        """The current simulated time (in seconds)."""
+        return (time.monotonic() - self._t0) * self.time_scale
+
+    @property
+    def position(self) -> float:
+        """Current position of the motor (in steps)."""
+        self._update()
+        return self._position
+
+    @property
+    def velocity(self) -> float:
+        """Current velocity of the motor (in steps/s)."""
+        self._update()
+        if self._profile is None:
+            return 0.0
+        return self._profile.state(self.now())[1]
+
+    @property
+    def is_moving(self) -> bool:
+        """`True` if the motor is moving."""
+        self._update()
+        return self._profile is not None
+
+    @property
+    def alarms(self) -> Set[int]:
+        """Set of active alarm codes."""
+        self._update()
+        return set(self._alarms)
+
+    @property
+    def registers(self) -> Dict[str, Any]:
+        """The motor's setting registers (e.g. ``"VE"``, ``"AC"``)."""
+        return self._registers
+
+    def trigger_alarm(self, code: int):
+        """
+        Raise the alarm code ``code``.  If the code is a drive fault,
+        then the motor is stopped and disabled.
+        """
+        self._update()
+        self._alarms.add(code)
+        if code in _FAULT_CODES:
+            self._halt(self.now())
+            self._enabled = False
+
+    def clear_alarms(self):
+        """Clear all alarm codes, regardless of their cause."""
+        self._alarms.clear()
+
+    def handle(self, cmd: str) -> Optional[str]:
+        """
+        Process the SCL command string ``cmd`` and return the response
+        string.  `None` is returned if the motor would not respond
+        (i.e. the "Always return Ack/Nack" protocol bit is not set).
+        """
+        self._update()
+
+        match = re.fullmatch(r"(?P<code>[A-Z]{2})(?P<arg>.*)", cmd.strip())
+        if match is None:
+            return self._nack(11)  # bad character
+
+        code, arg = match.group("code"), match.group("arg").strip()
+        if code not in self._handlers and code not in self._registers:
+            return self._nack(7)  # cannot process command
+
+        is_query = arg == "" and (code in self._registers or code in ("EP", "SP"))
+        if (
+            not is_query
+            and code not in _IMMEDIATE_COMMANDS
+            and self._busy(self.now())
+        ):
+            # buffered command while the motor is busy, it is executed
+            # once the commands ahead of it finish
+            if len(self._queue) >= _BUFFER_SIZE:
+                return self._nack(6)  # command buffer full
+            self._queue.append((code, arg))
+            return "*" if self._ack_enabled else None
+
+        return self._execute(code, arg, self.now())
+
+    # -- internals ---------------------------------------------------------
+
+    @property
+    def _ack_enabled(self) -> bool:
+        return bool(int(self._registers["PR"]) & 0b100)
+
+    @property
+    def _steps_per_rev(self) -> float:
+        return float(self._registers["EG"])
+
+    @property
+    def _limits_enabled(self) -> bool:
+        return int(self._registers["DL"]) != 3
+
+    def _ack(self) -> Optional[str]:
+        return "%" if self._ack_enabled else None
+
+    def _nack(self, code: int) -> Optional[str]:
+        return f"?{code}" if self._ack_enabled else None
+
+    def _busy(self, t: float) -> bool:
+        return (
+            self._profile is not None
+            or self._wait_until is not None
+            or len(self._queue) > 0
+        )
+
+    def _on_limit(self, position: float) -> Dict[str, bool]:
+        ccw, cw = self._limits
+        if not self._limits_enabled:
+            return {"CCW": False, "CW": False}
+        return {
+            "CCW": ccw is not None and position <= ccw,
+            "CW": cw is not None and position >= cw,
+        }
+
+    def _update(self):
+        """Advance the simulation to the current simulated time."""
+        now = self.now()
+        while True:
+            if self._profile is not None:
+                end = min(now, self._profile.end_time)
+                pos, _ = self._profile.state(end)
+
+                on_limit = self._on_limit(pos)
+                direction = self._profile.direction
+                if (direction > 0 and on_limit["CW"]) or (
+                    direction < 0 and on_limit["CCW"]
+                ):
+                    # hit a limit switch, the motor stops at the switch and
+                    # the command buffer is flushed
+                    ccw, cw = self._limits
+                    self._position = cw if direction > 0 else ccw
+                    self._alarms.add(4 if direction > 0 else 2)
+                    self._profile = None
+                    self._motion = None
+                    self._queue.clear()
+                    self._busy_until = end
+                    self.logger.debug(f"Hit limit at position {self._position}.")
+                    continue
+
+                if now < self._profile.end_time:
+                    self._position = pos
+                    return
+
+                self._position = pos
+                self._busy_until = self._profile.end_time
+                self._profile = None
+                self._motion = None
+
+            if self._wait_until is not None:
+                if now < self._wait_until:
+                    return
+                self._busy_until = self._wait_until
+                self._wait_until = None
+
+            if len(self._queue) == 0:
+                self._q_running = False
+                return
+
+            code, arg = self._queue.popleft()
+            self._execute(code, arg, self._busy_until)
+
+    def _execute(self, code: str, arg: str, t: float) -> Optional[str]:
+        if code in self._handlers:
+            return self._handlers[code](arg, t)
+        return self._cmd_register(code, arg, t)
+
+    def _halt(self, t: float):
+        """Stop all motion immediately and flush the command buffer."""
+        if self._profile is not None:
+            self._position = self._profile.state(t)[0]
+        self._profile = None
+        self._motion = None
+        self._wait_until = None
+        self._queue.clear()
+        self._q_running = False
+        self._busy_until = t
+
+    def _start_profile(self, profile: _MotionProfile, motion: str) -> Optional[str]:
+        if not self._enabled or any(code in _FAULT_CODES for code in self._alarms):
+            return self._nack(7)
+
+        on_limit = self._on_limit(profile.start_pos)
+        if (profile.direction > 0 and on_limit["CW"]) or (
+            profile.direction < 0 and on_limit["CCW"]
+        ):
+            # can not move further into an active limit switch
+            self._alarms.add(4 if profile.direction > 0 else 2)
+            return self._ack()
+
+        self._profile = profile
+        self._motion = motion
+        return self._ack()
+
+    def _cmd_register(self, code: str, arg: str, t: float) -> Optional[str]:
+        fmt = {
+            "AC": "{:.3f}",
+            "CC": "{:.1f}",
+            "CI": "{:.1f}",
+            "DE": "{:.3f}",
+            "JA": "{:.3f}",
+            "JL": "{:.3f}",
+            "JS": "{:.4f}",
+            "VE": "{:.4f}",
+        }.get(code, "{}")
+
+        if arg == "":
+            return f"{code}={fmt.format(self._registers[code])}"
+
+        value = self._registers[code]
+        try:
+            if code == "IF":
+                if arg not in ("D", "H"):
+                    raise ValueError
+                value = arg
+            elif isinstance(value, int):
+                value = int(arg)
+            else:
+                value = float(arg)
+        except ValueError:
+            return self._nack(5)  # parameters out of range
+
+        if code in ("EG", "ER") and value <= 0:
+            return self._nack(5)
+
+        was_acking = self._ack_enabled
+        self._registers[code] = value
+        if code == "PR" and not was_acking:
+            # if Ack/Nack was not enabled, then the protocol setting
+            # itself does not return an Ack/Nack
+            return None
+        return self._ack()
+
+    def _cmd_alarm(self, arg: str, t: float) -> Optional[str]:
+        return f"AL={sum(self._alarms):04d}"
+
+    def _cmd_alarm_reset(self, arg: str, t: float) -> Optional[str]:
+        # limit alarms persist while the switch is still active
+        on_limit = self._on_limit(self._position)
+        self._alarms = {
+            code
+            for code in self._alarms
+            if (code == 2 and on_limit["CCW"]) or (code == 4 and on_limit["CW"])
+        }
+        return self._ack()
+
+    def _cmd_buffer_size(self, arg: str, t: float) -> Optional[str]:
+        return f"BS={_BUFFER_SIZE - len(self._queue)}"
+
+    def _cmd_commence_jogging(self, arg: str, t: float) -> Optional[str]:
+        if self._motion == "jog":
+            return self._ack()
+
+        direction = -1 if int(self._registers["DI"]) < 0 else 1
+        velocity = direction * float(self._registers["JS"]) * self._steps_per_rev
+        accel = float(self._registers["JA"]) * self._steps_per_rev
+        return self._start_profile(
+            _MotionProfile.jog(t, self._position, velocity, accel), "jog"
+        )
+
+    def _cmd_encoder_position(self, arg: str, t: float) -> Optional[str]:
+        ratio = float(self._registers["ER"]) / self._steps_per_rev
+        if arg == "":
+            return f"EP={int(round(self._position * ratio))}"
+
+        try:
+            self._position = int(arg) / ratio
+        except ValueError:
+            return self._nack(5)
+        return self._ack()
+
+    def _cmd_feed_to_length(self, arg: str, t: float) -> Optional[str]:
+        return self._feed(self._position + int(self._registers["DI"]), t)
+
+    def _cmd_feed_to_position(self, arg: str, t: float) -> Optional[str]:
+        return self._feed(float(self._registers["DI"]), t)
+
+    def _feed(self, target: float, t: float) -> Optional[str]:
+        spr = self._steps_per_rev
+        profile = _MotionProfile.trapezoid(
+            t,
+            self._position,
+            target,
+            speed=float(self._registers["VE"]) * spr,
+            accel=float(self._registers["AC"]) * spr,
+            decel=float(self._registers["DE"]) * spr,
+        )
+        if len(profile.phases) == 0:
+            return self._ack()
+
+        return self._start_profile(profile, "feed")
+
+    def _cmd_immediate_position(self, arg: str, t: float) -> Optional[str]:
+        pos = int(round(self._position))
+        if self._registers["IF"] == "H":
+            return f"IP={pos & 0xFFFFFFFF:08X}"
+        return f"IP={pos}"
+
+    def _cmd_motor_disable(self, arg: str, t: float) -> Optional[str]:
+        self._halt(t)
+        self._enabled = False
+        return self._ack()
+
+    def _cmd_motor_enable(self, arg: str, t: float) -> Optional[str]:
+        if any(code in _FAULT_CODES for code in self._alarms):
+            return self._nack(7)
+        self._enabled = True
+        return self._ack()
+
+    def _q_segment(self, arg: str) -> Optional[int]:
+        try:
+            segment = int(arg)
+        except ValueError:
+            return None
+        return segment if 1 <= segment <= _Q_SEGMENTS else None
+
+    def _cmd_queue_load_execute(self, arg: str, t: float) -> Optional[str]:
+        segment = self._q_segment(arg)
+        if segment is None:
+            return self._nack(5)
+
+        # the Q program is executed from the command buffer, starting now
+        self._queue.extendleft(reversed(self._q_segments.get(segment, [])))
+        self._q_running = len(self._queue) > 0
+        self._busy_until = t
+        return self._ack()
+
+    def _cmd_queue_save(self, arg: str, t: float) -> Optional[str]:
+        segment = self._q_segment(arg)
+        if segment is None:
+            return self._nack(5)
+
+        # save the commands waiting in the command buffer
+        self._q_segments[segment] = list(self._queue)
+        return self._ack()
+
+    def _cmd_request_status(self, arg: str, t: float) -> Optional[str]:
+        status = ""
+        if len(self._alarms):
+            status += "A"
+        status += "R" if self._enabled else "D"
+        if any(code in _FAULT_CODES for code in self._alarms):
+            status += "E"
+        if self._profile is not None:
+            status += "F"
+        if self._motion == "jog":
+            status += "J"
+        if self._busy(t):
+            status += "M"
+        if self._profile is None and self._enabled:
+            status += "P"
+        if self._q_running:
+            status += "Q"
+        if self._motion == "stop":
+            status += "S"
+        if self._wait_until is not None:
+            status += "T"
+        return f"RS={status}"
+
+    def _cmd_set_position(self, arg: str, t: float) -> Optional[str]:
+        if arg == "":
+            return f"SP={int(round(self._position))}"
+
+        try:
+            self._position = float(int(arg))
+        except ValueError:
+            return self._nack(5)
+        return self._ack()
+
+    def _cmd_stop_and_kill(self, arg: str, t: float) -> Optional[str]:
+        if arg != "D" or self._profile is None:
+            self._halt(t)
+            return self._ack()
+
+        # decelerate to a stop
+        pos, vel = self._profile.state(t)
+        decel = "JL" if self._motion == "jog" else "DE"
+        self._halt(t)
+        self._position = pos
+        self._profile = _MotionProfile.decelerate(
+            t, pos, vel, float(self._registers[decel]) * self._steps_per_rev
+        )
+        self._motion = "stop"
+        return self._ack()
+
+    def _cmd_stop_jogging(self, arg: str, t: float) -> Optional[str]:
+        if self._motion != "jog":
+            return self._ack()
+
+        pos, vel = self._profile.state(t)
+        self._position = pos
+        self._profile = _MotionProfile.decelerate(
+            t, pos, vel, float(self._registers["JL"]) * self._steps_per_rev
+        )
+        self._motion = "stop"
+        return self._ack()
+
+    def _cmd_wait_time(self, arg: str, t: float) -> Optional[str]:
+        try:
+            self._wait_until = t + float(arg)
+        except ValueError:
+            return self._nack(5)
+        return self._ack()
+
+
+class _SimulatedConnection(asyncio.Protocol):
+    """TCP connection to a simulated motor."""
+
+    def __init__(self, server: "MotorSimulator", motor: SimulatedMotor):
+        self._server = server
+        self._motor = motor
+        self._transport = None  # type: Optional[asyncio.Transport]
+        self._decoder = SCLFrameDecoder()
+        self._replies = deque()  # type: Deque[bytes]
+        self._last_reply = 0.0
+
+    def connection_made(self, transport: asyncio.Transport):
+        self._transport = transport
+        self._server._connections.add(transport)
+
+    def data_received(self, data: bytes):
+        for cmd in self._decoder.feed(data):
+            reply = self._motor.handle(cmd)
+            if reply is None:
+                continue
+
+            # a lost TCP segment is retransmitted, which shows up as a
+            # delay, and replies are always delivered in order
+            loop = asyncio.get_running_loop()
+            delay = self._server._delay()
+            if self._server._lose_packet():
+                delay += self._server.tcp_retransmit
+            self._last_reply = max(loop.time() + delay, self._last_reply)
+            self._replies.append(scl_encode(reply))
+            loop.call_at(self._last_reply, self._write_next)
+
+    def _write_next(self):
+        # timers with the same deadline may fire in any order, so each
+        # timer writes the oldest pending reply
+        data = self._replies.popleft()
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.write(data)
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._server._connections.discard(self._transport)
+        self._transport = None
+
+
+class _SimulatedDatagramEndpoint(asyncio.DatagramProtocol):
+    """UDP endpoint of a simulated motor."""
+
+    def __init__(self, server: "MotorSimulator", motor: SimulatedMotor):
+        self._server = server
+        self._motor = motor
+        self._transport = None  # type: Optional[asyncio.DatagramTransport]
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        if self._server._lose_packet():
+            return
+
+        reply = self._motor.handle(scl_decode(data))
+        if reply is None or self._server._lose_packet():
+            return
+
+        asyncio.get_running_loop().call_later(
+            self._server._delay(), self._transport.sendto, scl_encode(reply), addr
+        )
+
+
+class MotorSimulator:
+    """
+    Serve any number of `SimulatedMotor`\\ s over TCP and UDP, so they
+    can be connected to with `~bapsf_motion.actors.motor_.Motor`.
+
+    Each motor is served on its own ``(host, tcp_port)`` and
+    ``(host, udp_port)``.  Motors can be given distinct loopback
+    addresses (e.g. ``127.0.0.2``, ``127.0.0.3``, ...) with Applied
+    Motion's default ports, or share a host with distinct ports.
+
+    Parameters
+    ----------
+    latency: `float`, optional
+        Delay (in seconds) added to every reply. (DEFAULT: ``0.0``)
+
+    jitter: `float`, optional
+        Max random delay (in seconds) added on top of ``latency``.
+        (DEFAULT: ``0.0``)
+
+    packet_loss: `float`, optional
+        Probability (0 - 1) a message is lost.  For UDP, requests and
+        replies are dropped.  For TCP, a lost segment delays the reply
+        by ``tcp_retransmit`` seconds. (DEFAULT: ``0.0``)
+
+    tcp_retransmit: `float`, optional
+        Delay (in seconds) of a TCP retransmission. (DEFAULT: ``0.2``)
+
+    seed: `int`, optional
+        Seed for the random number generator of the jitter and packet
+        loss. (DEFAULT: `None`)
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        sim = MotorSimulator(latency=0.002, jitter=0.001)
+        for ii in range(10):
+            sim.add_motor(host="127.0.0.1", tcp_port=17000 + ii)
+        sim.start()  # serve in a background thread
+
+        m1 = Motor(ip="127.0.0.1", port=17000, auto_run=True)
+
+        ...
+
+        m1.terminate()
+        sim.stop()
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        packet_loss: float = 0.0,
+        tcp_retransmit: float = 0.2,
+        seed: Optional[int] = None,
+    ):
+        self.logger = logging.getLogger("MotorSimulator")
+        self.latency = latency
+        self.jitter = jitter
+        self.packet_loss = packet_loss
+        self.tcp_retransmit = tcp_retransmit
+        self._random = random.Random(seed)
+
+        self._motors = []  # type: List[Tuple[SimulatedMotor, str, Optional[int], Optional[int]]]
+        self._servers = []  # type: List[Union[asyncio.AbstractServer, asyncio.BaseTransport]]
+        self._connections = set()  # type: Set[asyncio.Transport]
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._thread = None  # type: Optional[threading.Thread]
+
+    @property
+    def motors(self) -> List[SimulatedMotor]:
+        """List of the simulated motors."""
+        return [entry[0] for entry in self._motors]
+
+    @property
+    def addresses(self) -> List[Dict[str, Any]]:
+        """
+        List of the addresses each motor is served on, as a `dict` with
+        keys ``"host"``, ``"tcp_port"``, and ``"udp_port"``.
+        """
+        return [
+            {"host": host, "tcp_port": tcp_port, "udp_port": udp_port}
+            for _, host, tcp_port, udp_port in self._motors
+        ]
+
+    def add_motor(
+        self,
+        host: str = "127.0.0.1",
+        tcp_port: Optional[int] = 7776,
+        udp_port: Optional[int] = None,
+        motor: Optional[SimulatedMotor] = None,
+        **kwargs,
+    ) -> SimulatedMotor:
+        """
+        Add a simulated motor to be served.  Must be called before the
+        simulator is started.
+
+        Parameters
+        ----------
+        host: `str`
+            IPv4 address to serve the motor on.
+            (DEFAULT: ``"127.0.0.1"``)
+
+        tcp_port: `int`, optional
+            TCP port to serve the motor on.  If `None`, then the motor
+            is not served over TCP. (DEFAULT: ``7776``)
+
+        udp_port: `int`, optional
+            UDP port to serve the motor on.  If `None`, then the motor
+            is not served over UDP. (DEFAULT: `None`)
+
+        motor: `SimulatedMotor`, optional
+            The motor to serve.  If `None`, then a new motor is
+            created with the keyword arguments ``**kwargs``.
+            (DEFAULT: `None`)
+        """
+        if motor is None:
+            kwargs.setdefault("name", f"{host}:{tcp_port}")
+            motor = SimulatedMotor(**kwargs)
+
+        self._motors.append((motor, host, tcp_port, udp_port))
+        return motor
+
+    def _delay(self) -> float:
+        return self.latency + self._random.uniform(0.0, self.jitter)
+
+    def _lose_packet(self) -> bool:
+        return self.packet_loss > 0 and self._random.random() < self.packet_loss
+
+    async def serve(self):
+        """
+        Start serving all the motors in the running `event loop`_.
+        """
+        loop = asyncio.get_running_loop()
+        for motor, host, tcp_port, udp_port in self._motors:
+            if tcp_port is not None:
+                server = await loop.create_server(
+                    lambda _m=motor: _SimulatedConnection(self, _m),
+                    host=host,
+                    port=tcp_port,
+                    reuse_address=True,
+                )
+                self._servers.append(server)
+
+            if udp_port is not None:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda _m=motor: _SimulatedDatagramEndpoint(self, _m),
+                    local_addr=(host, udp_port),
+                )
+                self._servers.append(transport)
+
+            self.logger.info(
+                f"Serving simulated motor '{motor.name}' on {host} "
+                f"(TCP {tcp_port}, UDP {udp_port})."
+            )
+
+    def close(self):
+        """
+        Stop serving the motors and close all client connections.  Must
+        be called from the loop.
+        """
+        for server in self._servers:
+            server.close()
+        self._servers = []
+
+        for transport in list(self._connections):
+            transport.close()
+        self._connections.clear()
+
+    def start(self):
+        """
+        Start serving all the motors in a new `event loop`_ running in
+        a background (daemon) thread.  Returns once the motors are
+        being served.
+        """
+        if self._thread is not None:
+            return
+
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self.serve())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread started by :meth:`start`."""
+        if self._thread is None:
+            return
+
+        future = asyncio.run_coroutine_threadsafe(self._aclose(), self._loop)
+        future.result(5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+        self._loop.close()
+        self._thread = None
+        self._loop = None
+
+    async def _aclose(self):
+        servers = [
+            server for server in self._servers
+            if isinstance(server, asyncio.AbstractServer)
+        ]
+        self.close()
+        for server in servers:
+            await server.wait_closed()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serve simulated Applied Motion STM motors over TCP and UDP for "
+            "testing and benchmarking bapsf_motion without hardware."
+        ),
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=1, help="Number of motors to simulate."
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help=(
+            "IPv4 address to serve the motors on.  With --distinct-hosts, this "
+            "is the first address and each motor gets the next address."
+        ),
+    )
+    parser.add_argument(
+        "--distinct-hosts",
+        action="store_true",
+        help=(
+            "Serve each motor on its own (loopback) address with the default "
+            "ports 7776 (TCP) and 7775 (UDP), instead of distinct ports."
+        ),
+    )
+    parser.add_argument(
+        "--base-port",
+        type=int,
+        default=17000,
+        help=(
+            "First TCP port when the motors share a host.  Motor i is served "
+            "on TCP port base_port + 2*i and UDP port base_port + 2*i + 1."
+        ),
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Reply latency in seconds."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Max reply jitter in seconds."
+    )
+    parser.add_argument(
+        "--packet-loss",
+        type=float,
+        default=0.0,
+        help="Probability (0 - 1) a message is lost.",
+    )
+    parser.add_argument(
+        "--limits",
+        type=float,
+        nargs=2,
+        default=None,
+        metavar=("CCW", "CW"),
+        help="Positions (in steps) of the CCW and CW limit switches.",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=1.0,
+        help="Rate simulated time passes relative to wall-clock time.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    simulator = MotorSimulator(
+        latency=args.latency,
+        jitter=args.jitter,
+        packet_loss=args.packet_loss,
+        seed=args.seed,
+    )
+    _host = [int(part) for part in args.host.split(".")]
+    for _ii in range(args.count):
+        _kwargs = {
+            "limits": (None, None) if args.limits is None else tuple(args.limits),
+            "time_scale": args.time_scale,
+        }
+        if args.distinct_hosts:
+            _ip = ".".join(str(part) for part in _host[:3] + [_host[3] + _ii])
+            simulator.add_motor(host=_ip, tcp_port=7776, udp_port=7775, **_kwargs)
+        else:
+            simulator.add_motor(
+                host=args.host,
+                tcp_port=args.base_port + 2 * _ii,
+                udp_port=args.base_port + 2 * _ii + 1,
+                **_kwargs,
+            )
+
+    async def _main():
+        await simulator.serve()
+        await asyncio.Event().wait()  # serve forever
+
+    try:
+        asyncio.run(_main())
+    except KeyboardInterrupt:
+        pass
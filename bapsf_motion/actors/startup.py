@@ -0,0 +1,188 @@
+"""
+Module for connecting to and configuring many
+`~bapsf_motion.actors.motor_.Motor` actors concurrently.
+
+Spawning a `~bapsf_motion.actors.motor_.Motor` connects to the motor,
+configures it, and retrieves its initial status before the next
+motor is spawned.  Actors that spawn several motors (e.g.
+`~bapsf_motion.actors.drive_.Drive`,
+`~bapsf_motion.actors.motion_group_.MotionGroup`, and
+`~bapsf_motion.actors.manager_.RunManager`) spawn their motors within
+`defer_motor_startup` and then start them all at once with
+`startup_motors`, so the startup time is that of the slowest motor
+instead of the sum of all motors.
+"""
+__all__ = [
+    "defer_motor_startup",
+    "MotorStartupResult",
+    "startup_motors",
+    "startup_motors_async",
+]
+
+import asyncio
+import contextlib
+import time
+
+from typing import Iterator, List, NamedTuple, Optional
+
+from bapsf_motion.actors.base import EventActor
+from bapsf_motion.actors.motor_ import Motor
+
+
+class MotorStartupResult(NamedTuple):
+    """The outcome of starting up a single motor with `startup_motors`."""
+
+    #: Name of the motor's logger, which identifies the motor within
+    #: the actor hierarchy.
+    name: str
+
+    #: IPv4 address of the motor.
+    ip: str
+
+    #: `True` if the connection to the motor was established.
+    connected: bool
+
+    #: Time (in seconds) spent connecting to and configuring the motor.
+    elapsed: float
+
+    #: The exception raised during the startup, `None` if successful.
+    error: Optional[BaseException]
+
+
+@contextlib.contextmanager
+def defer_motor_startup(actor: EventActor) -> Iterator[bool]:
+    """
+    Context manager that defers the startup (connecting, configuring,
+    and status retrieval) of all |Motor| actors spawned below ``actor``
+    while in the context.  The deferred motors are expected to be
+    started with `startup_motors` after the context exits.
+
+    Parameters
+    ----------
+    actor: `~bapsf_motion.actors.base.EventActor`
+        The actor spawning the motors.
+
+    Yields
+    ------
+    bool
+        `True` if ``actor`` is itself within the deferred startup of
+        an ancestor actor, in which case the ancestor is responsible
+        for starting the motors and ``actor`` should not call
+        `startup_motors`.
+    """
+    parent = actor.parent
+    deferred_by_ancestor = False
+    while parent is not None:
+        if getattr(parent, "_defer_motor_startup", False):
+            deferred_by_ancestor = True
+            break
+        parent = parent.parent
+
+    actor._defer_motor_startup = True
+    try:
+        yield deferred_by_ancestor
+    finally:
+        actor._defer_motor_startup = False
+
+
+async def _startup_motor_async(motor: Motor) -> MotorStartupResult:
+    """Coroutine_ to start up ``motor`` and report the outcome."""
+    tstart = time.monotonic()
+    error = None
+    try:
+        await motor._startup_async()
+    except ConnectionError as err:
+        error = err
+
+    return MotorStartupResult(
+        name=motor.logger.name,
+        ip=motor.ip,
+        connected=motor.connected,
+        elapsed=time.monotonic() - tstart,
+        error=error,
+    )
+
+
+async def startup_motors_async(motors: List[Motor]) -> List[MotorStartupResult]:
+    """A coroutine_ version of `startup_motors`."""
+    return list(
+        await asyncio.gather(*[_startup_motor_async(motor) for motor in motors])
+    )
+
+
+def startup_motors(
+    actor: EventActor, motors: List[Motor]
+) -> List[MotorStartupResult]:
+    r"""
+    Concurrently connect to and configure ``motors``, and retrieve
+    their initial status.  A motor that can not be connected to is
+    left disconnected, just as if it had been spawned on its own.
+
+    Parameters
+    ----------
+    actor: `~bapsf_motion.actors.base.EventActor`
+        The actor that spawned ``motors``.  All motors must run in the
+        `event loop`_ of ``actor``, and the outcome is logged to the
+        ``actor`` logger.
+
+    motors: List[|Motor|]
+        The motors to start up.
+
+    Returns
+    -------
+    List[MotorStartupResult]
+        The outcome of the startup for each motor, in the order of
+        ``motors``.
+
+    Notes
+    -----
+    If called from the thread the `event loop`_ is running in, then
+    blocking that thread would deadlock the loop.  Instead, the
+    startup is scheduled as a task of ``actor`` and an empty list is
+    returned, the outcome is still logged once the startup finishes.
+    """
+    motors = [motor for motor in motors if not motor.terminated]
+    if not motors:
+        return []
+
+    loop = actor.loop
+    if not loop.is_running():
+        results = loop.run_until_complete(startup_motors_async(motors))
+    elif actor._submissions.in_loop_thread():
+        # the motors are spawned from within their running event loop,
+        # so the startup can not be waited on
+        task = loop.create_task(_background_startup_async(actor, motors))
+        actor.tasks.append(task)
+        return []
+    else:
+        results = actor._submissions.submit(startup_motors_async(motors)).result()
+
+    _log_startup_results(actor, results)
+    return results
+
+
+async def _background_startup_async(
+    actor: EventActor, motors: List[Motor]
+) -> List[MotorStartupResult]:
+    """
+    Coroutine_ to start up ``motors`` as a task of ``actor`` and log
+    the outcome.
+    """
+    results = await startup_motors_async(motors)
+    _log_startup_results(actor, results)
+    return results
+
+
+def _log_startup_results(actor: EventActor, results: List[MotorStartupResult]):
+    """Log the outcome of a motor startup to the ``actor`` logger."""
+    for result in results:
+        if result.connected:
+            actor.logger.info(
+                f"Started motor {result.name} ({result.ip}) in "
+                f"{result.elapsed:.3f} s."
+            )
+        else:
+            actor.logger.warning(
+                f"Unable to start motor {result.name} ({result.ip}) after "
+                f"{result.elapsed:.3f} s, motor is not connected."
+            )
@@ -0,0 +1,348 @@
+"""
+Module for streaming a sequence of moves into the command buffer
+(queue) of `~bapsf_motion.actors.motor_.Motor` actors.
+
+A regular move (e.g.
+`~bapsf_motion.actors.motion_group_.MotionGroup.move_ml`) sends the
+move to the motors, waits for the motors to stop, and only then sends
+the next move, so every point of a motion list costs at least one
+network round trip on top of the move itself.  Applied Motion motors
+execute buffered commands in order, so instead the target distance
+(``DI``) and feed to position (``FP``) commands of several upcoming
+points, each followed by an optional dwell (``WT``), are kept loaded
+in the buffer of every motor.  The buffer occupancy (``BS``) is
+polled while the motors work through the points and the buffer is
+refilled as points complete, so the motors go from one point to the
+next without waiting on the host.
+
+Every point is a separate segment on each motor, and the dwell of
+each motor is padded so all motors spend the same (estimated) time on
+a segment.  Thus, the motors start every point together, to the
+accuracy of the move time estimates (see
+`~bapsf_motion.actors.profile.trapezoid_profile`).
+"""
+__all__ = ["StreamResult", "stream_moves_async"]
+
+import asyncio
+import time
+
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.profile import trapezoid_profile
+
+#: Resolution (in seconds) of the motor's wait time (``WT``) command
+_WAIT_RESOLUTION = 0.01
+
+
+class StreamResult(NamedTuple):
+    """The outcome of streaming a sequence of moves."""
+
+    #: Number of points all motors reached.
+    points: int
+
+    #: `True` if all points of the sequence were reached.
+    completed: bool
+
+    #: Time (in seconds) from sending the first point to reaching the
+    #: last point.
+    elapsed: float
+
+    #: Number of times the buffer occupancy of the motors was polled.
+    polls: int
+
+
+class _MotorStream:
+    """
+    The segments streamed to a single motor and the progress of the
+    motor through them.
+    """
+
+    def __init__(self, motor: Motor, segments: List[List[Union[str, tuple]]]):
+        self.motor = motor
+        self.segments = segments
+
+        # index of every segment's feed command in the command stream
+        self.feed_index = []  # type: List[int]
+        self.sent_segments = 0
+        self.sent_commands = 0
+
+        # number of commands the motor took out of its buffer, this is
+        # only updated when the buffer occupancy is polled, so it lags
+        # behind the motor
+        self.executed = 0
+        self.capacity = None  # type: Optional[int]
+        self.finished = False
+
+    @property
+    def started(self) -> int:
+        """Number of segments whose feed command was executed."""
+        return sum(index < self.executed for index in self.feed_index)
+
+    @property
+    def reached(self) -> int:
+        """Number of segments whose move is finished."""
+        if self.finished:
+            return self.sent_segments
+
+        # the command after a feed is only taken out of the buffer once
+        # the move finished
+        return sum(index + 1 < self.executed for index in self.feed_index)
+
+    async def refill_async(self, depth: int) -> bool:
+        """
+        Coroutine_ to send segments until ``depth`` segments wait in
+        the motor buffer.  Returns `False` if the motor rejected any of
+        the commands.
+        """
+        free = self.capacity - (self.sent_commands - self.executed)
+        commands = []
+        while (
+            self.sent_segments < len(self.segments)
+            and self.sent_segments - self.started < depth
+            and len(self.segments[self.sent_segments]) <= free
+        ):
+            segment = self.segments[self.sent_segments]
+            self.feed_index.append(
+                self.sent_commands + len(commands) + segment.index("feed")
+            )
+            commands.extend(segment)
+            free -= len(segment)
+            self.sent_segments += 1
+
+        if not commands:
+            return True
+
+        self.sent_commands += len(commands)
+        rtn = await self.motor._send_commands_async(*commands)
+        ack = (self.motor.ack_flags.ACK, self.motor.ack_flags.ACK_QUEUED)
+        if not all(_rtn in ack for _rtn in rtn):
+            self.motor.logger.error(
+                f"Motor rejected streamed commands, got responses {rtn}."
+            )
+            return False
+
+        return True
+
+    async def poll_async(self) -> bool:
+        """
+        Coroutine_ to poll the buffer occupancy of the motor.  Returns
+        `False` if the occupancy could not be retrieved.
+        """
+        free = await self.motor._send_command_async("buffer_size")
+        if isinstance(free, self.motor.ack_flags):
+            return False
+
+        self.executed = self.sent_commands - (self.capacity - free)
+        if (
+            self.executed == self.sent_commands
+            and self.sent_segments == len(self.segments)
+        ):
+            # the buffer is empty, check if the last move is finished
+            await self.motor._retrieve_motor_status_async()
+            self.finished = not self.motor.is_moving
+
+        return True
+
+
+def _build_segments(
+    motors: List[Motor],
+    targets: Sequence[Sequence[int]],
+    dwell: float,
+) -> Optional[Tuple[List[List[List[Union[str, tuple]]]], List[float]]]:
+    """
+    Build the per-motor segments of the move sequence ``targets`` (in
+    steps), and the estimated time (in seconds) every motor spends on
+    each point.  Returns `None` if the motion parameters of a motor
+    are unknown.
+    """
+    rates = [motor._motion_rates() for motor in motors]
+    if any(rate is None for rate in rates):
+        return None
+
+    position = [motor.status["position"].value for motor in motors]
+    segments = [[] for _ in motors]
+    point_durations = []
+    for point in targets:
+        durations = [
+            trapezoid_profile((target - pos) / gearing, speed, accel, decel).duration
+            for target, pos, (gearing, speed, accel, decel) in zip(
+                point, position, rates
+            )
+        ]
+        duration = max(durations)
+        point_durations.append(duration + dwell)
+
+        for ii, target in enumerate(point):
+            # pad the dwell, so every motor spends the same time on the point
+            wait = _WAIT_RESOLUTION * round(
+                (duration - durations[ii] + dwell) / _WAIT_RESOLUTION
+            )
+            segment = [("target_distance", int(target)), "feed"]
+            if wait >= _WAIT_RESOLUTION:
+                segment.append(("wait_time", wait))
+            segments[ii].append(segment)
+
+        position = list(point)
+
+    return segments, point_durations
+
+
+async def _stop_streams(streams: List[_MotorStream]):
+    """
+    Coroutine_ to stop all motors of ``streams``, which also flushes
+    the motor buffers.
+    """
+    await asyncio.gather(
+        *[
+            stream.motor._send_command_async("stop", False)
+            for stream in streams
+            if not stream.motor.terminated
+        ],
+        return_exceptions=True,
+    )
+
+
+async def stream_moves_async(
+    motors: List[Motor],
+    targets: Sequence[Sequence[int]],
+    *,
+    dwell: float = 0.0,
+    depth: int = 4,
+    poll: Optional[float] = None,
+    callback: Optional[Callable[[int], Any]] = None,
+) -> StreamResult:
+    """
+    Coroutine_ to move ``motors`` through the sequence of points
+    ``targets`` by streaming the moves into the motor command buffers.
+    Must be awaited from within the `event loop`_ of the motors.
+
+    Parameters
+    ----------
+    motors: List[|Motor|]
+        The motors to move.  The motors must be stopped.
+
+    targets: Sequence[Sequence[int]]
+        The points to move through, each point gives the position (in
+        steps) of every motor in ``motors``.
+
+    dwell: float, optional
+        Time (in seconds) the motors rest at each point before moving
+        on to the next point. (DEFAULT: ``0.0``)
+
+    depth: int, optional
+        Number of upcoming points kept loaded in the motor buffers.
+        (DEFAULT: ``4``)
+
+    poll: float, optional
+        Interval (in seconds) the buffer occupancy is polled at.  If
+        `None`, then ``heartrate.FINE`` of the first motor is used.
+        (DEFAULT: `None`)
+
+    callback: :term:`callable`, optional
+        Called with the index of every point (into ``targets``) once
+        all motors reached the point. (DEFAULT: `None`)
+
+    Returns
+    -------
+    StreamResult
+        The outcome of the stream.  If a motor rejects a command or
+        the connection to a motor is lost, then all motors are stopped
+        (flushing the buffers) and the stream is ended.
+    """
+    motors = list(motors)
+    if len(motors) == 0 or len(targets) == 0:
+        return StreamResult(points=0, completed=True, elapsed=0.0, polls=0)
+    elif depth < 1:
+        raise ValueError(f"Keyword 'depth' must be at least 1, got {depth}.")
+    elif any(len(point) != len(motors) for point in targets):
+        raise ValueError(
+            f"Every point in 'targets' must have a position for each of the "
+            f"{len(motors)} motors."
+        )
+    elif any(motor.terminated or not motor.connected for motor in motors):
+        raise RuntimeError(
+            "Can not stream moves to terminated or disconnected motors."
+        )
+    elif any(motor.is_moving for motor in motors):
+        raise RuntimeError("Can not stream moves to motors that are moving.")
+
+    if poll is None:
+        poll = motors[0].heartrate.FINE
+
+    built = _build_segments(motors, targets, dwell)
+    if built is None:
+        motors[0].logger.error(
+            "The position or motion parameters of a motor are unknown, NO "
+            "MOVEMENT PERFORMED!!"
+        )
+        return StreamResult(points=0, completed=False, elapsed=0.0, polls=0)
+
+    streams = [
+        _MotorStream(motor, motor_segments)
+        for motor, motor_segments in zip(motors, built[0])
+    ]
+
+    # the buffer of an idle motor is empty, so its occupancy gives the
+    # buffer capacity
+    rtn = await asyncio.gather(
+        *[motor._send_commands_async("enable", "buffer_size") for motor in motors]
+    )
+    for stream, (_, capacity) in zip(streams, rtn):
+        if isinstance(capacity, stream.motor.ack_flags):
+            stream.motor.logger.error(
+                "Unable to retrieve the motor buffer size, NO MOVEMENT PERFORMED!!"
+            )
+            return StreamResult(points=0, completed=False, elapsed=0.0, polls=0)
+        stream.capacity = capacity
+
+        # each segment has 3 commands at most
+        depth = max(min(depth, capacity // 3), 1)
+
+    for motor in motors:
+        motor._move_eta = None
+
+    tstart = time.monotonic()
+    reached = 0
+    polls = 0
+    try:
+        while True:
+            refilled = await asyncio.gather(
+                *[stream.refill_async(depth) for stream in streams]
+            )
+            if polls == 0:
+                for motor in motors:
+                    motor._wake_heartbeat()
+
+            _reached = min(stream.reached for stream in streams)
+            if callback is not None:
+                for index in range(reached, _reached):
+                    callback(index)
+            reached = _reached
+
+            if not all(refilled) or reached == len(targets):
+                break
+
+            await asyncio.sleep(poll)
+            polled = await asyncio.gather(*[stream.poll_async() for stream in streams])
+            polls += 1
+            if not all(polled):
+                motors[0].logger.error(
+                    "Unable to retrieve the motor buffer occupancy, stopping the "
+                    "streamed moves."
+                )
+                break
+    except BaseException:
+        await _stop_streams(streams)
+        raise
+
+    completed = reached == len(targets)
+    if not completed:
+        await _stop_streams(streams)
+
+    return StreamResult(
+        points=reached,
+        completed=completed,
+        elapsed=time.monotonic() - tstart,
+        polls=polls,
+    )
@@ -0,0 +1,170 @@
+"""
+Module for the `SubmissionQueue`, which hands coroutines from other
+threads (e.g. a GUI, a DAQ, or a script) over to a running
+`event loop`_.
+
+`asyncio.run_coroutine_threadsafe` wakes up the `event loop`_ once per
+submitted coroutine.  A `SubmissionQueue` collects submissions in a
+thread-safe `~collections.deque` and wakes the loop up only once for
+all submissions made before the loop gets around to them, so a burst
+of commands does not serialize on individual loop wakeups.  The queue
+also caches the identity of the thread running the loop, so actors do
+not need a round trip through the loop to find out if they are being
+called from inside it.
+"""
+__all__ = ["SubmissionQueue", "submission_queue"]
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import weakref
+
+from typing import Coroutine, Optional
+
+
+class SubmissionQueue:
+    """
+    A queue of coroutines submitted to an `event loop`_ from any
+    thread.  Use `submission_queue` to get the queue of a given loop,
+    so all actors sharing a loop share a queue.
+
+    Parameters
+    ----------
+    loop: `asyncio.AbstractEventLoop`
+        The `event loop`_ submitted coroutines are executed in.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._pending = collections.deque()
+        self._wakeup_scheduled = False
+        self._thread_id = None  # type: Optional[int]
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The `event loop`_ submitted coroutines are executed in."""
+        return self._loop
+
+    @property
+    def thread_id(self) -> Optional[int]:
+        """
+        ID of the thread the :attr:`loop` was last seen running in,
+        `None` if it has not been seen running yet.
+        """
+        if self._thread_id is None and self.in_loop_thread():
+            self._thread_id = threading.get_ident()
+        return self._thread_id
+
+    @thread_id.setter
+    def thread_id(self, value: Optional[int]):
+        self._thread_id = value
+
+    def in_loop_thread(self) -> bool:
+        """`True` if called from the thread running :attr:`loop`."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            # no event loop is running in this thread
+            return False
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """
+        Submit the coroutine_ ``coro`` to be executed in :attr:`loop`
+        without blocking.
+
+        Parameters
+        ----------
+        coro: :term:`coroutine`
+            The coroutine_ to be executed.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future of the result of ``coro``.  Cancelling the future
+            cancels the execution of ``coro``.
+
+        Raises
+        ------
+        RuntimeError
+            If :attr:`loop` is closed.
+        """
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("Can not submit to a closed event loop.")
+
+        future = concurrent.futures.Future()
+        self._pending.append((coro, future))
+
+        if not self._wakeup_scheduled:
+            # only one wakeup is needed for all the submissions made
+            # before the loop drains the queue
+            self._wakeup_scheduled = True
+            self._loop.call_soon_threadsafe(self._drain)
+
+        return future
+
+    def _drain(self):
+        # executed in the event loop, start a task for every submission
+        self._thread_id = threading.get_ident()
+
+        # clear the flag before emptying the queue, so a submission
+        # made while draining schedules another wakeup
+        self._wakeup_scheduled = False
+        while self._pending:
+            coro, future = self._pending.popleft()
+            if future.cancelled():
+                # the submission was cancelled before it was started
+                coro.close()
+                continue
+
+            task = self._loop.create_task(coro)
+            task.add_done_callback(
+                lambda _task, _future=future: self._copy_result(_task, _future)
+            )
+            future.add_done_callback(
+                lambda _future, _task=task: self._cancel_task(_future, _task)
+            )
+
+    @staticmethod
+    def _copy_result(task: asyncio.Task, future: concurrent.futures.Future):
+        # copy the outcome of the task to the submission future
+        if task.cancelled():
+            future.cancel()
+            return
+        elif not future.set_running_or_notify_cancel():
+            # the submission future was cancelled
+            return
+
+        exc = task.exception()
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(task.result())
+
+    def _cancel_task(self, future: concurrent.futures.Future, task: asyncio.Task):
+        # the submission future was cancelled, so cancel the task too
+        if future.cancelled() and not task.done() and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(task.cancel)
+
+
+_queues = weakref.WeakKeyDictionary()
+_queues_lock = threading.Lock()
+
+
+def submission_queue(loop: asyncio.AbstractEventLoop) -> SubmissionQueue:
+    """
+    Return the `SubmissionQueue` of the `event loop`_ ``loop``, which
+    is created on first use.
+    """
+    try:
+        return _queues[loop]
+    except KeyError:
+        pass
+
+    with _queues_lock:
+        queue = _queues.get(loop)
+        if queue is None:
+            queue = _queues[loop] = SubmissionQueue(loop)
+
+    return queue
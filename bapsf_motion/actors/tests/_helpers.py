@@ -0,0 +1,99 @@
+"""
+Helpers for testing the actors against the motor simulator
+`bapsf_motion.actors.simulator`.
+"""
+__all__ = ["SimulatorTestCase"]
+
+import asyncio
+import logging
+import threading
+import unittest
+
+from typing import Any, Dict, List
+
+from bapsf_motion.actors.motor_ import Motor
+from bapsf_motion.actors.pool import connection_pool
+from bapsf_motion.actors.simulator import MotorSimulator, SimulatedMotor
+
+
+class SimulatorTestCase(unittest.TestCase):
+    """
+    Base `~unittest.TestCase` that serves simulated motors over TCP
+    and UDP and runs an `event loop`_ in a background thread for the
+    actors under test.  A new simulator and event loop are created
+    for every test.
+    """
+
+    #: Number of simulated motors to serve.
+    nmotors = 1
+
+    #: Keyword arguments for `MotorSimulator`.
+    simulator_kwargs = {}  # type: Dict[str, Any]
+
+    #: Keyword arguments for every `SimulatedMotor`.
+    motor_kwargs = {"time_scale": 10.0}  # type: Dict[str, Any]
+
+    #: Host of the first motor, motor ``i`` is served on the next
+    #: ``i``-th loopback address with the default Applied Motion ports.
+    base_host = (127, 0, 1, 1)
+
+    def setUp(self):
+        self.simulator = MotorSimulator(seed=0, **self.simulator_kwargs)
+        self.hosts = []  # type: List[str]
+        for ii in range(self.nmotors):
+            host = ".".join(str(part) for part in self.base_host[:3])
+            host = f"{host}.{self.base_host[3] + ii}"
+            self.simulator.add_motor(
+                host=host,
+                tcp_port=Motor._default_ports["tcp"],
+                udp_port=Motor._default_ports["udp"],
+                motor=SimulatedMotor(name=host, **self.motor_kwargs),
+            )
+            self.hosts.append(host)
+        self.simulator.start()
+        self.addCleanup(self.simulator.stop)
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+        self.addCleanup(self._stop_loop)
+
+        self.actors = []
+
+    def _stop_loop(self):
+        for actor in reversed(self.actors):
+            if not actor.terminated:
+                actor.terminate(delay_loop_stop=True)
+
+        # terminated motors release their connections to the pool
+        connection_pool.clear()
+
+        asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+        self.loop.close()
+
+    @staticmethod
+    async def _cancel_tasks():
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @property
+    def sim_motors(self) -> List[SimulatedMotor]:
+        """The simulated motors, in the order of :attr:`hosts`."""
+        return self.simulator.motors
+
+    def spawn_motor(self, index: int = 0, **kwargs) -> Motor:
+        """Spawn a `Motor` connected to simulated motor ``index``."""
+        kwargs.setdefault("logger", logging.getLogger(f"test.motor{index}"))
+        motor = Motor(ip=self.hosts[index], loop=self.loop, auto_run=True, **kwargs)
+        self.actors.append(motor)
+        return motor
+
+    def run_coroutine(self, coro, timeout: float = 10.0):
+        """Run ``coro`` in the event loop and return its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
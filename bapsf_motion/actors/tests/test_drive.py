@@ -0,0 +1,75 @@
+"""Tests for `Drive` against the motor simulator."""
+import logging
+import time
+import unittest
+
+from bapsf_motion.actors.drive_ import Drive
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestDriveDispatch(SimulatorTestCase):
+    """Test dispatching moves to all axes of a |Drive| concurrently."""
+
+    nmotors = 2
+
+    def setUp(self):
+        super().setUp()
+
+        # record the (monotonic) time each simulated motor receives
+        # a feed to position command
+        self.feed_times = [[] for _ in range(self.nmotors)]
+        for sim_motor, feed_times in zip(self.sim_motors, self.feed_times):
+            sim_motor.handle = self._recorder(sim_motor.handle, feed_times)
+
+        self.drive = Drive(
+            axes=[
+                {"ip": host, "units": "cm", "units_per_rev": 0.1 * 2.54}
+                for host in self.hosts
+            ],
+            name="WALL-E",
+            logger=logging.getLogger("test.drive"),
+            loop=self.loop,
+            auto_run=True,
+        )
+        self.actors.append(self.drive)
+
+    @staticmethod
+    def _recorder(handle, feed_times):
+        def record_feed(cmd):
+            if cmd == "FP":
+                feed_times.append(time.monotonic())
+            return handle(cmd)
+
+        return record_feed
+
+    def feed_skew(self) -> float:
+        times = [feed_times[-1] for feed_times in self.feed_times]
+        return max(times) - min(times)
+
+    def test_move_to(self):
+        self.assertIsNone(self.drive.dispatch_skew)
+
+        self.drive.move_to([0.5, 0.25])
+        skew = self.drive.dispatch_skew
+
+        self.assertIsNotNone(skew)
+        self.assertGreaterEqual(skew, 0.0)
+        self.assertAlmostEqual(skew, self.feed_skew(), delta=0.02)
+        self.assertTrue(self.drive.wait_for_stop(timeout=5.0))
+
+        # commands other than moves and moves of a single axis do not
+        # change the skew
+        self.drive.send_command("get_position")
+        self.drive.move_to(0.0, axis=0)
+        self.assertEqual(self.drive.dispatch_skew, skew)
+
+    def test_coordinated_move(self):
+        self.drive.move_to([0.5, 0.25], coordinated=True)
+        skew = self.drive.dispatch_skew
+
+        self.assertIsNotNone(skew)
+        self.assertAlmostEqual(skew, self.feed_skew(), delta=0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for `bapsf_motion.actors.estop` against the motor simulator."""
+import asyncio
+import time
+import unittest
+
+from bapsf_motion.actors.estop import emergency_stop, emergency_stop_async
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestEmergencyStop(SimulatorTestCase):
+    """Test the emergency stop of several simulated motors."""
+
+    nmotors = 2
+    motor_kwargs = {"time_scale": 1.0}
+
+    def setUp(self):
+        super().setUp()
+        self.motors = [self.spawn_motor(ii) for ii in range(self.nmotors)]
+
+    def start_moves(self):
+        for motor in self.motors:
+            motor.move_to(-200000)
+        time.sleep(0.2)
+        self.assertTrue(all(motor.is_moving for motor in self.sim_motors))
+
+    def assert_stopped(self, timeout: float = 0.5):
+        tstart = time.monotonic()
+        while time.monotonic() - tstart < timeout:
+            if not any(motor.is_moving for motor in self.sim_motors):
+                break
+            time.sleep(0.01)
+
+        self.assertFalse(any(motor.is_moving for motor in self.sim_motors))
+        self.assertTrue(
+            all(motor.position > -200000 for motor in self.sim_motors)
+        )
+
+    def test_emergency_stop(self):
+        self.start_moves()
+
+        results = emergency_stop(self.motors)
+
+        self.assertEqual([result.ip for result in results], self.hosts)
+        for result in results:
+            self.assertTrue(result.acknowledged)
+            self.assertGreater(result.latency, 0.0)
+            self.assertLess(result.latency, 0.1)
+            self.assertFalse(result.udp_sent)
+        self.assert_stopped()
+
+    def test_udp_fallback(self):
+        self.start_moves()
+
+        async def stop():
+            # the stop can not be written to the closed transport, so it
+            # is sent as a UDP datagram instead
+            self.motors[0].transport.close()
+            await asyncio.sleep(0)
+            return await emergency_stop_async(self.motors)
+
+        results = self.run_coroutine(stop())
+
+        self.assertFalse(results[0].acknowledged)
+        self.assertIsNone(results[0].reply)
+        self.assertTrue(results[0].udp_sent)
+        self.assertTrue(results[1].acknowledged)
+        self.assertFalse(results[1].udp_sent)
+        self.assert_stopped()
+
+    def test_timeout(self):
+        self.start_moves()
+        self.simulator.latency = 0.2
+
+        tstart = time.monotonic()
+        results = emergency_stop(self.motors, timeout=0.05)
+
+        self.assertLess(time.monotonic() - tstart, 0.2)
+        for result in results:
+            self.assertFalse(result.acknowledged)
+            self.assertIsNone(result.latency)
+            self.assertIsNone(result.reply)
+
+        # the stop was still written to the motors
+        self.assert_stopped()
+
+    def test_in_loop(self):
+        self.start_moves()
+
+        async def stop():
+            return emergency_stop(self.motors)
+
+        self.assertEqual(self.run_coroutine(stop()), [])
+        self.assert_stopped()
+
+
+if __name__ == "__main__":
+    unittest.main()
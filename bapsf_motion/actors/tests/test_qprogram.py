@@ -0,0 +1,122 @@
+"""Tests for Q programs (`bapsf_motion.actors.qprogram`) against the motor simulator."""
+import asyncio
+import time
+import unittest
+
+from bapsf_motion.actors.qprogram import (
+    _Q_SEGMENT_LINES,
+    _Q_SEGMENTS,
+    compile_q_program,
+    run_q_program_async,
+)
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestQProgram(SimulatorTestCase):
+    """Test compiling and running Q programs on simulated motors."""
+
+    nmotors = 2
+
+    def setUp(self):
+        super().setUp()
+        self.motors = [self.spawn_motor(ii) for ii in range(self.nmotors)]
+
+    def run_program(self, program, **kwargs):
+        return self.run_coroutine(run_q_program_async(program, **kwargs), timeout=30)
+
+    def wait_for_sim_stop(self, timeout: float = 1.0) -> bool:
+        tstart = time.monotonic()
+        while time.monotonic() - tstart < timeout:
+            if not any(
+                motor.is_moving or "Q" in motor.handle("RS")
+                for motor in self.sim_motors
+            ):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_compile(self):
+        targets = [[100 * ii, -100 * ii] for ii in range(1, 41)]
+        program = compile_q_program(self.motors, targets, dwell=0.05, labels=targets)
+
+        self.assertEqual(program.npoints, 40)
+        self.assertEqual(program.labels, targets)
+        self.assertGreater(len(program.segments), 1)
+        self.assertGreater(program.duration, 40 * 0.05)
+
+        points = []
+        for number, segment in enumerate(program.segments, start=1):
+            self.assertEqual(segment.number, number)
+            points.extend(segment.points)
+            for lines in segment.lines:
+                self.assertLessEqual(len(lines), _Q_SEGMENT_LINES)
+        self.assertEqual(points, list(range(40)))
+
+        # every point is a target distance and a feed to position
+        scl = program.scl(0, 0)
+        self.assertEqual(scl[:2], ["DI100", "FP"])
+
+    def test_compile_rejects_segment_rewrites(self):
+        targets = [[10 * ii, 10 * ii] for ii in range(1, 401)]
+
+        with self.assertRaises(ValueError):
+            compile_q_program(self.motors, targets, dwell=0.05)
+
+        program = compile_q_program(
+            self.motors, targets, dwell=0.05, rewrite_segments=True
+        )
+        self.assertGreater(len(program.segments), _Q_SEGMENTS)
+        self.assertEqual(program.segments[_Q_SEGMENTS].number, 1)
+
+    def test_upload_requires_opt_in(self):
+        targets = [[100 * ii, 100 * ii] for ii in range(1, 11)]
+        program = compile_q_program(self.motors, targets)
+
+        with self.assertRaises(RuntimeError):
+            self.run_program(program)
+
+        self.assertEqual([motor.position for motor in self.sim_motors], [0, 0])
+
+    def test_run_and_rerun(self):
+        targets = [[100 * ii, -50 * ii] for ii in range(1, 41)]
+        program = compile_q_program(self.motors, targets)
+        reached = []
+
+        result = self.run_program(program, allow_upload=True, callback=reached.append)
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.points, 40)
+        self.assertEqual(result.uploads, len(program.segments))
+        self.assertEqual(reached, list(range(40)))
+        self.assertAlmostEqual(self.sim_motors[0].position, 4000)
+        self.assertAlmostEqual(self.sim_motors[1].position, -2000)
+
+        # the segments are stored on the motors, so a re-run does not
+        # need to upload or opt in to uploading
+        result = self.run_program(program)
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.uploads, 0)
+        self.assertAlmostEqual(self.sim_motors[0].position, 4000)
+
+    def test_abort_stops_motors(self):
+        for motor in self.sim_motors:
+            motor.time_scale = 1.0
+        targets = [[20000 * ii, 20000 * ii] for ii in range(1, 21)]
+        program = compile_q_program(self.motors, targets)
+
+        future = asyncio.run_coroutine_threadsafe(
+            run_q_program_async(program, allow_upload=True), self.loop
+        )
+        time.sleep(0.5)
+        self.assertTrue(all(motor.is_moving for motor in self.sim_motors))
+
+        future.cancel()
+        self.assertTrue(self.wait_for_sim_stop(timeout=0.5))
+        self.assertTrue(
+            all(motor.position < targets[-1][0] for motor in self.sim_motors)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
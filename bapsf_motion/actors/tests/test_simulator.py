@@ -0,0 +1,264 @@
+"""Tests for `Motor` against the motor simulator `MotorSimulator`."""
+import time
+import unittest
+
+from bapsf_motion.actors.motor_ import _ReconnectBackoff
+from bapsf_motion.actors.pool import connection_pool
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestMotorAgainstSimulator(SimulatorTestCase):
+    """Test |Motor| communicating with a simulated motor."""
+
+    motor_kwargs = {"time_scale": 10.0, "limits": (None, 20000)}
+
+    def test_connect(self):
+        motor = self.spawn_motor()
+
+        self.assertTrue(motor.connected)
+        self.assertEqual(motor.status["position"].value, 0.0)
+        self.assertFalse(motor.status["alarm"])
+        self.assertFalse(motor.is_moving)
+
+    def test_send_command(self):
+        motor = self.spawn_motor()
+
+        self.assertEqual(motor.send_command("gearing").value, 20000)
+        self.assertEqual(motor.send_command("get_position").value, 0.0)
+
+        self.sim_motors[0].handle("SP1234")
+        self.assertEqual(motor.send_command("get_position").value, 1234)
+
+    def test_move_to_and_wait_for_stop(self):
+        motor = self.spawn_motor()
+
+        motor.move_to(10000)
+        self.assertTrue(motor.wait_for_stop(timeout=5.0))
+
+        self.assertFalse(motor.is_moving)
+        self.assertEqual(motor.position.value, 10000)
+        self.assertEqual(self.sim_motors[0].position, 10000)
+
+    def test_limit_switch_alarm(self):
+        motor = self.spawn_motor()
+
+        with self.assertLogs(motor.logger, level="ERROR") as logs:
+            motor.move_to(40000)
+            self.assertTrue(motor.wait_for_stop(timeout=5.0))
+            motor.retrieve_motor_status()
+
+        self.assertTrue(any("CW limit" in line for line in logs.output))
+        self.assertTrue(motor.status["alarm"])
+        self.assertEqual(motor.status["limits"], {"CCW": False, "CW": True})
+        self.assertEqual(motor.position.value, 20000)
+
+    def test_terminate_in_loop(self):
+        motor = self.spawn_motor()
+        sim_motor = self.sim_motors[0]
+        sim_motor.time_scale = 1.0
+
+        motor.move_to(-200000)
+        time.sleep(0.2)
+        self.assertTrue(sim_motor.is_moving)
+
+        async def terminate():
+            motor.terminate(delay_loop_stop=True)
+            return motor.terminated
+
+        self.assertTrue(self.run_coroutine(terminate()))
+
+        # the motor is stopped and then disabled by a task in the loop
+        tstart = time.monotonic()
+        while time.monotonic() - tstart < 1.0:
+            if "D" in sim_motor.handle("RS"):
+                break
+            time.sleep(0.01)
+        self.assertFalse(sim_motor.is_moving)
+        self.assertIn("D", sim_motor.handle("RS"))
+        self.assertGreater(sim_motor.position, -200000)
+
+        async def wait_for_shutdown():
+            await motor._shutdown_task
+
+        # the connection is handed over to the pool once disabled
+        self.run_coroutine(wait_for_shutdown())
+        self.assertIsNone(motor.transport)
+        self.assertEqual(len(connection_pool), 1)
+
+
+class TestMotorParameterCache(SimulatorTestCase):
+    """Test the parameter cache of |Motor| against a simulated motor."""
+
+    def setUp(self):
+        super().setUp()
+
+        # record the commands received by the simulated motor
+        self.received = []
+        handle = self.sim_motors[0].handle
+
+        def record_command(cmd):
+            self.received.append(cmd)
+            return handle(cmd)
+
+        self.sim_motors[0].handle = record_command
+
+    def test_cached_getter(self):
+        motor = self.spawn_motor()
+        self.assertEqual(motor.parameters["speed"].value, 4.0)
+
+        self.received.clear()
+        self.assertEqual(motor.send_command("speed").value, 4.0)
+        self.assertEqual(motor.send_command("gearing").value, 20000)
+        self.assertEqual(self.received, [])
+
+    def test_refresh(self):
+        motor = self.spawn_motor()
+
+        # change the speed behind the back of the motor actor
+        self.sim_motors[0].handle("VE2.5")
+        self.received.clear()
+        self.assertEqual(motor.send_command("speed").value, 4.0)
+        self.assertEqual(self.received, [])
+
+        self.assertEqual(motor.send_command("speed", refresh=True).value, 2.5)
+        self.assertEqual(self.received, ["VE"])
+        self.assertEqual(motor.parameters["speed"].value, 2.5)
+
+    def test_setter(self):
+        motor = self.spawn_motor()
+
+        motor.send_command("speed", 3.0)
+        self.assertEqual(motor.parameters["speed"].value, 3.0)
+        self.assertEqual(motor.motor["speed"].value, 3.0)
+
+        # the write-through value answers the getter
+        self.received.clear()
+        self.assertEqual(motor.send_command("speed").value, 3.0)
+        self.assertEqual(self.received, [])
+
+        # an unknown value on the motor invalidates the cache entry
+        motor._cache_parameter("speed", (3.0,), motor.ack_flags.NACK)
+        self.assertNotIn("speed", motor.parameters)
+        self.assertEqual(motor.send_command("speed").value, 3.0)
+        self.assertEqual(self.received, ["VE"])
+
+    def test_pooled_configuration(self):
+        motor = self.spawn_motor()
+        motor.terminate(delay_loop_stop=True)
+
+        # the motor was configured over the pooled connection, so the
+        # next motor takes over its parameters instead of configuring
+        (pooled,) = connection_pool._connections.values()
+        self.assertEqual(pooled.configuration, motor._configuration_key)
+
+        self.received.clear()
+        motor = self.spawn_motor()
+        self.assertFalse(
+            any(cmd.startswith(("DL", "VE", "EG")) for cmd in self.received)
+        )
+        self.assertEqual(motor.parameters["speed"].value, 4.0)
+
+        # a configuration command makes the configuration unknown...
+        motor.send_command("speed", 3.0)
+        motor.terminate(delay_loop_stop=True)
+        (pooled,) = connection_pool._connections.values()
+        self.assertIsNone(pooled.configuration)
+
+        # ...so the next motor configures the motor again
+        self.received.clear()
+        motor = self.spawn_motor()
+        self.assertIn("VE4.0000", self.received)
+        self.assertEqual(motor.send_command("speed").value, 4.0)
+
+
+class TestMotorReconnect(SimulatorTestCase):
+    """Test |Motor| re-establishing a lost connection to a simulated motor."""
+
+    def wait_until(self, condition, timeout: float = 10.0) -> bool:
+        tstart = time.monotonic()
+        while time.monotonic() - tstart < timeout:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_reconnect(self):
+        motor = self.spawn_motor()
+        motor._setup["reconnect_backoff"] = _ReconnectBackoff(
+            INITIAL=0.05, MAX=0.4, FACTOR=2.0, JITTER=0.0
+        )
+        self.assertEqual(motor.connection_health["connects"], 1)
+
+        # record the delays between the reconnect attempts
+        delays = []
+        reconnect_delay = motor._reconnect_delay
+
+        def record_delay():
+            delay = reconnect_delay()
+            delays.append(delay)
+            return delay
+
+        motor._reconnect_delay = record_delay
+
+        self.simulator.stop()
+        self.assertTrue(self.wait_until(lambda: len(delays) >= 5))
+        self.assertFalse(motor.connected)
+
+        # the delay doubles with every failed attempt, up to the max
+        self.assertIn(delays[0], [0.05, 0.1])
+        for previous, delay in zip(delays[:4], delays[1:5]):
+            self.assertEqual(delay, min(2 * previous, 0.4))
+        self.assertEqual(delays[4], 0.4)
+
+        health = motor.connection_health
+        self.assertGreaterEqual(health["failed_attempts"], 5)
+        self.assertIsNotNone(health["last_error"])
+        self.assertIsNotNone(health["disconnected_since"])
+        self.assertEqual(health["uptime"], 0.0)
+        self.assertLessEqual(health["next_attempt_in"], 0.4)
+
+        self.simulator.start()
+        self.assertTrue(self.wait_until(lambda: motor.connected, timeout=5.0))
+
+        health = motor.connection_health
+        self.assertEqual(health["connects"], 2)
+        self.assertEqual(health["reconnects"], 1)
+        self.assertEqual(health["failed_attempts"], 0)
+        self.assertIsNone(health["next_attempt_in"])
+        self.assertEqual(motor.send_command("get_position").value, 0.0)
+
+
+class TestMotorWithLatency(SimulatorTestCase):
+    """Test |Motor| communicating with a simulated motor over a slow link."""
+
+    simulator_kwargs = {"latency": 0.05}
+
+    def test_latency(self):
+        motor = self.spawn_motor()
+
+        tstart = time.monotonic()
+        self.assertEqual(motor.send_command("get_position").value, 0.0)
+        self.assertGreaterEqual(time.monotonic() - tstart, 0.05)
+
+
+class TestMotorWithPacketLoss(SimulatorTestCase):
+    """
+    Test |Motor| communicating with a simulated motor over a lossy
+    link.  Over TCP a lost segment only delays the reply.
+    """
+
+    simulator_kwargs = {"packet_loss": 0.5, "tcp_retransmit": 0.05}
+
+    def test_packet_loss(self):
+        motor = self.spawn_motor()
+        self.assertTrue(motor.connected)
+
+        self.sim_motors[0].handle("SP500")
+        for _ in range(5):
+            self.assertEqual(motor.send_command("get_position").value, 500)
+
+        self.assertTrue(motor.connected)
+
+
+if __name__ == "__main__":
+    unittest.main()
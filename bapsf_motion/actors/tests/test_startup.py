@@ -0,0 +1,63 @@
+"""Tests for concurrently starting up motors against the motor simulator."""
+import asyncio
+import logging
+import unittest
+
+from bapsf_motion.actors.drive_ import Drive
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestStartupMotors(SimulatorTestCase):
+    """Test the concurrent motor startup of a |Drive|."""
+
+    nmotors = 2
+
+    def spawn_drive(self) -> Drive:
+        drive = Drive(
+            axes=[
+                {"ip": host, "units": "cm", "units_per_rev": 0.1 * 2.54}
+                for host in self.hosts
+            ],
+            name="WALL-E",
+            logger=logging.getLogger("test.drive"),
+            loop=self.loop,
+            auto_run=True,
+        )
+        self.actors.append(drive)
+        return drive
+
+    async def wait_for_connected(self, drive: Drive, timeout: float = 5.0):
+        async def _wait():
+            while not all(ax.motor.connected for ax in drive.axes):
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(_wait(), timeout)
+
+    def test_startup(self):
+        drive = self.spawn_drive()
+
+        self.assertEqual(
+            [result.ip for result in drive.startup_results], self.hosts
+        )
+        self.assertTrue(all(result.connected for result in drive.startup_results))
+        self.assertTrue(all(ax.motor.connected for ax in drive.axes))
+
+    def test_startup_in_loop(self):
+        async def spawn():
+            # spawning in the loop thread can not wait on the startup,
+            # so the motors are started up by a task of the drive
+            drive = self.spawn_drive()
+            self.assertEqual(drive.startup_results, [])
+            self.assertFalse(drive.terminated)
+
+            await self.wait_for_connected(drive)
+            return drive
+
+        drive = self.run_coroutine(spawn())
+
+        self.assertTrue(all(ax.motor.connected for ax in drive.axes))
+        self.assertEqual(drive.position.value.tolist(), [0.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for `stream_moves_async` against the motor simulator."""
+import asyncio
+import time
+import unittest
+
+from bapsf_motion.actors.stream import stream_moves_async
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+
+
+class TestStreamMoves(SimulatorTestCase):
+    """Test streaming moves into the command buffers of simulated motors."""
+
+    nmotors = 2
+    motor_kwargs = {"time_scale": 1.0}
+
+    def setUp(self):
+        super().setUp()
+        self.motors = [self.spawn_motor(ii) for ii in range(self.nmotors)]
+
+    def wait_for_sim_stop(self, timeout: float = 1.0) -> bool:
+        tstart = time.monotonic()
+        while time.monotonic() - tstart < timeout:
+            if not any(motor.is_moving for motor in self.sim_motors):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def assert_stopped_and_flushed(self):
+        self.assertTrue(self.wait_for_sim_stop(timeout=0.5))
+        for motor in self.sim_motors:
+            # stopping flushes the command buffer
+            self.assertEqual(motor.handle("BS"), "BS=63")
+
+    def test_stream(self):
+        targets = [[200 * ii, -200 * ii] for ii in range(1, 11)]
+        reached = []
+
+        result = self.run_coroutine(
+            stream_moves_async(self.motors, targets, callback=reached.append)
+        )
+
+        self.assertTrue(result.completed)
+        self.assertEqual(result.points, 10)
+        self.assertEqual(reached, list(range(10)))
+        self.assertAlmostEqual(self.sim_motors[0].position, 2000)
+        self.assertAlmostEqual(self.sim_motors[1].position, -2000)
+
+    def test_abort_by_cancel_stops_motors(self):
+        targets = [[20000 * ii, 20000 * ii] for ii in range(1, 11)]
+
+        future = asyncio.run_coroutine_threadsafe(
+            stream_moves_async(self.motors, targets), self.loop
+        )
+        time.sleep(0.5)
+        self.assertTrue(all(motor.is_moving for motor in self.sim_motors))
+
+        future.cancel()
+        self.assert_stopped_and_flushed()
+        self.assertTrue(
+            all(motor.position < targets[-1][0] for motor in self.sim_motors)
+        )
+
+    def test_abort_by_callback_error_stops_motors(self):
+        targets = [[200 * ii, 20000 * ii] for ii in range(1, 11)]
+
+        def callback(index):
+            raise RuntimeError(f"abort at point {index}")
+
+        with self.assertRaises(RuntimeError):
+            self.run_coroutine(
+                stream_moves_async(self.motors, targets, callback=callback)
+            )
+
+        self.assert_stopped_and_flushed()
+        self.assertLess(self.sim_motors[1].position, targets[-1][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
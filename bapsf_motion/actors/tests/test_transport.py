@@ -0,0 +1,126 @@
+"""Tests for `UDPTransport` against the UDP endpoint of `MotorSimulator`."""
+import asyncio
+import time
+import unittest
+
+from bapsf_motion.actors.tests._helpers import SimulatorTestCase
+from bapsf_motion.actors.transport import (
+    _SCLDatagramProtocol,
+    scl_encode,
+    UDPTransport,
+)
+
+
+class _CountingUDPTransport(UDPTransport):
+    """`UDPTransport` that counts the datagrams it sends."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = 0
+
+    def _write(self, data: bytes):
+        self.sent += 1
+        super()._write(data)
+
+
+def _reply_to(cmd: str):
+    return lambda msg: msg.startswith(f"{cmd}=")
+
+
+class TestUDPTransport(SimulatorTestCase):
+    """Test `UDPTransport` over a lossless link."""
+
+    def open_transport(self, **kwargs) -> _CountingUDPTransport:
+        transport = _CountingUDPTransport(self.hosts[0], **kwargs)
+        self.run_coroutine(transport.open())
+        self.addCleanup(transport.close)
+        return transport
+
+    def request(self, transport, cmd: str, retry_safe: bool = False):
+        return self.run_coroutine(
+            transport.request(cmd, _reply_to(cmd), retry_safe=retry_safe)
+        )
+
+    def test_request(self):
+        transport = self.open_transport()
+
+        self.assertTrue(transport.is_open)
+        self.assertEqual(self.request(transport, "IP"), "IP=00000000")
+        self.assertEqual(self.request(transport, "EP", retry_safe=True), "EP=0")
+        self.assertEqual(transport.sent, 2)
+        self.assertEqual(transport.pending, 0)
+
+    def test_timeout_per_request(self):
+        transport = self.open_transport(timeout=0.05, retries=3)
+        self.simulator.packet_loss = 1.0
+
+        # a request that is not retry safe is sent once
+        tstart = time.monotonic()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.request(transport, "IP")
+        self.assertLess(time.monotonic() - tstart, 0.5)
+        self.assertEqual(transport.sent, 1)
+
+        # a retry safe request is sent 1 + retries times
+        transport.sent = 0
+        tstart = time.monotonic()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.request(transport, "IP", retry_safe=True)
+        self.assertGreaterEqual(time.monotonic() - tstart, 4 * 0.05)
+        self.assertEqual(transport.sent, 4)
+
+        # unlike TCP, a timeout does not end the connection
+        self.assertTrue(transport.is_open)
+        self.simulator.packet_loss = 0.0
+        self.assertEqual(self.request(transport, "EP"), "EP=0")
+
+    def test_stale_reply_discarded(self):
+        transport = self.open_transport(timeout=0.1)
+
+        # the reply to IP arrives after the request timed out...
+        self.simulator.latency = 0.15
+        with self.assertRaises(asyncio.TimeoutError):
+            self.request(transport, "IP")
+
+        # ...while the request for EP is waiting on its reply
+        self.simulator.latency = 0.08
+        self.assertEqual(self.request(transport, "EP"), "EP=0")
+        self.assertEqual(transport.pending, 0)
+
+    def test_foreign_address_discarded(self):
+        transport = self.open_transport(timeout=0.5)
+        protocol = _SCLDatagramProtocol(transport)
+
+        async def receive():
+            future = transport.submit("EP", _reply_to("EP"))
+            protocol.datagram_received(scl_encode("EP=99"), ("127.0.9.9", 7775))
+            self.assertFalse(future.done())
+            return await future
+
+        self.assertEqual(self.run_coroutine(receive()), "EP=0")
+
+
+class TestUDPTransportWithPacketLoss(SimulatorTestCase):
+    """Test `UDPTransport` over a link that loses datagrams."""
+
+    simulator_kwargs = {"packet_loss": 0.3}
+
+    def test_retry_safe_requests(self):
+        transport = _CountingUDPTransport(self.hosts[0], timeout=0.05, retries=10)
+        self.run_coroutine(transport.open())
+        self.addCleanup(transport.close)
+
+        self.sim_motors[0].handle("SP250")
+        for _ in range(20):
+            reply = self.run_coroutine(
+                transport.request("IP", _reply_to("IP"), retry_safe=True)
+            )
+            self.assertEqual(reply, "IP=000000FA")
+
+        # lost datagrams were re-sent
+        self.assertGreater(transport.sent, 20)
+        self.assertEqual(transport.pending, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
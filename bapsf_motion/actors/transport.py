@@ -0,0 +1,779 @@
+"""
+Module for the `asyncio` based transports used by
+`~bapsf_motion.actors.motor_.Motor` to communicate with Applied Motion
+motors over ethernet using the SCL (Serial Command Language) protocol.
+"""
+__all__ = ["BaseTransport", "SCLFrameDecoder", "TCPTransport", "UDPTransport"]
+
+import asyncio
+import logging
+import socket
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple, Union
+
+#: Byte header that starts every SCL message sent or received over
+#: TCP/UDP for Applied Motion motors.
+SCL_HEADER = b"\x00\x07"
+
+#: End-of-message byte (carriage return) that terminates every SCL
+#: message sent or received over TCP/UDP for Applied Motion motors.
+SCL_EOM = b"\r"
+
+
+def scl_encode(cmd: str) -> bytes:
+    """
+    Wrap the SCL command string ``cmd`` in the ethernet envelope
+    (header and end-of-message bytes) expected by the motor.
+
+    Examples
+    --------
+    >>> scl_encode("RS")
+    b'\\x00\\x07RS\\r'
+    """
+    return SCL_HEADER + cmd.encode("ASCII") + SCL_EOM
+
+
+def scl_decode(frame: bytes) -> str:
+    """
+    Strip the ethernet envelope (header and end-of-message bytes) from
+    a received SCL ``frame`` and return the message string.
+
+    Examples
+    --------
+    >>> scl_decode(b"\\x00\\x07RS=RP\\r")
+    'RS=RP'
+    """
+    if frame.endswith(SCL_EOM):
+        frame = frame[:-len(SCL_EOM)]
+
+    index = frame.find(SCL_HEADER)
+    if index != -1:
+        frame = frame[index + len(SCL_HEADER):]
+
+    return frame.decode("ASCII")
+
+
+class SCLFrameDecoder:
+    """
+    Incremental decoder that splits a stream of bytes (e.g. from a TCP
+    connection) into SCL messages.
+
+    Received data is appended to a persistent `bytearray`, every
+    complete frame (``\\x00\\x07...\\r``) is decoded straight out of a
+    `memoryview` of that buffer, and any trailing partial frame is kept
+    for the next call to :meth:`feed`.  Thus, several replies arriving
+    in the same segment are all delivered, and a reply split across
+    segments is reassembled.
+
+    Parameters
+    ----------
+    max_size: `int`, optional
+        Max number of bytes to buffer without seeing an end-of-message
+        byte.  If exceeded, the buffered data is considered garbage and
+        discarded. (DEFAULT: ``65536``)
+
+    Examples
+    --------
+    >>> decoder = SCLFrameDecoder()
+    >>> decoder.feed(b"\\x00\\x07RS=RP\\r\\x00\\x07IP=1")
+    ['RS=RP']
+    >>> decoder.pending
+    6
+    >>> decoder.feed(b"00\\r\\x00\\x07%\\r")
+    ['IP=100', '%']
+    """
+    __slots__ = ("_buffer", "_max_size")
+
+    def __init__(self, max_size: int = 65536):
+        self._buffer = bytearray()
+        self._max_size = max_size
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes belonging to an incomplete frame."""
+        return len(self._buffer)
+
+    def clear(self):
+        """Discard all buffered data."""
+        del self._buffer[:]
+
+    def feed(self, data: bytes) -> List[str]:
+        """
+        Append the received ``data`` to the buffer and return the list
+        of messages (without the ethernet envelope) of all the complete
+        frames.
+        """
+        buffer = self._buffer
+        buffer += data
+
+        messages = []
+        start = 0
+        with memoryview(buffer) as view:
+            while True:
+                end = buffer.find(SCL_EOM, start)
+                if end == -1:
+                    break
+
+                header = buffer.find(SCL_HEADER, start, end)
+                if header != -1:
+                    start = header + len(SCL_HEADER)
+
+                messages.append(str(view[start:end], "ASCII"))
+                start = end + len(SCL_EOM)
+
+        # drop the consumed frames (the view must be released first)
+        if start:
+            del buffer[:start]
+
+        if len(buffer) > self._max_size:
+            self.clear()
+
+        return messages
+
+
+class _PendingRequest:
+    """An outstanding request waiting for its reply from the motor."""
+    __slots__ = ("seq", "cmd", "matcher", "future", "timer", "retry_safe", "attempts")
+
+    def __init__(
+        self,
+        seq: int,
+        cmd: str,
+        matcher: Optional[Callable[[str], bool]],
+        future: asyncio.Future,
+        retry_safe: bool = False,
+    ):
+        self.seq = seq
+        self.cmd = cmd
+        self.matcher = matcher
+        self.future = future
+        self.retry_safe = retry_safe
+        self.attempts = 1
+        self.timer = None  # type: Optional[asyncio.TimerHandle]
+
+    def matches(self, msg: str) -> bool:
+        """`True` if ``msg`` is the reply to this request."""
+        return self.matcher is None or self.matcher(msg)
+
+
+class BaseTransport(ABC):
+    """
+    Abstract base class for an `asyncio` transport that exchanges SCL
+    messages with a single Applied Motion motor.
+
+    Requests are pipelined.  Each request submitted with :meth:`submit`
+    is placed in a FIFO queue of outstanding requests, and every
+    received message is matched against the request at the head of
+    the queue.  Thus, several requests can be written to the motor
+    back-to-back and all replies are collected in a single network
+    round trip.
+
+    All methods of a transport must be called from the same
+    `event loop`_ that was running when :meth:`open` was awaited.
+
+    Parameters
+    ----------
+    ip: `str`
+        IPv4 address of the motor.
+
+    port: `int`
+        Port the motor is serving SCL on.
+
+    timeout: `float`, optional
+        Time (in seconds) to wait for the connection to open or for a
+        request to receive its reply before giving up. (DEFAULT: ``1.0``)
+
+    logger: `~logging.Logger`, optional
+        The instance of `~logging.Logger` the transport will record
+        events to.  If `None`, then a logger will be automatically
+        generated. (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        port: int,
+        *,
+        timeout: float = 1.0,
+        logger: logging.Logger = None,
+    ):
+        self._ip = ip
+        self._port = port
+        self._timeout = timeout
+        self.logger = (
+            logging.getLogger("Transport") if logger is None else logger
+        )
+
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._pending = deque()  # type: Deque[_PendingRequest]
+        self._seq = 0
+
+    @property
+    def ip(self) -> str:
+        """IPv4 address of the motor."""
+        return self._ip
+
+    @property
+    def port(self) -> int:
+        """Port used for motor communication."""
+        return self._port
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """The ``(ip, port)`` pair of the motor."""
+        return self._ip, self._port
+
+    @property
+    def timeout(self) -> float:
+        """
+        Time (in seconds) to wait for the connection to open or for a
+        request to receive its reply.
+        """
+        return self._timeout
+
+    @property
+    def loop(self) -> Union[asyncio.AbstractEventLoop, None]:
+        """The `event loop`_ the transport was opened in."""
+        return self._loop
+
+    @property
+    def pending(self) -> int:
+        """Number of submitted requests still waiting on a reply."""
+        return len(self._pending)
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """`True` if the transport is open for communication."""
+        ...
+
+    @property
+    @abstractmethod
+    def socket(self) -> Union[socket.socket, None]:
+        """The socket object underlying the transport."""
+        ...
+
+    @property
+    def local_address(self) -> Union[Tuple[str, int], None]:
+        """The local ``(ip, port)`` the transport is bound to."""
+        try:
+            return self.socket.getsockname()
+        except (AttributeError, OSError):
+            return None
+
+    @abstractmethod
+    async def _open(self):
+        # Subclass specific functionality to open the connection.
+        ...
+
+    @abstractmethod
+    def _close(self):
+        # Subclass specific functionality to close the connection.  It
+        # is up to the caller to ensure this is executed in a
+        # threadsafe manner.  Implementations must call
+        # self._fail_pending() so no request is left waiting.
+        ...
+
+    @abstractmethod
+    def _write(self, data: bytes):
+        # Subclass specific functionality to write the encoded message
+        # data to the motor.
+        ...
+
+    async def open(self):
+        """
+        Open the connection to the motor.
+
+        Raises
+        ------
+        ConnectionError
+            If the connection could not be established within
+            :attr:`timeout` seconds.
+        """
+        self._loop = asyncio.get_running_loop()
+
+        try:
+            await asyncio.wait_for(self._open(), timeout=self.timeout)
+        except (asyncio.TimeoutError, OSError) as err:
+            # Note: ConnectionError is a subclass of OSError
+            raise ConnectionError(
+                f"Unable to open connection to {self.ip}:{self.port}, "
+                f"{err.__class__.__name__}: {err}"
+            ) from err
+
+    def close(self):
+        """
+        Close the connection to the motor.  Any requests still waiting
+        on a reply will raise a `ConnectionError`.  This method is
+        threadsafe and can be called from outside the transport's
+        `event loop`_.
+        """
+        if not self.is_open or self.loop is None or self.loop.is_closed():
+            return
+
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._close)
+        else:
+            self._close()
+
+    def submit(
+        self,
+        cmd: str,
+        matcher: Optional[Callable[[str], bool]] = None,
+        retry_safe: bool = False,
+    ) -> asyncio.Future:
+        """
+        Send the SCL command string ``cmd`` to the motor without
+        waiting on the reply.  The proper header and end-of-message
+        bytes are added by the transport.
+
+        Parameters
+        ----------
+        cmd: `str`
+            The command string to be sent to the motor.
+
+        matcher: :term:`callable`, optional
+            A callable that takes a received message string and returns
+            `True` if the message is the reply to ``cmd``.  Messages
+            not matched while the request is at the head of the queue
+            are discarded as stale.  If `None`, then the first message
+            received is taken as the reply. (DEFAULT: `None`)
+
+        retry_safe: bool, optional
+            `True` if ``cmd`` can be sent to the motor more than once
+            without side effects (e.g. a query) and its reply can be
+            distinguished by ``matcher``.  Only transports that can
+            lose messages (i.e. `UDPTransport`) make use of this.
+            (DEFAULT: `False`)
+
+        Returns
+        -------
+        `asyncio.Future`
+            A future whose result is the reply string.  The future
+            raises an `asyncio.TimeoutError` if no reply is received
+            within :attr:`timeout` seconds, or a `ConnectionError` if
+            the connection is closed before the reply arrives.  On a
+            timeout all outstanding requests fail and the transport is
+            closed, since the order of later replies can no longer be
+            trusted.
+
+        Raises
+        ------
+        ConnectionError
+            If the transport is not open.
+        """
+        if not self.is_open:
+            raise ConnectionError(
+                f"Connection to {self.ip}:{self.port} is not open."
+            )
+
+        self._seq += 1
+        request = _PendingRequest(
+            self._seq, cmd, matcher, self.loop.create_future(), retry_safe
+        )
+        request.timer = self.loop.call_later(
+            self.timeout, self._request_timed_out, request
+        )
+        self._pending.append(request)
+        self.send(cmd)
+
+        return request.future
+
+    def send(self, cmd: str):
+        """
+        Send the SCL command string ``cmd`` to the motor without
+        expecting a reply.  Should only be used for commands the motor
+        will not respond to, since an unexpected reply would be taken
+        as the reply to a request submitted afterward.  The proper
+        header and end-of-message bytes are added by the transport.
+
+        Raises
+        ------
+        ConnectionError
+            If the transport is not open.
+        """
+        if not self.is_open:
+            raise ConnectionError(
+                f"Connection to {self.ip}:{self.port} is not open."
+            )
+
+        msg = scl_encode(cmd)
+        self.logger.debug(f"Sending command string '{msg}'.")
+        self._write(msg)
+
+    async def drain(self):
+        """
+        Wait until the transport's write buffer can accept more data.
+        Should be awaited after a batch of :meth:`submit` calls.
+        """
+        return None
+
+    async def request(
+        self,
+        cmd: str,
+        matcher: Optional[Callable[[str], bool]] = None,
+        retry_safe: bool = False,
+    ) -> str:
+        """
+        Send the SCL command string ``cmd`` and return the reply.  See
+        :meth:`submit` for a description of the arguments and
+        exceptions.
+        """
+        future = self.submit(cmd, matcher, retry_safe)
+        await self.drain()
+        return await future
+
+    def _message_received(self, msg: str):
+        """Match a received message ``msg`` to the pending request."""
+        self.logger.debug(f"Received string '{msg}'.")
+
+        if len(self._pending) == 0:
+            self.logger.debug(f"Discarding unsolicited message '{msg}'.")
+            return
+
+        request = self._pending[0]
+        if not request.matches(msg):
+            # stale or intermediate message (e.g. the Ack of a buffered
+            # command that precedes the data reply)
+            self.logger.debug(
+                f"Discarding message '{msg}' while waiting on the reply "
+                f"to '{request.cmd}'."
+            )
+            return
+
+        self._pending.popleft()
+        self._resolve(request, msg)
+
+    def _resolve(self, request: _PendingRequest, msg: str):
+        """Set ``msg`` as the reply to the (dequeued) ``request``."""
+        request.timer.cancel()
+        if not request.future.done():
+            request.future.set_result(msg)
+
+    def _request_timed_out(self, request: _PendingRequest):
+        if request.future.done():
+            return
+
+        self.logger.debug(
+            f"No reply received from {self.ip}:{self.port} within "
+            f"{self.timeout} seconds."
+        )
+        self._fail_pending(
+            asyncio.TimeoutError(
+                f"No reply received from {self.ip}:{self.port} within "
+                f"{self.timeout} seconds."
+            )
+        )
+        self._close()
+
+    def _fail_pending(self, exc: BaseException):
+        """Fail all outstanding requests with the exception ``exc``."""
+        while len(self._pending):
+            request = self._pending.popleft()
+            request.timer.cancel()
+            if not request.future.done():
+                request.future.set_exception(exc)
+
+
+class _SCLStreamProtocol(asyncio.Protocol):
+    """
+    `asyncio.Protocol` that decodes the SCL byte stream of a TCP
+    connection and forwards every message to its owning `TCPTransport`.
+    """
+
+    def __init__(self, owner: "TCPTransport"):
+        self._owner = owner
+        self._decoder = SCLFrameDecoder()
+        self._paused = False
+        self._drain_waiter = None  # type: Optional[asyncio.Future]
+
+    def data_received(self, data: bytes):
+        for msg in self._decoder.feed(data):
+            self._owner._message_received(msg)
+
+    def eof_received(self):
+        # returning a falsy value closes the transport
+        return None
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._decoder.clear()
+        self._wake_drain_waiter()
+        self._owner._connection_lost(exc)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        self._wake_drain_waiter()
+
+    def _wake_drain_waiter(self):
+        waiter = self._drain_waiter
+        self._drain_waiter = None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def drain(self):
+        """Wait until the transport's write buffer is below its limit."""
+        if not self._paused:
+            return
+
+        if self._drain_waiter is None:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+        await self._drain_waiter
+
+
+class TCPTransport(BaseTransport):
+    """
+    A `BaseTransport` that communicates with the motor over TCP using
+    an `asyncio.Protocol`.  Incoming bytes are split into messages by
+    a `SCLFrameDecoder` as soon as they arrive, and each message is
+    matched to the outstanding requests.  Since no call blocks the
+    `event loop`_, any number of motors sharing the same loop can have
+    requests in flight at the same time.
+
+    Parameters
+    ----------
+    ip: `str`
+        IPv4 address of the motor.
+
+    port: `int`, optional
+        TCP port the motor is serving SCL on.  (DEFAULT: ``7776``)
+
+    timeout: `float`, optional
+        Time (in seconds) to wait for the connection to open or for a
+        request to receive its reply before giving up. (DEFAULT: ``1.0``)
+
+    logger: `~logging.Logger`, optional
+        The instance of `~logging.Logger` the transport will record
+        events to.  If `None`, then a logger will be automatically
+        generated. (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        port: int = 7776,
+        *,
+        timeout: float = 1.0,
+        logger: logging.Logger = None,
+    ):
+        super().__init__(ip, port, timeout=timeout, logger=logger)
+
+        self._transport = None  # type: Optional[asyncio.Transport]
+        self._protocol = None  # type: Optional[_SCLStreamProtocol]
+
+    @property
+    def is_open(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+    is_open.__doc__ = BaseTransport.is_open.__doc__
+
+    @property
+    def socket(self) -> Union[socket.socket, None]:
+        if self._transport is None:
+            return None
+        return self._transport.get_extra_info("socket")
+    socket.__doc__ = BaseTransport.socket.__doc__
+
+    async def _open(self):
+        self._transport, self._protocol = await self.loop.create_connection(
+            lambda: _SCLStreamProtocol(self), self.ip, self.port
+        )
+
+    def _close(self):
+        if self._transport is not None:
+            transport = self._transport
+            self._transport = None
+            self._protocol = None
+            transport.close()
+
+        self._fail_pending(
+            ConnectionError(f"Connection to {self.ip}:{self.port} was closed.")
+        )
+
+    def _connection_lost(self, exc: Optional[Exception]):
+        if self._transport is None:
+            # closed by us
+            return
+
+        self.logger.debug(
+            f"Connection to {self.ip}:{self.port} was closed by the motor"
+            + ("." if exc is None else f", {exc.__class__.__name__}: {exc}")
+        )
+        self._close()
+
+    def _write(self, data: bytes):
+        self._transport.write(data)
+
+    async def drain(self):
+        if self.is_open:
+            await self._protocol.drain()
+
+    drain.__doc__ = BaseTransport.drain.__doc__
+
+
+class _SCLDatagramProtocol(asyncio.DatagramProtocol):
+    """
+    `asyncio.DatagramProtocol` that forwards every received SCL
+    datagram to its owning `UDPTransport`.
+    """
+
+    def __init__(self, owner: "UDPTransport"):
+        self._owner = owner
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        if addr[0] != self._owner.ip:
+            return
+
+        self._owner._message_received(scl_decode(data))
+
+    def error_received(self, exc: Exception):
+        # e.g. ICMP port unreachable, the request timers will handle
+        # any missing replies
+        self._owner.logger.debug(
+            f"UDP error from {self._owner.ip}:{self._owner.port}, "
+            f"{exc.__class__.__name__}: {exc}"
+        )
+
+    def connection_lost(self, exc: Optional[Exception]):
+        self._owner._close()
+
+
+class UDPTransport(BaseTransport):
+    """
+    A `BaseTransport` that communicates with the motor by sending each
+    SCL message in its own UDP datagram.  Without the connection
+    handshake and in-order delivery of TCP, a lost message only delays
+    the request it belongs to, and "reconnecting" is just re-creating
+    a local endpoint.  This makes UDP well suited for status polling
+    and emergency stops.
+
+    Since datagrams can be lost or reordered, a reply is matched to
+    the oldest outstanding request (by sequence number) that accepts
+    it, instead of only the head of the queue.  Requests that are
+    flagged as ``retry_safe`` are re-sent when their reply does not
+    arrive within :attr:`timeout` seconds, up to :attr:`retries`
+    times.  A late reply to an earlier attempt is either taken as the
+    reply to a newer request for the same query, or discarded as
+    unsolicited.  This is harmless since only side-effect free queries
+    are re-sent.  A request that exhausts its attempts fails with an
+    `asyncio.TimeoutError`, without affecting the other requests.
+
+    Parameters
+    ----------
+    ip: `str`
+        IPv4 address of the motor.
+
+    port: `int`, optional
+        UDP port the motor is serving SCL on.  (DEFAULT: ``7775``)
+
+    timeout: `float`, optional
+        Time (in seconds) to wait for a single datagram exchange
+        before re-sending or giving up. (DEFAULT: ``0.1``)
+
+    retries: `int`, optional
+        Number of times a ``retry_safe`` request is re-sent before
+        giving up. (DEFAULT: ``3``)
+
+    logger: `~logging.Logger`, optional
+        The instance of `~logging.Logger` the transport will record
+        events to.  If `None`, then a logger will be automatically
+        generated. (DEFAULT: `None`)
+    """
+
+    def __init__(
+        self,
+        ip: str,
+        port: int = 7775,
+        *,
+        timeout: float = 0.1,
+        retries: int = 3,
+        logger: logging.Logger = None,
+    ):
+        super().__init__(ip, port, timeout=timeout, logger=logger)
+
+        self._retries = retries
+        self._transport = None  # type: Optional[asyncio.DatagramTransport]
+
+    @property
+    def retries(self) -> int:
+        """Number of times a ``retry_safe`` request is re-sent."""
+        return self._retries
+
+    @property
+    def is_open(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+    is_open.__doc__ = BaseTransport.is_open.__doc__
+
+    @property
+    def socket(self) -> Union[socket.socket, None]:
+        if self._transport is None:
+            return None
+        return self._transport.get_extra_info("socket")
+    socket.__doc__ = BaseTransport.socket.__doc__
+
+    async def _open(self):
+        self._transport, _ = await self.loop.create_datagram_endpoint(
+            lambda: _SCLDatagramProtocol(self),
+            remote_addr=(self.ip, self.port),
+        )
+
+    def _close(self):
+        if self._transport is not None:
+            transport = self._transport
+            self._transport = None
+            transport.close()
+
+        self._fail_pending(
+            ConnectionError(f"Connection to {self.ip}:{self.port} was closed.")
+        )
+
+    def _write(self, data: bytes):
+        self._transport.sendto(data)
+
+    def _message_received(self, msg: str):
+        self.logger.debug(f"Received string '{msg}'.")
+
+        for request in self._pending:
+            if request.matches(msg):
+                break
+        else:
+            self.logger.debug(f"Discarding unsolicited message '{msg}'.")
+            return
+
+        self._pending.remove(request)
+        self._resolve(request, msg)
+
+    def _request_timed_out(self, request: _PendingRequest):
+        if request.future.done():
+            return
+
+        if (
+            request.retry_safe
+            and request.attempts <= self.retries
+            and self.is_open
+        ):
+            request.attempts += 1
+            self.logger.debug(
+                f"No reply to request {request.seq} ('{request.cmd}'), "
+                f"sending attempt {request.attempts}."
+            )
+            request.timer = self.loop.call_later(
+                self.timeout, self._request_timed_out, request
+            )
+            self.send(request.cmd)
+            return
+
+        try:
+            self._pending.remove(request)
+        except ValueError:
+            pass
+
+        request.future.set_exception(
+            asyncio.TimeoutError(
+                f"No reply received from {self.ip}:{self.port} for "
+                f"'{request.cmd}' after {request.attempts} attempt(s)."
+            )
+        )
@@ -8,7 +8,7 @@ import re
 import warnings
 import xarray as xr
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 try:
     from xarray.core.types import ErrorOptions
@@ -25,6 +25,11 @@ from bapsf_motion.motion_builder.layers import (
     layer_factory,
     BaseLayer,
 )
+from bapsf_motion.motion_builder.ordering import (
+    nearest_neighbor_order,
+    serpentine_order,
+    two_opt_order,
+)
 from bapsf_motion.utils.exceptions import ConfigurationWarning
 
 # TODO:  create a sit point, this is a point where the probe will sit when
@@ -54,9 +59,16 @@ class MotionBuilder(MBItem):
         motion list, and ``'merge'`` means the point layers are merged
         together (i.e. removing duplicate points and sorting points) to
         form one "global" motion list. (DEFAULT ``'sequential'``)
+    motionlist_ordering : `str`
+        (``'raster'``, ``'serpentine'``, or ``'shortest'``) The order
+        the points of the motion list are visited in, see
+        :attr:`motionlist_ordering`. (DEFAULT ``'raster'``)
     """
     # TODO: ^ fully write out the above docstring
 
+    #: Available orderings of the :term:`motion list` points.
+    motionlist_orderings = ("raster", "serpentine", "shortest")
+
     #: Dictionary of :term:`motion builder item` base names.
     base_names = {
         "layer": BaseLayer.base_name,
@@ -75,6 +87,7 @@ class MotionBuilder(MBItem):
             layers: Optional[List[Dict[str, Any]]] = None,
             exclusions: Optional[List[Dict[str, Any]]] = None,
             layer_to_motionlist_scheme: str = "sequential",
+            motionlist_ordering: str = "raster",
     ):
         self._space = self._validate_space(space)
 
@@ -82,6 +95,12 @@ class MotionBuilder(MBItem):
             layer_to_motionlist_scheme = "sequential"
         self._layer_to_motionlist_scheme = layer_to_motionlist_scheme
 
+        if motionlist_ordering not in self.motionlist_orderings:
+            motionlist_ordering = "raster"
+        self._motionlist_ordering = motionlist_ordering
+        self._ordering_transform = None  # type: Optional[Callable]
+        self._ordering_metric = None  # type: Optional[Callable]
+
         super().__init__(
             self._build_initial_ds(),
             base_name="motion_builder",
@@ -113,6 +132,7 @@ class MotionBuilder(MBItem):
         _config = {
             "space": {},
             "layer_to_motionlist_scheme": self.layer_to_motionlist_scheme,
+            "motionlist_ordering": self.motionlist_ordering,
         }
 
         # pack the space config
@@ -163,6 +183,58 @@ class MotionBuilder(MBItem):
         self._layer_to_motionlist_scheme = value
         self.generate()
 
+    @property
+    def motionlist_ordering(self) -> str:
+        """
+        The order the points of the :term:`motion list` are visited
+        in.  ``'raster'`` sorts the points along each axis, so every
+        row starts at the same side.  ``'serpentine'`` traverses every
+        other row in reverse, so the probe never travels back to the
+        start of the next row.  ``'shortest'`` orders the points with
+        a nearest neighbor search followed by the 2-opt heuristic (see
+        `~bapsf_motion.motion_builder.ordering`) to minimize the
+        travel cost set by :meth:`set_ordering_cost`.  For the
+        ``'sequential'`` :attr:`layer_to_motionlist_scheme` each layer
+        is ordered separately.
+        """
+        return self._motionlist_ordering
+
+    @motionlist_ordering.setter
+    def motionlist_ordering(self, value: str) -> None:
+        if value not in self.motionlist_orderings:
+            return
+
+        self._motionlist_ordering = value
+        self.generate()
+
+    def set_ordering_cost(
+        self,
+        transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        metric: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+    ):
+        r"""
+        Set the travel cost used by the ``'shortest'``
+        :attr:`motionlist_ordering`.
+
+        Parameters
+        ----------
+        transform: :term:`callable`, optional
+            Converts an :math:`M \times N` array of :term:`motion space`
+            points into the coordinates the cost is evaluated in, e.g.
+            the probe drive coordinates.  If `None`, then the motion
+            space coordinates are used. (DEFAULT: `None`)
+
+        metric: :term:`callable`, optional
+            The travel cost between paired coordinates, see
+            `~bapsf_motion.motion_builder.ordering`.  If `None`, then
+            the Euclidean distance is used. (DEFAULT: `None`)
+        """
+        self._ordering_transform = transform
+        self._ordering_metric = metric
+
+        if self.motionlist_ordering == "shortest":
+            self.generate()
+
     @staticmethod
     def _validate_space(space: List[Dict[str, Any]]):
         """
@@ -472,6 +544,35 @@ class MotionBuilder(MBItem):
 
         return points
 
+    def _order_motion_list(self, points, start=None):
+        r"""
+        Order the :math:`M \times N` array ``points`` according to
+        :attr:`motionlist_ordering`.  ``start`` is the point the probe
+        is at before moving to ``points``, if known.
+        """
+        points = self._sort_motion_list(points)
+        if self.motionlist_ordering == "raster" or points.shape[0] < 3:
+            return points
+        elif self.motionlist_ordering == "serpentine":
+            return points[serpentine_order(points), ...]
+
+        if start is None:
+            coords = points
+        else:
+            coords = np.concatenate([np.asarray(start)[np.newaxis, :], points])
+
+        if self._ordering_transform is not None:
+            coords = np.asarray(self._ordering_transform(coords), dtype=float)
+
+        if start is not None:
+            start, coords = coords[0], coords[1:]
+
+        order = nearest_neighbor_order(
+            coords, start=start, metric=self._ordering_metric
+        )
+        order = two_opt_order(coords, order, metric=self._ordering_metric)
+        return points[order, ...]
+
     def generate(self):
         """
         Generated the :term:`motion list` from the currently defined
@@ -485,12 +586,18 @@ class MotionBuilder(MBItem):
 
         for_concatenation = []
 
+        start = None
         for layer in self.layers:
             points = layer.points.data.copy()
             points = self.flatten_points(points)
 
             if self.layer_to_motionlist_scheme == "sequential":
-                points = self._sort_motion_list(points)
+                # drop excluded points before ordering, so they do not
+                # affect the travel cost
+                points = points[self.generate_excluded_mask(points), ...]
+                points = self._order_motion_list(points, start=start)
+                if points.shape[0]:
+                    start = points[-1]
 
             for_concatenation.append(points)
 
@@ -498,18 +605,17 @@ class MotionBuilder(MBItem):
 
         if self.layer_to_motionlist_scheme == "merge":
             points = np.unique(points, axis=0)
-            points = self._sort_motion_list(points)
-
-        mask = self.generate_excluded_mask(points)
+            points = points[self.generate_excluded_mask(points), ...]
+            points = self._order_motion_list(points)
 
         if (
             "motion_list" in self._ds.keys()
-            and self._ds["motion_list"].shape[0] != mask.shape[0]
+            and self._ds["motion_list"].shape[0] != points.shape[0]
         ):
             self.drop_vars("motion_list")
 
         self._ds["motion_list"] = xr.DataArray(
-            data=points[mask, ...],
+            data=points,
             dims=("index", "space")
         )
 
@@ -555,15 +661,28 @@ class MotionBuilder(MBItem):
                 f"got dtype {points.dtype}."
             )
 
-        select = {}
+        # Note: xr.sel would search for all combinations of the given
+        #       indexers, but the motion space coordinates are evenly
+        #       spaced (see _build_initial_ds), so the nearest index of
+        #       each point follows directly from the coordinate spacing
+        indices = []
         for ii, dim_name in enumerate(self.mask.dims):
-            select[dim_name] = points[..., ii]
+            coord = self.mask.coords[dim_name].values
+            step = 0.0
+            if coord.size > 1:
+                step = (coord[-1] - coord[0]) / (coord.size - 1)
+
+            if step == 0:
+                index = np.zeros(points.shape[:-1], dtype=int)
+            else:
+                # round half up, like the nearest selection of xr.sel,
+                # np.rint would round half to even
+                index = np.floor((points[..., ii] - coord[0]) / step + 0.5)
+                index = index.astype(int)
+
+            indices.append(np.clip(index, 0, coord.size - 1))
 
-        # Note: np.diag is used here since xr.sel will search for all
-        #       combinations of given indexers, but we are only
-        #       interested in the points along the diagonal of this
-        #       forced combination
-        mask = np.diag(self.mask.sel(method="nearest", **select))
+        mask = self.mask.values[tuple(indices)]
         return mask
 
     def get_insertion_point(self) -> Union[np.ndarray, None]:
@@ -0,0 +1,217 @@
+"""
+Module for ordering the points of a :term:`motion list` to reduce the
+travel of the :term:`probe drive`.
+
+All functions return the new order as an array of indices into the
+given points.  The travel cost between two points is given by a
+``metric``, which defaults to the Euclidean distance.  A ``metric``
+takes two arrays of coordinates of shape :math:`K \\times N` (or
+broadcastable to it) and returns the :math:`K` costs between the
+paired points, e.g. the estimated move time of the probe drive.
+"""
+__all__ = [
+    "euclidean_metric",
+    "nearest_neighbor_order",
+    "path_cost",
+    "serpentine_order",
+    "two_opt_order",
+]
+
+import numpy as np
+
+from typing import Callable, Optional
+
+#: Type of the cost ``metric`` between paired coordinates
+Metric = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def euclidean_metric(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """The Euclidean distance between the paired coordinates ``a`` and ``b``."""
+    return np.linalg.norm(np.asarray(b) - np.asarray(a), axis=-1)
+
+
+def path_cost(
+    coords: np.ndarray, order: Optional[np.ndarray] = None, metric: Metric = None
+) -> float:
+    """
+    The total cost of visiting ``coords`` in the order ``order``.  If
+    ``order`` is `None`, then the given order of ``coords`` is used.
+    """
+    metric = euclidean_metric if metric is None else metric
+    coords = np.asarray(coords)
+    if order is not None:
+        coords = coords[order]
+
+    if coords.shape[0] < 2:
+        return 0.0
+
+    return float(np.sum(metric(coords[:-1], coords[1:])))
+
+
+def serpentine_order(points: np.ndarray) -> np.ndarray:
+    """
+    Order the raster ordered ``points`` (see
+    :meth:`MotionBuilder._sort_motion_list() <bapsf_motion.motion_builder.core.MotionBuilder._sort_motion_list>`)
+    in a serpentine (boustrophedon) fashion, i.e. every other row is
+    traversed in the reverse direction, so the probe drive never
+    travels back to the start of the next row.  Rows are runs of
+    points that share the same value along the slower axes, and are
+    reversed at every level for :math:`N`-D points.
+
+    Parameters
+    ----------
+    points: `~numpy.ndarray`
+        :math:`M \\times N` array of raster ordered points.
+
+    Returns
+    -------
+    `~numpy.ndarray`
+        Indices of ``points`` in serpentine order.
+
+    Examples
+    --------
+    >>> points = np.array([[0, 1], [1, 1], [0, 0], [1, 0]])
+    >>> serpentine_order(points)
+    array([0, 1, 3, 2])
+    """
+    points = np.asarray(points)
+
+    def snake(indices: np.ndarray, axis: int) -> np.ndarray:
+        if axis == 0 or indices.size < 2:
+            return indices
+
+        values = points[indices, axis]
+        blocks = np.split(indices, np.flatnonzero(values[1:] != values[:-1]) + 1)
+        ordered = []
+        for ii, block in enumerate(blocks):
+            block = snake(block, axis - 1)
+            ordered.append(block[::-1] if ii % 2 else block)
+
+        return np.concatenate(ordered)
+
+    return snake(np.arange(points.shape[0]), points.shape[1] - 1)
+
+
+def nearest_neighbor_order(
+    coords: np.ndarray, start: Optional[np.ndarray] = None, metric: Metric = None
+) -> np.ndarray:
+    """
+    Order ``coords`` by always visiting the cheapest unvisited point
+    next.  This takes :math:`O(M^2)` operations for :math:`M` points.
+
+    Parameters
+    ----------
+    coords: `~numpy.ndarray`
+        :math:`M \\times N` array of point coordinates.
+
+    start: `~numpy.ndarray`, optional
+        Coordinates the path starts from.  If `None`, then the path
+        starts with the first point of ``coords``. (DEFAULT: `None`)
+
+    metric: :term:`callable`, optional
+        The travel cost between points, see
+        `~bapsf_motion.motion_builder.ordering`.  If `None`, then
+        `euclidean_metric` is used. (DEFAULT: `None`)
+
+    Returns
+    -------
+    `~numpy.ndarray`
+        Indices of ``coords`` in the visiting order.
+    """
+    metric = euclidean_metric if metric is None else metric
+    coords = np.asarray(coords, dtype=float)
+    npoints = coords.shape[0]
+    if npoints == 0:
+        return np.zeros(0, dtype=int)
+
+    visited = np.zeros(npoints, dtype=bool)
+    order = np.empty(npoints, dtype=int)
+    if start is None:
+        current = 0
+    else:
+        current = int(np.argmin(metric(np.asarray(start)[np.newaxis, :], coords)))
+
+    for ii in range(npoints):
+        order[ii] = current
+        visited[current] = True
+        if ii == npoints - 1:
+            break
+
+        cost = metric(coords[current][np.newaxis, :], coords)
+        cost[visited] = np.inf
+        current = int(np.argmin(cost))
+
+    return order
+
+
+def two_opt_order(
+    coords: np.ndarray,
+    order: np.ndarray,
+    metric: Metric = None,
+    window: int = 32,
+    max_passes: int = 4,
+) -> np.ndarray:
+    """
+    Improve the open path ``order`` through ``coords`` with the 2-opt
+    heuristic, i.e. reverse a section of the path whenever that
+    shortens the path.  Only sections of up to ``window`` points are
+    considered, so each pass takes :math:`O(M \\cdot window)`
+    operations for :math:`M` points.  The first point of the path is
+    kept in place.
+
+    Parameters
+    ----------
+    coords: `~numpy.ndarray`
+        :math:`M \\times N` array of point coordinates.
+
+    order: `~numpy.ndarray`
+        Indices of ``coords`` in the initial visiting order, e.g. from
+        `nearest_neighbor_order`.
+
+    metric: :term:`callable`, optional
+        The travel cost between points, see
+        `~bapsf_motion.motion_builder.ordering`.  If `None`, then
+        `euclidean_metric` is used. (DEFAULT: `None`)
+
+    window: int, optional
+        Max number of points in a reversed section. (DEFAULT: ``32``)
+
+    max_passes: int, optional
+        Max number of passes over the path. (DEFAULT: ``4``)
+
+    Returns
+    -------
+    `~numpy.ndarray`
+        Indices of ``coords`` in the improved visiting order.
+    """
+    metric = euclidean_metric if metric is None else metric
+    coords = np.asarray(coords, dtype=float)
+    order = np.array(order, dtype=int)
+    npoints = order.size
+
+    for _ in range(max_passes):
+        improved = False
+        for ii in range(npoints - 2):
+            # reverse the section order[ii + 1:jj + 1], which replaces the
+            # edges (a, b) and (c, d) with (a, c) and (b, d)
+            jj = np.arange(ii + 2, min(ii + 2 + window, npoints))
+            a = coords[order[ii]][np.newaxis, :]
+            b = coords[order[ii + 1]][np.newaxis, :]
+            c = coords[order[jj]]
+            has_d = jj + 1 < npoints
+            d = coords[order[np.minimum(jj + 1, npoints - 1)]]
+
+            gain = (
+                metric(a, b)
+                - metric(a, c)
+                + np.where(has_d, metric(c, d) - metric(b, d), 0.0)
+            )
+            best = int(np.argmax(gain))
+            if gain[best] > 1e-12:
+                order[ii + 1:jj[best] + 1] = order[ii + 1:jj[best] + 1][::-1]
+                improved = True
+
+        if not improved:
+            break
+
+    return order
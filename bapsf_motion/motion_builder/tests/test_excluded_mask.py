@@ -0,0 +1,70 @@
+"""Tests for `MotionBuilder.generate_excluded_mask`."""
+import numpy as np
+import unittest
+import xarray as xr
+
+from bapsf_motion.motion_builder import MotionBuilder
+
+
+class TestGenerateExcludedMask(unittest.TestCase):
+    """
+    Test `MotionBuilder.generate_excluded_mask` against the nearest
+    selection of the mask with `xarray.DataArray.sel`.
+    """
+
+    def setUp(self):
+        self.mb = MotionBuilder(
+            space="lapd_xy",
+            exclusions=[{"type": "circle", "radius": 20.0, "exclude": "outside"}],
+        )
+
+    def sel_mask(self, points: np.ndarray) -> np.ndarray:
+        # the mask selection generate_excluded_mask replaced, but with
+        # point-wise indexers instead of taking the diagonal of the
+        # outer selection
+        select = {
+            dim_name: xr.DataArray(points[..., ii], dims="points")
+            for ii, dim_name in enumerate(self.mb.mask.dims)
+        }
+        return self.mb.mask.sel(method="nearest", **select).values
+
+    def test_matches_sel(self):
+        rng = np.random.default_rng(0)
+        x = self.mb.mask.coords["x"].values
+        step = x[1] - x[0]
+
+        # off-grid points, including points outside the motion space
+        off_grid = rng.uniform(-60.0, 60.0, size=(20000, 2))
+
+        # points on the grid and exactly halfway between grid nodes
+        nodes = rng.choice(x[:-1], size=(5000, 2))
+        halfway = nodes + 0.5 * step
+        halfway[:2500, 1] = nodes[:2500, 1]
+        points = np.concatenate([off_grid, nodes, halfway])
+
+        mask = self.mb.generate_excluded_mask(points)
+
+        self.assertEqual(mask.shape, (points.shape[0],))
+        self.assertEqual(mask.dtype, bool)
+        np.testing.assert_array_equal(mask, self.sel_mask(points))
+
+        # the halfway points do sit on the exclusion boundary
+        self.assertTrue(np.any(mask[-5000:]))
+        self.assertFalse(np.all(mask[-5000:]))
+
+    def test_ties_round_up(self):
+        # 20.25 is halfway between the nodes 20.0 (included) and 20.5
+        # (excluded)
+        points = np.array([[20.25, 0.0], [-20.25, 0.0], [0.0, 19.75]])
+        mask = self.mb.generate_excluded_mask(points)
+
+        np.testing.assert_array_equal(mask, [False, True, True])
+        np.testing.assert_array_equal(mask, self.sel_mask(points))
+
+    def test_single_point(self):
+        self.assertTrue(self.mb.generate_excluded_mask([0.0, 0.0]).all())
+        self.assertFalse(self.mb.generate_excluded_mask([30, 30]).any())
+
+
+if __name__ == "__main__":
+    unittest.main()
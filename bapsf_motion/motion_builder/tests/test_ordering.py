@@ -0,0 +1,207 @@
+"""Tests for the :term:`motion list` orderings."""
+import numpy as np
+import unittest
+
+from bapsf_motion.motion_builder import MotionBuilder
+from bapsf_motion.motion_builder.ordering import (
+    euclidean_metric,
+    nearest_neighbor_order,
+    path_cost,
+    serpentine_order,
+    two_opt_order,
+)
+
+
+class TestOrderingFunctions(unittest.TestCase):
+    """Test the functions of `bapsf_motion.motion_builder.ordering`."""
+
+    def setUp(self):
+        self.coords = np.random.default_rng(0).uniform(-10, 10, size=(60, 2))
+
+    def test_nearest_neighbor_order(self):
+        order = nearest_neighbor_order(self.coords)
+
+        self.assertEqual(order[0], 0)
+        self.assertEqual(sorted(order.tolist()), list(range(60)))
+
+        # every step goes to the closest point not visited yet
+        for ii in range(59):
+            unvisited = order[ii + 1:]
+            cost = euclidean_metric(self.coords[order[ii]], self.coords[unvisited])
+            self.assertEqual(order[ii + 1], unvisited[np.argmin(cost)])
+
+    def test_nearest_neighbor_order_with_start(self):
+        start = np.array([10.0, 10.0])
+        order = nearest_neighbor_order(self.coords, start=start)
+
+        self.assertEqual(sorted(order.tolist()), list(range(60)))
+        self.assertEqual(
+            order[0], np.argmin(euclidean_metric(start, self.coords))
+        )
+
+    def test_nearest_neighbor_order_empty(self):
+        self.assertEqual(nearest_neighbor_order(np.zeros((0, 2))).size, 0)
+
+    def test_two_opt_order(self):
+        for initial in (
+            np.arange(60),
+            np.random.default_rng(1).permutation(60),
+            nearest_neighbor_order(self.coords),
+        ):
+            order = two_opt_order(self.coords, initial)
+
+            self.assertEqual(order[0], initial[0])
+            self.assertEqual(sorted(order.tolist()), list(range(60)))
+            self.assertLessEqual(
+                path_cost(self.coords, order), path_cost(self.coords, initial)
+            )
+
+    def test_two_opt_order_metric(self):
+        def manhattan(a, b):
+            return np.sum(np.abs(np.asarray(b) - np.asarray(a)), axis=-1)
+
+        initial = np.random.default_rng(2).permutation(60)
+        order = two_opt_order(self.coords, initial, metric=manhattan)
+
+        self.assertEqual(order[0], initial[0])
+        self.assertLessEqual(
+            path_cost(self.coords, order, metric=manhattan),
+            path_cost(self.coords, initial, metric=manhattan),
+        )
+
+    def test_serpentine_order_3d(self):
+        # raster ordered, the first axis varies the fastest
+        points = np.array(
+            [[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)]
+        )
+        order = serpentine_order(points)
+
+        self.assertEqual(order.tolist(), [0, 1, 3, 2, 6, 7, 5, 4])
+
+        # the probe only ever moves to a neighboring point
+        steps = np.abs(np.diff(points[order], axis=0)).sum(axis=1)
+        self.assertTrue(np.all(steps == 1))
+
+
+class TestMotionBuilderOrdering(unittest.TestCase):
+    """Test the `MotionBuilder.motionlist_ordering` option."""
+
+    space = [
+        {"label": "x", "range": [-20.0, 20.0], "num": 41},
+        {"label": "y", "range": [-20.0, 20.0], "num": 41},
+    ]
+
+    def build(self, layers, exclusions=None, **kwargs) -> MotionBuilder:
+        return MotionBuilder(
+            space=[item.copy() for item in self.space],
+            layers=[layer.copy() for layer in layers],
+            exclusions=(
+                None if exclusions is None
+                else [exclusion.copy() for exclusion in exclusions]
+            ),
+            **kwargs,
+        )
+
+    def motion_list(self, mb: MotionBuilder) -> np.ndarray:
+        return mb.motion_list.data
+
+    def test_orderings_visit_the_same_points(self):
+        layers = [{"type": "grid", "limits": [[-10, 10], [-5, 5]], "npoints": [5, 3]}]
+        raster = self.motion_list(self.build(layers))
+
+        for ordering in ("serpentine", "shortest"):
+            points = self.motion_list(
+                self.build(layers, motionlist_ordering=ordering)
+            )
+            self.assertEqual(
+                sorted(map(tuple, points.tolist())),
+                sorted(map(tuple, raster.tolist())),
+            )
+            self.assertLess(path_cost(points), path_cost(raster))
+
+    def test_invalid_ordering(self):
+        layers = [{"type": "grid", "limits": [[-10, 10], [-5, 5]], "npoints": [5, 3]}]
+        mb = self.build(layers, motionlist_ordering="spiral")
+        self.assertEqual(mb.motionlist_ordering, "raster")
+
+        mb.motionlist_ordering = "spiral"
+        self.assertEqual(mb.motionlist_ordering, "raster")
+
+    def test_sequential_start_carryover(self):
+        layers = [
+            {"type": "grid", "limits": [[-10, -6], [-2, 2]], "npoints": [3, 3]},
+            {"type": "grid", "limits": [[6, 10], [-2, 2]], "npoints": [3, 3]},
+        ]
+        mb = self.build(
+            layers,
+            layer_to_motionlist_scheme="sequential",
+            motionlist_ordering="shortest",
+        )
+        points = self.motion_list(mb)
+        first, second = points[:9], points[9:]
+
+        # the second layer starts at its point closest to where the
+        # first layer ended
+        self.assertTrue(np.all(first[:, 0] < 0))
+        self.assertTrue(np.all(second[:, 0] > 0))
+        closest = second[np.argmin(euclidean_metric(first[-1], second))]
+        self.assertEqual(second[0].tolist(), closest.tolist())
+        self.assertEqual(second[0, 0], 6)
+
+    def test_excluded_points_dropped_before_ordering(self):
+        layers = [
+            {"type": "grid", "limits": [[-10, 10], [-10, 10]], "npoints": [11, 11]}
+        ]
+        exclusions = [{"type": "circle", "radius": 7.0, "exclude": "outside"}]
+        mb = self.build(layers, exclusions, motionlist_ordering="shortest")
+        points = self.motion_list(mb)
+
+        self.assertTrue(np.all(np.linalg.norm(points, axis=1) <= 7.0))
+
+        # the order is that of the included points only
+        grid = mb.flatten_points(mb.layers[0].points.data.copy())
+        included = grid[mb.generate_excluded_mask(grid), ...]
+        self.assertEqual(points.shape, included.shape)
+        expected = mb._order_motion_list(included)
+        self.assertEqual(points.tolist(), expected.tolist())
+
+    def test_set_ordering_cost(self):
+        layers = [{"type": "grid", "limits": [[-10, 10], [-10, 10]], "npoints": [5, 5]}]
+        mb = self.build(layers, motionlist_ordering="shortest")
+
+        # a travel cost that strongly penalizes moves along y
+        mb.set_ordering_cost(transform=lambda coords: coords * [1.0, 100.0])
+        self.assertIn("motion_list", mb._ds)
+
+        points = self.motion_list(mb)
+        y_moves = np.count_nonzero(np.diff(points[:, 1]))
+        self.assertEqual(y_moves, 4)
+
+    def test_config_round_trip(self):
+        layers = [{"type": "grid", "limits": [[-10, 10], [-5, 5]], "npoints": [5, 3]}]
+        mb = self.build(
+            layers,
+            layer_to_motionlist_scheme="merge",
+            motionlist_ordering="serpentine",
+        )
+        config = mb.config
+        self.assertEqual(config["motionlist_ordering"], "serpentine")
+
+        # re-build the motion builder the way a motion group does
+        inputs = {
+            "space": list(config["space"].values()),
+            "layers": [layer.copy() for layer in config["layer"].values()],
+            "layer_to_motionlist_scheme": config["layer_to_motionlist_scheme"],
+            "motionlist_ordering": config["motionlist_ordering"],
+        }
+        rebuilt = MotionBuilder(**inputs)
+
+        self.assertEqual(rebuilt.motionlist_ordering, "serpentine")
+        self.assertEqual(rebuilt.config, config)
+        self.assertEqual(
+            self.motion_list(rebuilt).tolist(), self.motion_list(mb).tolist()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()